@@ -0,0 +1,162 @@
+# backend/__init__.py
+import os
+from importlib import import_module
+
+from flask import Flask
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def create_app(config=None, blueprints=None):
+    """Build the Flask app.
+
+    ``config`` overrides the defaults below. ``blueprints`` limits which
+    blueprints (names from ``backend.blueprints.BLUEPRINTS``) get registered;
+    by default all of them are. The schema is not created or upgraded here,
+    run ``flask --app app init-db`` for that.
+    """
+    from dotenv import load_dotenv
+
+    from backend.blueprints import BLUEPRINTS
+    from backend.cli import register_commands
+    from backend.extensions import db, login_manager
+
+    load_dotenv()
+    app = Flask(__name__, root_path=PROJECT_ROOT)
+    app.config.from_mapping(
+        SECRET_KEY=os.environ.get("FLASK_SECRET_KEY", "dev-secret-not-for-prod"),
+        SQLALCHEMY_DATABASE_URI="sqlite:///Sam.db",
+        SQLALCHEMY_TRACK_MODIFICATIONS=False,
+        UPLOAD_FOLDER="static/uploads",
+        OPENROUTER_API_KEY=os.getenv("OPENROUTER_API_KEY"),
+        MINIMAX_API_KEY=os.environ.get("MINIMAX_API_KEY", "your-minimax-api-key"),
+        MINIMAX_VOICE_ID=os.environ.get("MINIMAX_VOICE_ID", "your-clone-voice-id"),
+        MINIMAX_GROUP_ID=os.environ.get("MINIMAX_GROUP_ID"),
+        # "minimax", "stub" (silent WAVs, no network) or "none"
+        TTS_BACKEND=os.environ.get("TTS_BACKEND", "minimax" if os.environ.get("MINIMAX_API_KEY") else "none"),
+        # Synthesized clips, named by hash of (voice, text); defaults to instance/tts_cache
+        TTS_CACHE_DIR=os.environ.get("TTS_CACHE_DIR"),
+        TTS_MAX_CHARS=500,
+        # /ask grounding (backend.docindex): documents for `flask build-doc-index`,
+        # the index file (default instance/doc_index.bin), prompt budget in
+        # tokens, chunks considered, the BM25 score and share of question terms
+        # a chunk needs, and when a question is answered from the docs alone
+        # (top score, and how many times it must beat the runner-up)
+        DOCS_DIR=os.path.join(PROJECT_ROOT, "ms-documents"),
+        DOC_INDEX_FILE=os.environ.get("DOC_INDEX_FILE"),
+        ASK_CONTEXT_TOKENS=600,
+        ASK_CONTEXT_CHUNKS=3,
+        ASK_CONTEXT_MIN_SCORE=1.0,
+        ASK_CONTEXT_MIN_COVERAGE=0.5,
+        ASK_LOCAL_ANSWERS=True,
+        ASK_LOCAL_MIN_SCORE=5.0,
+        ASK_LOCAL_MARGIN=1.5,
+        # Background jobs (backend.jobs): modules whose @job functions workers
+        # import, lease length in seconds, jobs claimed per batch, idle poll
+        # interval, and the retry backoff base/cap in seconds
+        JOB_MODULES=("backend.tts",),
+        JOB_VISIBILITY_TIMEOUT=60,
+        JOB_BATCH_SIZE=50,
+        JOB_POLL_INTERVAL=0.5,
+        JOB_BACKOFF_BASE=2,
+        JOB_BACKOFF_MAX=3600,
+        # Modules the gunicorn master imports before forking (backend.prefork)
+        # that request handlers would otherwise import lazily in every worker
+        PRELOAD_MODULES=(
+            "requests",
+            "orjson",
+            "backend.docindex",
+            "backend.game_sessions",
+            "backend.progress_engine",
+            "backend.quest_engine",
+            "backend.quiz",
+            "backend.recurrence",
+            "backend.tts",
+        ),
+        # Encoder for list endpoints (backend.fastjson): "orjson", "json", or
+        # None for orjson when installed
+        JSON_ENCODER=os.environ.get("JSON_ENCODER"),
+        # Token buckets per route (backend.ratelimit): (burst, seconds to refill)
+        RATE_LIMITS={
+            "ask": {"user": (5, 60), "ip": (20, 60)},
+            "tts": {"user": (20, 60), "ip": (60, 60)},
+            "sync": {"user": (30, 60), "ip": (120, 60)},
+            "game": {"user": (30, 60), "ip": (120, 60)},
+        },
+        RATE_LIMIT_ENABLED=True,
+        # Reverse proxies in front of the app that append to X-Forwarded-For
+        # (and set X-Forwarded-Proto). With 0, request.remote_addr is the
+        # peer address, which behind a proxy puts every client in the same
+        # per-IP bucket; set it to the number of proxies you run (1 behind a
+        # single nginx or a PaaS router), never more, or clients can spoof it
+        TRUSTED_PROXIES=int(os.environ.get("TRUSTED_PROXIES", 0)),
+        # "mmap" shares buckets across workers via RATE_LIMIT_FILE
+        # (default instance/ratelimit.bin); "memory" keeps them per process
+        RATE_LIMIT_STORAGE=os.environ.get("RATE_LIMIT_STORAGE", "mmap"),
+        RATE_LIMIT_FILE=os.environ.get("RATE_LIMIT_FILE"),
+        # Mini-game sessions (backend.game_sessions): seconds an untimed game
+        # may run, extra seconds after a timed one ends, how far (ms) event
+        # times may run ahead of the server's clock, and how many unscored
+        # sessions a user may hold (starting another closes the oldest)
+        GAME_SESSION_MAX_AGE=3600,
+        GAME_SESSION_GRACE=30,
+        GAME_CLOCK_SLACK_MS=2000,
+        GAME_MAX_OPEN_SESSIONS=5,
+        # Quiz (backend.quiz): questions per set, seconds between bank version
+        # checks, and users whose review heaps each worker keeps
+        QUIZ_SET_SIZE=14,
+        QUIZ_BANK_TTL=5,
+        QUIZ_QUEUE_CACHE=1024,
+        # Recurring tasks (backend.recurrence): longest /task_occurrences window
+        # in days, and seconds an alarm stays due before a missed occurrence
+        # of a recurring task is skipped
+        TASK_WINDOW_MAX_DAYS=92,
+        TASK_ALARM_GRACE=300,
+        # Per-user tables split across SQLite files, {"s0": "sqlite:///shard0.db", ...};
+        # empty keeps everything in the main database (backend.sharding)
+        SHARDS={},
+        SHARD_VNODES=64,
+        # module:<module>, file:<path.json|.yaml> or table:<table>
+        QUEST_POOL_SOURCE=os.environ.get("QUEST_POOL_SOURCE", "module:backend.quest_engine.default_pools"),
+        # "stored": quest rows regenerated per period; "derived": computed on read
+        QUEST_MODE=os.environ.get("QUEST_MODE", "stored"),
+        # Seconds between checks of the quest catalog version
+        QUEST_CATALOG_TTL=5,
+        # Most operations accepted in one /sync request
+        SYNC_MAX_OPERATIONS=200,
+        # Retention job (RETENTION_POLICIES overrides retention.DEFAULT_POLICIES):
+        # rows per batch, and the free-page ratio that triggers VACUUM
+        RETENTION_BATCH_SIZE=500,
+        RETENTION_VACUUM_RATIO=0.25,
+        # Werkzeug hash method for new passwords, e.g. "scrypt:16384:8:1" or
+        # "pbkdf2:sha256:600000"; older hashes are upgraded on login
+        PASSWORD_METHOD=os.environ.get("PASSWORD_METHOD", "scrypt"),
+        # Hashing threads per process, extra callers allowed to queue, and
+        # seconds a caller waits for a slot before getting a 503
+        PASSWORD_POOL_WORKERS=int(os.environ.get("PASSWORD_POOL_WORKERS", 2)),
+        PASSWORD_POOL_QUEUE=8,
+        PASSWORD_POOL_TIMEOUT=2.0,
+    )
+    if config:
+        app.config.update(config)
+    # Shards are extra binds; backend.sharding decides which one a query uses.
+    if app.config["SHARDS"]:
+        app.config["SQLALCHEMY_BINDS"] = dict(app.config.get("SQLALCHEMY_BINDS") or {}, **app.config["SHARDS"])
+
+    if app.config["TRUSTED_PROXIES"]:
+        from werkzeug.middleware.proxy_fix import ProxyFix
+
+        proxies = app.config["TRUSTED_PROXIES"]
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=proxies, x_proto=proxies)
+
+    db.init_app(app)
+    login_manager.init_app(app)
+    # Registers the user_loader on login_manager.
+    import backend.models  # noqa: F401
+
+    for name in blueprints or BLUEPRINTS:
+        module_name, attr = BLUEPRINTS[name].split(":")
+        app.register_blueprint(getattr(import_module(module_name), attr))
+
+    register_commands(app)
+    return app
@@ -0,0 +1,155 @@
+# backend/actions.py
+"""User actions that award XP, shared by the single-action routes and /sync.
+
+None of these commit. The caller decides the transaction boundary: the
+classic routes commit right after one action, /sync commits once for a
+whole batch. Failures raise ActionError so a batch can record them and
+keep going.
+"""
+from datetime import datetime
+
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from backend.extensions import db
+from backend.models import StudyLog, Task, TaskOccurrence
+from backend.progress_engine import STUDY, TASK, emit
+from backend.versioning import STUDY_LOGS, TASKS, bump
+
+
+class ActionError(Exception):
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.message = message
+        self.status = status
+
+
+def parse_occurrence(value):
+    if value in (None, ""):
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise ActionError("Invalid occurs_at")
+
+
+def complete_task(user, task_id, occurs_at=None):
+    """Complete a task or, for a recurring one, one occurrence of it.
+
+    ``occurs_at`` picks the occurrence (as scheduled, ISO 8601) and defaults
+    to the task's next open one. Each occurrence awards XP once.
+    """
+    task = db.session.get(Task, task_id)
+    if task is None:
+        raise ActionError("Task not found", 404)
+    if task.user_id != user.id:
+        raise ActionError("Forbidden", 403)
+    if not task.rrule:
+        if not task.completed:
+            task.completed = True
+            task.next_occurrence = None
+            _award_task(user)
+        return {"points": user.points}
+
+    from backend import recurrence
+
+    occurs_at = parse_occurrence(occurs_at) or task.next_occurrence
+    if occurs_at is None:
+        return {"points": user.points, "next_occurrence": None}
+    if not recurrence.parse(task.rrule).includes(task.alarm_time, occurs_at):
+        raise ActionError("Not an occurrence of this task")
+    stmt = sqlite_insert(TaskOccurrence.__table__).values(
+        user_id=user.id, task_id=task.id, occurs_at=occurs_at, completed_at=datetime.utcnow()
+    )
+    done = db.session.execute(stmt.on_conflict_do_update(
+        index_elements=["task_id", "occurs_at"],
+        set_={"completed_at": stmt.excluded.completed_at},
+        where=TaskOccurrence.__table__.c.completed_at.is_(None),
+    ))
+    if done.rowcount:
+        if occurs_at == task.next_occurrence:
+            recurrence.advance(task, after=occurs_at)
+        _award_task(user)
+    upcoming = task.next_occurrence
+    return {"points": user.points, "next_occurrence": upcoming.isoformat() if upcoming else None}
+
+
+def _award_task(user):
+    user.points = (user.points or 0) + 10
+    emit(user, TASK, xp=10)
+    bump(user.id, TASKS)
+
+
+def add_study_log(user, subject="Study", duration=0, notes="", started_at="", ended_at=""):
+    try:
+        duration = int(duration or 0)
+    except (TypeError, ValueError):
+        duration = 0
+    log = StudyLog(user_id=user.id, subject=subject or "Study", duration=duration, notes=notes or "",
+                   started_at=started_at or "", ended_at=ended_at or "")
+    db.session.add(log)
+
+    earned_points = max(1, duration // 5) if duration > 0 else 1
+    user.points = (user.points or 0) + earned_points
+    emit(user, STUDY, xp=earned_points, value=duration)
+    bump(user.id, STUDY_LOGS)
+    return {"points": user.points, "earned": earned_points}
+
+
+def complete_quest(user, quest_id):
+    from backend.quest_engine import complete_user_quest
+
+    if quest_id in (None, ""):
+        raise ActionError("Quest ID missing")
+    success, result = complete_user_quest(user.id, quest_id, commit=False)
+    if not success:
+        raise ActionError(result)
+    return result
+
+
+def finish_game(user, token, events=None, result=None):
+    from backend import game_sessions
+
+    # A quiz's result is its graded answers; a client-reported count is never trusted.
+    if game_sessions.load(user, token)["g"] == "quiz":
+        raise ActionError("Quiz sessions are scored by /quiz/answers")
+    scored = game_sessions.finish(user, token, events=events, result=result)
+    if scored is None:
+        raise ActionError("Game already scored", 409)
+    return dict(scored, points=user.points)
+
+
+def answer_quiz(user, token, answers):
+    """Grade a quiz set's answers and score its game session.
+
+    ``token`` comes from /quiz/set and lists the questions served; answers
+    to anything else are ignored. ``answers`` is ``[[question_id, option], ...]``.
+    """
+    from backend import game_sessions
+    from backend.quiz import record_answers
+
+    state = game_sessions.load(user, token)
+    if state["g"] != "quiz":
+        raise ActionError("Not a quiz session")
+    if not isinstance(answers, list):
+        raise ActionError("answers must be a list")
+    served = set(state.get("x", {}).get("q", ()))
+    pairs = [
+        (a[0], a[1]) for a in answers
+        if isinstance(a, list) and len(a) == 2 and a[0] in served and isinstance(a[1], int)
+    ]
+    results = record_answers(user.id, pairs)
+    correct = sum(r["correct"] for r in results)
+    scored = game_sessions.finish(user, token, result={"correct": correct})
+    if scored is None:
+        raise ActionError("Quiz already scored", 409)
+    return {"results": results, "correct": correct, "total": len(served), "xp": scored["xp"], "points": user.points}
+
+
+# Operation name -> handler, as accepted by /sync. Game and quiz results are
+# not here: they go through /game/finish and /quiz/answers, under the "game"
+# rate limit.
+ACTIONS = {
+    "complete_task": complete_task,
+    "add_study_log": add_study_log,
+    "complete_quest": complete_quest,
+}
@@ -0,0 +1,15 @@
+# backend/blueprints/__init__.py
+# Blueprint name -> "module:attribute". create_app() imports only the ones it
+# registers, so a single blueprint can be loaded (and benchmarked) on its own.
+BLUEPRINTS = {
+    "main": "backend.blueprints.main:bp",
+    "auth": "backend.blueprints.auth:bp",
+    "tasks": "backend.blueprints.tasks:bp",
+    "academics": "backend.blueprints.academics:bp",
+    "quests": "backend.blueprints.quests:bp",
+    "games": "backend.blueprints.games:bp",
+    "assistant": "backend.blueprints.assistant:bp",
+    "data": "backend.blueprints.data:bp",
+    "sync": "backend.blueprints.sync:bp",
+    "search": "backend.blueprints.search:bp",
+}
@@ -0,0 +1,56 @@
+# backend/blueprints/academics.py
+from flask import Blueprint, jsonify, render_template, request
+from flask_login import current_user, login_required
+from sqlalchemy import select
+
+from backend import actions, fastjson
+from backend.extensions import db
+from backend.models import StudyLog
+from backend.versioning import STUDY_LOGS, bump, conditional
+
+bp = Blueprint("academics", __name__)
+
+
+# ----- ACADEMICS / STUDY LOGS -----
+@bp.route("/academics")
+@login_required
+def academics():
+    return render_template("dashboard/academics.html", user=current_user)
+
+
+@bp.route("/add_study_log", methods=["POST"])
+@login_required
+def add_study_log():
+    result = actions.add_study_log(
+        current_user,
+        subject=request.form.get("subject", "Study"),
+        duration=request.form.get("duration", 0),
+        notes=request.form.get("notes", ""),
+        started_at=request.form.get("started_at", ""),
+        ended_at=request.form.get("ended_at", ""),
+    )
+    db.session.commit()
+    return jsonify(success=True, points=result["points"], earned=result["earned"])
+
+
+@bp.route("/get_study_logs")
+@login_required
+@conditional(STUDY_LOGS)
+def get_study_logs():
+    return fastjson.rows_response(db.session.execute(
+        select(StudyLog.id, StudyLog.subject, StudyLog.duration, StudyLog.notes, StudyLog.created_at)
+        .where(StudyLog.user_id == current_user.id)
+        .order_by(StudyLog.created_at.desc())
+    ))
+
+
+@bp.route("/delete_study_log/<int:log_id>", methods=["DELETE"])
+@login_required
+def delete_study_log(log_id):
+    log = StudyLog.query.get_or_404(log_id)
+    if log.user_id != current_user.id:
+        return jsonify({"error": "Forbidden"}), 403
+    db.session.delete(log)
+    bump(current_user.id, STUDY_LOGS)
+    db.session.commit()
+    return jsonify({"message": "Study log deleted successfully!"})
@@ -0,0 +1,171 @@
+# backend/blueprints/assistant.py
+from datetime import datetime
+
+from flask import Blueprint, abort, current_app, jsonify, redirect, request, send_file, url_for
+from flask_login import current_user, login_required
+
+from backend import tts
+from backend.extensions import db
+from backend.ratelimit import rate_limit
+
+bp = Blueprint("assistant", __name__)
+
+
+# (keywords, reply) checked in order; a reply is a fixed string or a
+# function of the user. Fixed strings are pre-synthesized by `flask tts-warm`.
+VOICE_REPLIES = [
+    # ========== Greetings ==========
+    (["hello", "hi", "hey", "what's up"], lambda user: f"Hi {user.username}, how can I assist you today?"),
+    (["how are you"], "I'm doing great! Ready to help you with your productivity and growth."),
+    (["good morning"], "Good morning! Let’s start your day strong."),
+    (["good night"], "Good night! Rest well and recharge for tomorrow."),
+
+    # ========== Navigation ==========
+    (["tasks"], "Opening your tasks dashboard."),
+    (["academics", "study"], "Opening your academics dashboard."),
+    (["quests"], "Opening your quests dashboard."),
+    (["profile", "my account"], "Opening your profile page."),
+    (["developers", "team"], "Opening the developers page."),
+
+    # ========== Task Management ==========
+    (["add task"], "Sure! Please enter the task title in your dashboard to add it."),
+    (["complete task"], "Marking your selected task as complete."),
+    (["delete task", "remove task"], "Select a task in the dashboard to delete it."),
+    (["list tasks", "show tasks"], "Here are your current tasks on the dashboard."),
+    (["next task"], "Your next pending task is highlighted on the dashboard."),
+
+    # ========== Quests ==========
+    (["add quest"], "To add a new quest, please go to the quests dashboard."),
+    (["complete quest"], "Please select a quest to mark it as completed."),
+    (["list quests", "show quests"], "Here are your active quests."),
+    (["daily quest"], "Today’s daily quest is waiting for you in the dashboard."),
+
+    # ========== Academics ==========
+    (["next exam"], "Fetching your next exam details from the academics dashboard."),
+    (["study session"], "Starting a Pomodoro study session timer."),
+    (["revision", "revise"], "Reminder: It’s time for a quick revision session."),
+    (["add subject"], "Please enter the new subject name in your academics dashboard."),
+
+    # ========== Motivation & Feedback ==========
+    (["motivate me", "i'm tired"], "Stay strong! Remember why you started, success is on its way."),
+    (["give me advice"], "Focus on one thing at a time. Consistency beats intensity."),
+    (["congratulations", "i finished"], "Great job! You’re one step closer to your goals."),
+
+    # ========== Utility ==========
+    (["time"], lambda user: f"The current time is {datetime.now().strftime('%I:%M %p')}."),
+    (["date", "today"], lambda user: f"Today is {datetime.now().strftime('%A, %B %d, %Y')}."),
+    (["weather"], "Fetching the current weather for your location..."),
+    (["help", "commands"], "You can ask me to manage tasks, academics, quests, or motivate you."),
+
+    # ========== Terminate ==========
+    (["terminate", "close assistant", "stop listening"], "Voice assistant closed. Say 'Arise' to wake me up again."),
+]
+DEFAULT_REPLY = "Sorry, I did not understand that command."
+
+
+def canned_replies():
+    """Every fixed reply /voice_command can give."""
+    return [reply for _, reply in VOICE_REPLIES if isinstance(reply, str)] + [DEFAULT_REPLY]
+
+
+def _audio_url(text):
+    """URL of the cached clip for ``text``, or None until a worker makes it."""
+    if not tts.enabled():
+        return None
+    cached = tts.audio_key(text)
+    db.session.commit()
+    return cached and url_for("assistant.tts_audio", key=cached[0], ext=cached[1].ext)
+
+
+@bp.route("/voice_command", methods=["POST"])
+@login_required
+def voice_command():
+    data = request.get_json() or {}
+    cmd = (data.get("command") or "").lower().strip()
+    response_text = DEFAULT_REPLY
+
+    try:
+        for keywords, reply in VOICE_REPLIES:
+            if any(word in cmd for word in keywords):
+                response_text = reply(current_user) if callable(reply) else reply
+                break
+    except Exception as e:
+        response_text = f"Error processing command: {str(e)}"
+
+    return jsonify({"success": True, "message": response_text, "audio_url": _audio_url(response_text)})
+
+
+# ----- TEXT TO SPEECH -----
+@bp.route("/tts")
+@rate_limit("tts")
+@login_required
+def tts_lookup():
+    """Redirect ``?text=`` to its content-addressed clip, synthesizing it once."""
+    text = request.args.get("text", "")
+    if len(text) > current_app.config.get("TTS_MAX_CHARS", 500):
+        return jsonify({"success": False, "error": "Text too long"}), 400
+    try:
+        key, backend = tts.synthesize_cached(text)
+    except tts.TTSError as e:
+        return jsonify({"success": False, "error": str(e)}), 503
+    return redirect(url_for("assistant.tts_audio", key=key, ext=backend.ext))
+
+
+@bp.route("/tts/<key>.<ext>")
+@login_required
+def tts_audio(key, ext):
+    """Serve a cached clip. Range requests are answered with 206 by send_file."""
+    backend = next((b for b in tts.BACKENDS.values() if b.ext == ext), None)
+    path = backend and tts.cached_path(key, ext)
+    if not path:
+        abort(404)
+    response = send_file(path, mimetype=backend.mimetype, conditional=True, etag=key, max_age=31536000)
+    response.cache_control.public = False
+    response.cache_control.private = True
+    response.cache_control.immutable = True
+    response.headers["Accept-Ranges"] = "bytes"
+    return response
+
+
+@bp.route("/ask", methods=["POST"])
+@rate_limit("ask")
+def ask_ai():
+    # Imported here so workers that never proxy a chat request skip loading it.
+    import requests
+
+    from backend import docindex
+
+    user_message = (request.get_json(silent=True) or {}).get("message")
+    if not user_message:
+        return jsonify({"success": False, "error": "Message missing"}), 400
+
+    # Questions about the app itself: ground them in ms-documents, or answer
+    # straight from there when one passage clearly covers the question.
+    hits = docindex.context_for(user_message)
+    sources = [{"source": hit.source, "score": round(hit.score, 2)} for hit in hits]
+    local = docindex.local_answer(user_message, hits)
+    if local:
+        return jsonify({
+            "choices": [{"message": {"role": "assistant", "content": local}}],
+            "local": True,
+            "sources": sources[:1],
+        })
+
+    messages = [{"role": "user", "content": user_message}]
+    if hits:
+        messages.insert(0, {"role": "system", "content": docindex.system_prompt(hits)})
+
+    headers = {
+        "Authorization": f"Bearer {current_app.config['OPENROUTER_API_KEY']}",
+        "Content-Type": "application/json"
+    }
+
+    data = {
+        "model": "deepseek/deepseek-r1-0528:free",
+        "messages": messages
+    }
+
+    response = requests.post("https://openrouter.ai/api/v1/chat/completions",
+                             headers=headers, json=data)
+
+    return jsonify(dict(response.json(), sources=sources))
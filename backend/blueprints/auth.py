@@ -0,0 +1,147 @@
+# backend/blueprints/auth.py
+import os
+
+from flask import Blueprint, current_app, flash, redirect, render_template, request, url_for
+from flask_login import current_user, login_required, login_user, logout_user
+from werkzeug.utils import secure_filename
+
+from backend import passwords, sharding
+from backend.extensions import db
+from backend.progress import calculate_stats, get_level, get_rank
+from backend.versioning import QUESTS, bump
+
+bp = Blueprint("auth", __name__)
+
+# Upload settings
+ALLOWED_EXTENSIONS = {"png", "jpg", "jpeg", "gif", "webp"}
+
+
+def allowed_file(filename):
+    return "." in filename and filename.rsplit(".", 1)[1].lower() in ALLOWED_EXTENSIONS
+
+
+def _save_upload(file):
+    upload_folder = current_app.config["UPLOAD_FOLDER"]
+    os.makedirs(upload_folder, exist_ok=True)
+    filename = secure_filename(file.filename)
+    file.save(os.path.join(upload_folder, filename))
+    return filename
+
+
+def _busy(template):
+    flash("The server is busy, please try again in a moment.", "danger")
+    return render_template(template), 503, {"Retry-After": "2"}
+
+
+# ----- AUTH -----
+@bp.route("/register", methods=["GET", "POST"])
+def register():
+    if request.method == "POST":
+        username = request.form.get("username", "").strip()
+        password_raw = request.form.get("password", "")
+        quote = request.form.get("quote", "").strip() or "Stay focused. Keep leveling up."
+
+        if not username or not password_raw:
+            flash("Username and password required.", "danger")
+            return render_template("register.html")
+
+        if sharding.find_user(username):
+            flash("Username already exists. Please choose another one.", "danger")
+            return render_template("register.html")
+
+        try:
+            password = passwords.hash_password(password_raw)
+        except passwords.PasswordBusy:
+            return _busy("register.html")
+
+        filename = None
+        file = request.files.get("profile_pic")
+        if file and file.filename:
+            if not allowed_file(file.filename):
+                flash("Invalid image type.", "danger")
+                return render_template("register.html")
+            filename = _save_upload(file)
+
+        sharding.new_user(username=username, password=password, profile_pic=filename, quote=quote)
+        db.session.commit()
+        flash("Registration successful! Please login.", "success")
+        return redirect(url_for("auth.login"))
+
+    return render_template("register.html")
+
+
+@bp.route("/login", methods=["GET", "POST"])
+def login():
+    if request.method == "POST":
+        username = request.form.get("username", "").strip()
+        password = request.form.get("password", "")
+        user = sharding.find_user(username)
+        try:
+            ok, new_hash = passwords.verify(user.password, password) if user else (False, None)
+        except passwords.PasswordBusy:
+            return _busy("login.html")
+        if ok:
+            if new_hash:
+                # Hashed with older PASSWORD_METHOD parameters; upgrade it now.
+                user.password = new_hash
+                db.session.commit()
+            login_user(user)
+            flash("Login successful!", "success")
+            return redirect(url_for("auth.profile"))
+        else:
+            flash("Invalid username or password", "danger")
+    return render_template("login.html")
+
+
+@bp.route("/logout", methods=["POST"])
+@login_required
+def logout():
+    logout_user()
+    flash("Logged out successfully", "success")
+    return redirect(url_for("auth.login"))
+
+
+# ----- PROFILE -----
+@bp.route("/profile")
+@login_required
+def profile():
+    user_rank = get_rank(current_user.points or 0)
+    user_level = get_level(current_user.points or 0)
+    stats = calculate_stats(current_user)
+    return render_template("dashboard/profile.html", user=current_user, rank=user_rank, level=user_level, stats=stats)
+
+
+@bp.route("/edit-profile", methods=["GET", "POST"])
+@login_required
+def edit_profile():
+    if request.method == "POST":
+        new_username = request.form.get("username", "").strip()
+        if new_username and new_username != current_user.username:
+            if not sharding.rename_user(current_user, new_username):
+                flash("Username already taken.", "danger")
+                return redirect(url_for("auth.edit_profile"))
+
+        new_quote = request.form.get("quote")
+        if new_quote:
+            current_user.quote = new_quote
+
+        file = request.files.get("profile_pic")
+        if file and file.filename:
+            if not allowed_file(file.filename):
+                flash("Invalid image type.", "danger")
+                return redirect(url_for("auth.edit_profile"))
+            current_user.profile_pic = _save_upload(file)
+
+        body = (current_user.height_cm, current_user.weight_kg)
+        current_user.age = request.form.get("age", type=int)
+        current_user.height_cm = request.form.get("height_cm", type=float)
+        current_user.weight_kg = request.form.get("weight_kg", type=float)
+        current_user.fitness_level = request.form.get("fitness_level")
+        if (current_user.height_cm, current_user.weight_kg) != body:
+            # BMI picks the derived fitness quest; /get_user_quests must not 304.
+            bump(current_user.id, QUESTS)
+
+        db.session.commit()
+        flash("Profile updated successfully!", "success")
+        return redirect(url_for("auth.profile"))
+    return render_template("dashboard/edit_profile.html", user=current_user)
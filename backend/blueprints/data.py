@@ -0,0 +1,39 @@
+# backend/blueprints/data.py
+from flask import Blueprint, Response, jsonify, request, stream_with_context
+from flask_login import current_user, login_required
+
+from backend.datatransfer import USER_DATA_TABLES, export_csv, export_ndjson
+
+bp = Blueprint("data", __name__)
+
+
+# ----- EXPORT -----
+# Imports restore rows as they are (completed flags included), so they run
+# through `flask import-data` only.
+@bp.route("/export")
+@login_required
+def export_data():
+    """Stream the current user's tasks (with their edited occurrences), quests and study logs.
+
+    ``?format=ndjson`` (default) returns every table in one stream;
+    ``?format=csv&table=task`` returns a single table.
+    """
+    fmt = request.args.get("format", "ndjson")
+    user_id = current_user.id
+    if fmt == "csv":
+        table = request.args.get("table", "task")
+        if table not in USER_DATA_TABLES:
+            return jsonify({"success": False, "error": "Unknown table"}), 400
+        body = export_csv(table, user_id)
+        mimetype, filename = "text/csv", f"{table}.csv"
+    elif fmt == "ndjson":
+        body = export_ndjson(USER_DATA_TABLES, user_id)
+        mimetype, filename = "application/x-ndjson", "sam-export.ndjson"
+    else:
+        return jsonify({"success": False, "error": "Unknown format"}), 400
+    return Response(
+        stream_with_context(body),
+        mimetype=mimetype,
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+    )
+
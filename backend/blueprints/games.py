@@ -0,0 +1,116 @@
+# backend/blueprints/games.py
+from flask import Blueprint, current_app, jsonify, render_template, request
+from flask_login import current_user, login_required
+
+from backend import actions, fastjson, game_sessions, quiz
+from backend.extensions import db
+from backend.ratelimit import rate_limit
+
+bp = Blueprint("games", __name__)
+
+
+@bp.route("/dashboard/spinwheel")
+@login_required
+def spinwheel_page():
+    return render_template("dashboard/spinwheel.html")
+
+@bp.route('/shufflecard')
+@login_required
+def shufflecard():
+    return render_template('dashboard/shufflecard.html')
+
+@bp.route("/dashboard/quiz")
+@login_required
+def quiz_page():
+    return render_template("dashboard/quiz.html")
+
+@bp.route("/logic")
+@login_required
+def logic():
+    return render_template("dashboard/logic.html")
+
+@bp.route('/dashboard/memory')
+def memory():
+    return render_template('dashboard/memory.html')
+
+@bp.route('/worldbuild')
+def worldbuild():
+    return render_template('dashboard/worldbuild.html') 
+
+@bp.route('/dice')
+def dice():
+    return render_template('dashboard/dice.html')  # or just 'dice.html' if in templates/
+ 
+@bp.route("/coin")
+@login_required
+def coin_page():
+    return render_template("dashboard/coin.html")
+
+# ----- GAME SESSIONS -----
+@bp.route("/game/start", methods=["POST"])
+@rate_limit("game")
+@login_required
+def game_start():
+    game = (request.get_json(silent=True) or {}).get("game")
+    try:
+        token = game_sessions.start(current_user, game)
+    except actions.ActionError as e:
+        return jsonify({"success": False, "error": e.message}), e.status
+    db.session.commit()
+    return jsonify({"success": True, "token": token, "game": game, "rules": game_sessions.GAMES[game].describe()})
+
+
+@bp.route("/game/events", methods=["POST"])
+@login_required
+def game_events():
+    """Check a mid-game batch of events; nothing is stored, the new token carries it."""
+    data = request.get_json(silent=True) or {}
+    try:
+        token, xp = game_sessions.save_events(current_user, data.get("token"), data.get("events", []))
+    except actions.ActionError as e:
+        return jsonify({"success": False, "error": e.message}), e.status
+    return jsonify({"success": True, "token": token, "xp": xp})
+
+
+@bp.route("/game/finish", methods=["POST"])
+@rate_limit("game")
+@login_required
+def game_finish():
+    """Score a session (any last events and/or a final result) in one commit."""
+    data = request.get_json(silent=True) or {}
+    try:
+        result = actions.finish_game(current_user, data.get("token"), data.get("events"), data.get("result"))
+    except actions.ActionError as e:
+        return jsonify({"success": False, "error": e.message}), e.status
+    db.session.commit()
+    return jsonify({"success": True, "game": result["game"], "xp": result["xp"], "points": result["points"]})
+
+
+# ----- QUIZ -----
+@bp.route("/quiz/set")
+@login_required
+def quiz_set():
+    """The user's next questions (due reviews first) and a quiz game token."""
+    limit = current_app.config.get("QUIZ_SET_SIZE", 14)
+    size = min(max(request.args.get("n", limit, type=int), 1), limit)
+    questions = quiz.next_set(current_user.id, size)
+    try:
+        token = game_sessions.start(current_user, "quiz", extra={"q": [q["id"] for q in questions]})
+    except actions.ActionError as e:
+        return jsonify({"success": False, "error": e.message}), e.status
+    db.session.commit()
+    return fastjson.response({"success": True, "token": token, "questions": questions})
+
+
+@bp.route("/quiz/answers", methods=["POST"])
+@rate_limit("game")
+@login_required
+def quiz_answers():
+    """Grade a whole set at once: review updates and XP in one commit."""
+    data = request.get_json(silent=True) or {}
+    try:
+        result = actions.answer_quiz(current_user, data.get("token"), data.get("answers"))
+    except actions.ActionError as e:
+        return jsonify({"success": False, "error": e.message}), e.status
+    db.session.commit()
+    return jsonify(dict(result, success=True))
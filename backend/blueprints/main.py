@@ -0,0 +1,196 @@
+# backend/blueprints/main.py
+from datetime import datetime
+
+from flask import Blueprint, jsonify, render_template, request
+from flask_login import current_user, login_required
+
+from backend import fastjson, progress_engine, sharding
+from backend.dashboard import FIELDS, snapshot
+from backend.extensions import db
+from backend.progress import leaderboard
+from backend.versioning import PROGRESS, conditional
+
+bp = Blueprint("main", __name__)
+
+
+@bp.route("/")
+def home():
+    return render_template("index.html")
+
+
+# ----- DEVELOPERS / VIEW OTHER PROFILES -----
+@bp.route("/developers")
+@login_required
+def developers():
+    developers = [
+        {
+            "id": 1,
+            "name": "S. Abdul Hameed",
+            "role": "Backend & Full Stack Designer",
+            "description": "Specializes in Python, Flask, and full-stack development.",
+            "photo": "hameed.jpg",  # put the actual image in /static/images/
+            "email": "animegroupmotivate@gmail.com",
+            "github": "sam-AI-1408",
+            "skills": ["Python", "Flask", "C", "HTML", "CSS", "JS", "Photoshop"],
+            "education": "Diploma in Computer Engineering (2024–2027), currently 2nd Year",
+            "achievements": ["Certificate in Photoshop"],
+            "motto": "To help others as much as I can."
+        },
+        {
+            "id": 2,
+            "name": "S. Imam Basha",
+            "role": "Coordinator",
+            "description": "Leads project vision & C programming expertise.",
+            "photo": "imam.jpg",
+            "email": None,
+            "github": None,
+            "skills": ["C"],
+            "education": "Diploma in Computer Engineering (2024–2027), currently 2nd Year",
+            "achievements": [],
+            "motto": "Every great system begins with a single line of code."
+        },
+        {
+            "id": 3,
+            "name": "Sagabala Goutham",
+            "role": "Frontend Developer",
+            "description": "Focuses on UI/UX design with HTML, CSS, and JS.",
+            "photo": "goutham.jpg",
+            "email": None,
+            "github": None,
+            "skills": ["HTML", "CSS", "JS"],
+            "education": "Diploma in Computer Engineering (2024–2027), currently 2nd Year",
+            "achievements": [],
+            "motto": "Design is intelligence made visible."
+        },
+        {
+            "id": 4,
+            "name": "M. Yashwanth Kumar",
+            "role": "Tester",
+            "description": "Ensures everything works smoothly & bug-free.",
+            "photo": "yashwanth.jpg",
+            "email": None,
+            "github": None,
+            "skills": ["Python", "SQL", "C"],
+            "education": "Diploma in Computer Engineering (2024–2027), currently 2nd Year",
+            "achievements": [],
+            "motto": "Quality is not an act, it is a habit."
+        },
+          {
+            "id": 5,
+            "name": "David boon",
+            "role": "Graphic designer",
+            "description": "Design the frontend and logos",
+            "photo": "yashwanth.jpg",
+            "email": None,
+            "github": None,
+            "skills": ["photoshop", "canva", "capcut"],
+            "education": "Diploma in Computer Engineering (2024–2027), currently 2nd Year",
+            "achievements": [],
+            "motto": "Quality is not an act, it is a habit."
+        },
+    ]
+
+    return render_template("dashboard/developers.html", developers=developers)
+
+@bp.route("/developer/<int:dev_id>")
+@login_required
+def view_developer(dev_id):
+    dev_user = sharding.get_user(dev_id)
+    if not dev_user:
+        return "Developer not found", 404
+    return render_template("dashboard/profile_dev.html", user=dev_user)
+
+
+@bp.route("/leaderboard")
+@login_required
+def leaderboard_json():
+    limit = min(max(request.args.get("limit", 10, type=int), 1), 100)
+    return jsonify(leaderboard(limit))
+
+
+@bp.route("/achievements")
+@login_required
+@conditional(PROGRESS, extra=lambda: datetime.utcnow().date())
+def achievements():
+    """Counters, streaks and milestones from the progress engine."""
+    state = progress_engine.load_state(current_user.id)
+    # load_state() replays the log when the rules changed; keep the result.
+    db.session.commit()
+    return fastjson.response(progress_engine.view(state))
+
+
+@bp.route("/xp_history")
+@login_required
+@conditional(PROGRESS, extra=lambda: (request.args.get("range"), datetime.utcnow().date()))
+def xp_history():
+    """XP per day, week or month for charts: ``?range=7d|30d|90d|1y|all`` (default 30d).
+
+    ``points_start`` is the user's points before the range, for cumulative lines.
+    """
+    name = request.args.get("range") or progress_engine.DEFAULT_RANGE
+    if name not in progress_engine.RANGES:
+        return jsonify({"success": False, "error": f"Unknown range: {name}"}), 400
+    data = progress_engine.xp_series(current_user.id, name)
+    data["points_start"] = (current_user.points or 0) - data["total"]
+    return fastjson.response(data)
+
+
+@bp.route("/dashboard_snapshot")
+@login_required
+def dashboard_snapshot():
+    """Stats, quests, pending tasks and recent study logs in one response.
+
+    ``?fields=user,stats`` limits the response (and the queries) to those keys.
+    """
+    fields = [f for f in request.args.get("fields", "").split(",") if f] or list(FIELDS)
+    unknown = sorted(set(fields) - set(FIELDS))
+    if unknown:
+        return jsonify({"success": False, "error": f"Unknown fields: {', '.join(unknown)}"}), 400
+    return fastjson.response(snapshot(
+        current_user, dict.fromkeys(fields),
+        task_limit=min(max(request.args.get("task_limit", 20, type=int), 1), 100),
+        log_limit=min(max(request.args.get("log_limit", 10, type=int), 1), 100),
+        quest_period=request.args.get("period"),
+    ))
+
+
+@bp.route("/budget")
+@login_required
+def budget_page():
+    return render_template("dashboard/budget.html")
+@bp.route("/market")
+@login_required
+def market_page():
+    return render_template("dashboard/market.html") 
+
+@bp.route('/save')
+@login_required
+def save_or_spend():
+
+    return render_template("dashboard/save.html", user=current_user)
+
+@bp.route('/reset_save_game')
+@login_required
+def reset_save_game():
+
+    current_user.bank = 0
+    current_user.budget = 0
+    return render_template("save.html", user=current_user)
+
+@bp.route('/money')
+@login_required
+def money_page():
+    
+    # You could also pass user-specific data if needed
+    return render_template("dashboard/money.html", user=current_user)
+
+@bp.route('/build')
+@login_required
+def build_page():
+    
+    return render_template("dashboard/build.html", user=current_user)
+
+@bp.route('/course/<course_name>')
+def course_page(course_name):
+    # You can render different templates or dynamically show content based on the course
+    return render_template('course_page.html', course=course_name)
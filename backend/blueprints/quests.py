@@ -0,0 +1,66 @@
+# backend/blueprints/quests.py
+from datetime import datetime
+
+from flask import Blueprint, current_app, jsonify, render_template, request
+from flask_login import current_user, login_required
+
+from backend import fastjson
+from backend.quest_engine import (
+    PERIODS,
+    complete_user_quest,
+    generate_quests_for_user,
+    get_catalog,
+    get_user_quests,
+    period_start,
+)
+from backend.versioning import QUESTS, conditional
+
+bp = Blueprint("quests", __name__)
+
+
+def _quests_etag_extra():
+    """What else a quest listing depends on besides the user's quest version."""
+    parts = [request.args.get("period", "all"), f"c{get_catalog().version}"]
+    if current_app.config.get("QUEST_MODE", "stored") == "derived":
+        # Derived sets roll over with the calendar, not with a write.
+        now = datetime.utcnow()
+        parts.extend(period_start(p, now).isoformat() for p in PERIODS)
+    return "-".join(parts)
+
+
+# ----- QUESTS -----
+@bp.route("/quests")
+@login_required
+def quests_page():
+    # Ensure quests exist/up-to-date
+    generate_quests_for_user(current_user.id)
+    all_quests = get_user_quests(current_user.id)
+    return render_template("dashboard/quests.html", quests=all_quests, user=current_user)
+
+
+@bp.route("/get_user_quests")
+@login_required
+@conditional(QUESTS, extra=_quests_etag_extra)
+def get_quests_api():
+    period = request.args.get("period")
+    return fastjson.response(get_user_quests(current_user.id, period))
+
+
+@bp.route("/complete_quest", methods=["POST"])
+@login_required
+def complete_quest():
+    data = request.json or {}
+    quest_id = data.get("quest_id")
+    if not quest_id:
+        return jsonify({"success": False, "error": "Quest ID missing"}), 400
+    success, result = complete_user_quest(current_user.id, quest_id)
+    if not success:
+        return jsonify({"success": False, "error": result}), 400
+    return jsonify({"success": True, "points": result["points"], "quest_id": result["quest_id"]})
+
+
+@bp.route("/regenerate_quests")
+@login_required
+def regenerate_quests_api():
+    generate_quests_for_user(current_user.id)
+    return jsonify({"success": True, "message": "Quests regenerated successfully"})
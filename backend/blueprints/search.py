@@ -0,0 +1,29 @@
+# backend/blueprints/search.py
+from flask import Blueprint, jsonify, request
+from flask_login import current_user, login_required
+
+from backend.search import INDEXES, search as run_search
+
+bp = Blueprint("search", __name__)
+
+
+# ----- SEARCH -----
+@bp.route("/search")
+@login_required
+def search():
+    """Ranked full-text search over the user's tasks and study notes.
+
+    ``?q=alg bio`` matches every word as a prefix; ``type`` is ``tasks``,
+    ``study_logs`` or ``all`` (default); ``page``/``per_page`` paginate.
+    """
+    query = request.args.get("q", "").strip()
+    kind = request.args.get("type", "all")
+    if kind != "all" and kind not in INDEXES:
+        return jsonify({"success": False, "error": "Unknown type"}), 400
+    page = max(request.args.get("page", 1, type=int), 1)
+    per_page = min(max(request.args.get("per_page", 20, type=int), 1), 100)
+    results, has_more = run_search(
+        current_user.id, query, kinds=None if kind == "all" else [kind], page=page, per_page=per_page
+    )
+    return jsonify({"success": True, "query": query, "page": page, "per_page": per_page,
+                    "has_more": has_more, "results": results})
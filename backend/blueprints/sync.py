@@ -0,0 +1,84 @@
+# backend/blueprints/sync.py
+import json
+
+from flask import Blueprint, current_app, jsonify, request
+from flask_login import current_user, login_required
+from sqlalchemy import select
+
+from backend import actions
+from backend.extensions import db
+from backend.models import SyncOperation
+from backend.progress import get_level, get_rank
+from backend.ratelimit import rate_limit
+
+bp = Blueprint("sync", __name__)
+
+KEY_MAX_LENGTH = SyncOperation.key.type.length
+
+
+# ----- OFFLINE SYNC -----
+@bp.route("/sync", methods=["POST"])
+@rate_limit("sync")
+@login_required
+def sync():
+    """Apply a queued batch of operations in one transaction.
+
+    Body: ``{"operations": [{"key": "<client id>", "type": "complete_task",
+    "args": {"task_id": 3}}, ...]}``. Types are the keys of
+    ``backend.actions.ACTIONS``. Each operation runs in its own savepoint,
+    so a failing one is reported without undoing the rest. Keys already seen
+    for this user return their stored result instead of running again.
+    """
+    data = request.get_json(silent=True) or {}
+    operations = data.get("operations")
+    if not isinstance(operations, list):
+        return jsonify({"success": False, "error": "operations must be a list"}), 400
+    if len(operations) > current_app.config["SYNC_MAX_OPERATIONS"]:
+        return jsonify({"success": False, "error": "Too many operations"}), 413
+
+    # The same string is looked up and stored, so a retry always finds it.
+    keys = [str(op["key"]) for op in operations if isinstance(op, dict) and op.get("key")]
+    if any(len(key) > KEY_MAX_LENGTH for key in keys):
+        return jsonify({"success": False, "error": f"Operation keys are limited to {KEY_MAX_LENGTH} characters"}), 400
+    seen = dict(db.session.execute(
+        select(SyncOperation.key, SyncOperation.result)
+        .where(SyncOperation.user_id == current_user.id, SyncOperation.key.in_(keys))
+    ).all()) if keys else {}
+
+    results = []
+    for op in operations:
+        if not isinstance(op, dict) or not op.get("key"):
+            results.append({"key": None, "success": False, "error": "Operation key missing"})
+            continue
+        key = str(op["key"])
+        if key in seen:
+            results.append(dict(json.loads(seen[key]), key=key, duplicate=True))
+            continue
+        handler = actions.ACTIONS.get(op.get("type"))
+        if handler is None:
+            result = {"success": False, "error": f"Unknown operation type: {op.get('type')}"}
+        else:
+            args = op.get("args") or {}
+            try:
+                with db.session.begin_nested():
+                    result = dict(handler(current_user, **args), success=True)
+            except actions.ActionError as e:
+                result = {"success": False, "error": e.message}
+            except TypeError:
+                result = {"success": False, "error": "Invalid arguments"}
+        encoded = json.dumps(result)
+        db.session.add(SyncOperation(user_id=current_user.id, key=key, type=str(op.get("type"))[:30], result=encoded))
+        seen[key] = encoded
+        results.append(dict(result, key=key))
+
+    points = current_user.points or 0
+    current_user.level = get_level(points)
+    current_user.rank = get_rank(points)
+    db.session.commit()
+    return jsonify({
+        "success": True,
+        "results": results,
+        "points": points,
+        "level": current_user.level,
+        "rank": current_user.rank,
+    })
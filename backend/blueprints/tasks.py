@@ -0,0 +1,200 @@
+# backend/blueprints/tasks.py
+from datetime import datetime, timedelta
+
+from flask import Blueprint, abort, current_app, flash, jsonify, redirect, render_template, request, url_for
+from flask_login import current_user, login_required
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from backend import actions, fastjson, recurrence
+from backend.extensions import db
+from backend.models import Task, TaskOccurrence
+from backend.versioning import TASKS, bump, conditional
+
+bp = Blueprint("tasks", __name__)
+
+
+# ----- TASKS -----
+@bp.route("/tasks")
+@login_required
+def tasks_page():
+    tasks = Task.query.filter_by(user_id=current_user.id).order_by(Task.created_at.desc()).all()
+    return render_template("dashboard/tasks.html", tasks=tasks, user=current_user)
+
+
+@bp.route('/add_task', methods=['POST'])
+@login_required
+def add_task():
+    title = request.form.get('title')
+    time_str = request.form.get('time')  # e.g., '2025-09-09T20:00'
+
+    # "daily", "weekdays", "weekly", "monthly", "custom" (rrule field) or empty
+    repeat = request.form.get('repeat') or ''
+    rule_text = request.form.get('rrule') if repeat == 'custom' else repeat
+
+    alarm_time = None
+    if time_str:
+        # Convert string from input to Python datetime
+        alarm_time = datetime.strptime(time_str, "%Y-%m-%dT%H:%M")
+
+    rrule = None
+    if rule_text:
+        try:
+            rrule = str(recurrence.parse(rule_text))
+        except recurrence.RecurrenceError as e:
+            flash(f"Invalid repeat rule: {e}", "danger")
+            return redirect(url_for('tasks.tasks_page'))
+        if alarm_time is None:
+            flash("A repeating task needs a start time.", "danger")
+            return redirect(url_for('tasks.tasks_page'))
+
+    task = Task(
+        user_id=current_user.id,
+        title=title,
+        completed=False,
+        created_at=datetime.utcnow(),
+        alarm_time=alarm_time,  # now this is a proper datetime object
+        rrule=rrule,
+    )
+    recurrence.advance(task)
+    db.session.add(task)
+    bump(current_user.id, TASKS)
+    db.session.commit()
+    return redirect(url_for('tasks.tasks_page'))
+
+
+@bp.route("/complete_task/<int:task_id>", methods=["POST"])
+@login_required
+def complete_task(task_id):
+    data = request.get_json(silent=True) or {}
+    occurs_at = data.get("occurs_at") or request.form.get("occurs_at")
+    try:
+        result = actions.complete_task(current_user, task_id, occurs_at=occurs_at)
+    except actions.ActionError as e:
+        if e.status == 404:
+            abort(404)
+        return jsonify({"success": False, "error": e.message}), e.status
+    db.session.commit()
+    return jsonify(dict(result, success=True))
+
+
+@bp.route("/delete_task/<int:task_id>", methods=["POST"])
+@login_required
+def delete_task(task_id):
+    task = Task.query.get_or_404(task_id)
+    if task.user_id != current_user.id:
+        flash("You cannot delete someone else's task.", "danger")
+        return redirect(url_for("tasks.tasks_page"))
+    db.session.execute(delete(TaskOccurrence).where(TaskOccurrence.task_id == task.id))
+    db.session.delete(task)
+    bump(current_user.id, TASKS)
+    db.session.commit()
+    flash("Task deleted.", "success")
+    return redirect(url_for("tasks.tasks_page"))
+
+
+@bp.route("/tasks_list")
+@login_required
+@conditional(TASKS)
+def tasks_list():
+    return fastjson.rows_response(db.session.execute(
+        select(Task.id, Task.title, Task.completed, Task.alarm_time, Task.rrule, Task.next_occurrence)
+        .where(Task.user_id == current_user.id)
+        .order_by(Task.created_at.desc())
+    ))
+
+
+@bp.route("/latest_task")
+@login_required
+@conditional(TASKS)
+def latest_task():
+    task = Task.query.filter_by(user_id=current_user.id, completed=False).order_by(Task.created_at.desc()).first()
+    return jsonify({"id": task.id, "title": task.title} if task else None)
+
+
+@bp.route('/modify_task/<int:task_id>', methods=['POST'])
+@login_required
+def modify_task(task_id):
+    data = request.get_json()
+    if not data or 'title' not in data:
+        return jsonify({'success': False, 'error': 'Title missing'}), 400
+
+    task = Task.query.filter_by(id=task_id, user_id=current_user.id).first()
+    if not task:
+        return jsonify({'success': False, 'error': 'Task not found'}), 404
+
+    try:
+        alarm_time = actions.parse_occurrence(data.get('alarm_time'))
+        occurs_at = actions.parse_occurrence(data.get('occurs_at'))
+        rrule = str(recurrence.parse(data['rrule'])) if data.get('rrule') else None
+    except (actions.ActionError, recurrence.RecurrenceError) as e:
+        return jsonify({'success': False, 'error': getattr(e, 'message', str(e))}), 400
+
+    if occurs_at is not None:
+        # Edit one occurrence of a recurring task; the series stays as it is.
+        if not (task.rrule and recurrence.parse(task.rrule).includes(task.alarm_time, occurs_at)):
+            return jsonify({'success': False, 'error': 'Not an occurrence of this task'}), 400
+        stmt = sqlite_insert(TaskOccurrence.__table__).values(
+            user_id=current_user.id, task_id=task.id, occurs_at=occurs_at, title=data['title'], moved_to=alarm_time
+        )
+        db.session.execute(stmt.on_conflict_do_update(
+            index_elements=['task_id', 'occurs_at'],
+            set_={'title': stmt.excluded.title, 'moved_to': stmt.excluded.moved_to},
+        ))
+    else:
+        task.title = data['title']
+        if 'alarm_time' in data or 'rrule' in data:
+            if 'alarm_time' in data:
+                task.alarm_time = alarm_time
+            if 'rrule' in data:
+                task.rrule = rrule
+            if task.rrule and task.alarm_time is None:
+                return jsonify({'success': False, 'error': 'A repeating task needs a start time'}), 400
+            recurrence.advance(task)
+    bump(current_user.id, TASKS)
+    db.session.commit()
+    return jsonify({'success': True})
+
+
+def _window_bound(name, default):
+    value = request.args.get(name)
+    if not value:
+        return default
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        abort(400)
+
+
+@bp.route("/task_occurrences")
+@login_required
+@conditional(TASKS, extra=lambda: (request.query_string, datetime.now().date()))
+def task_occurrences():
+    """Occurrences scheduled in ``[from, to)``; defaults to the next 7 days from today."""
+    start = _window_bound("from", datetime.combine(datetime.now().date(), datetime.min.time()))
+    end = _window_bound("to", start + timedelta(days=7))
+    if not start < end <= start + timedelta(days=current_app.config.get("TASK_WINDOW_MAX_DAYS", 92)):
+        return jsonify({"success": False, "error": "Invalid window"}), 400
+    return fastjson.response(recurrence.occurrences(current_user.id, start, end))
+
+
+@bp.route("/task_alarms")
+@login_required
+def task_alarms():
+    """Open tasks with an alarm in the next ``minutes`` (default 60), via ix_task_user_next.
+
+    Alarm times are the user's wall-clock time, so clients pass theirs as ``now``.
+    """
+    minutes = min(max(request.args.get("minutes", 60, type=int), 0), 24 * 60)
+    rows, rolled = recurrence.due_alarms(
+        current_user.id, _window_bound("now", datetime.now()), timedelta(minutes=minutes),
+        timedelta(seconds=current_app.config.get("TASK_ALARM_GRACE", 300)),
+    )
+    if rolled:
+        bump(current_user.id, TASKS)
+        db.session.commit()
+    return fastjson.response([
+        {"id": r.id, "title": r.title, "occurs_at": r.occurs_at, "alarm_time": r.alarm_time,
+         "recurring": bool(r.rrule)}
+        for r in rows
+    ])
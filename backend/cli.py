@@ -0,0 +1,272 @@
+# backend/cli.py
+from contextlib import nullcontext
+
+import click
+
+from backend.extensions import db
+
+
+@click.command("init-db")
+def init_db_command():
+    """Create missing tables, upgrade old ones and seed the quest catalog and quiz bank."""
+    init_db()
+    click.echo("Database schema is up to date.")
+
+
+@click.command("sync-quests")
+@click.argument("source", required=False)
+@click.option("--prune", is_flag=True, help="Deactivate templates missing from SOURCE.")
+def sync_quests_command(source, prune):
+    """Load quest templates from SOURCE (defaults to QUEST_POOL_SOURCE)."""
+    from backend.quest_engine import get_pools, sync_templates
+
+    added, updated, deactivated = sync_templates(get_pools(source), prune=prune)
+    click.echo(f"Quest catalog: {added} added, {updated} updated, {deactivated} deactivated.")
+
+
+@click.command("sync-quiz")
+@click.argument("source", required=False)
+@click.option("--prune", is_flag=True, help="Deactivate questions missing from SOURCE.")
+def sync_quiz_command(source, prune):
+    """Load quiz questions from SOURCE (a .json file or module; defaults to the built-in bank)."""
+    from backend.quiz import load_questions, sync_questions
+
+    added, updated, deactivated = sync_questions(load_questions(source), prune=prune)
+    click.echo(f"Quiz bank: {added} added, {updated} updated, {deactivated} deactivated.")
+
+
+@click.command("migrate-quests")
+@click.option("--delete", is_flag=True, help="Delete the stored quest rows afterwards.")
+def migrate_quests_command(delete):
+    """Copy completed quests into quest_completion for QUEST_MODE=derived."""
+    from backend.quest_engine import migrate_stored_quests
+    from backend.sharding import each_shard
+
+    total = sum(migrate_stored_quests(delete=delete) for _ in each_shard())
+    click.echo(f"{total} completions migrated.")
+
+
+@click.command("export-data")
+@click.option("--user-id", type=int, help="Only export this user's rows.")
+@click.option("--format", "fmt", type=click.Choice(["ndjson", "csv"]), default="ndjson")
+@click.option("--table", "tables", multiple=True, help="Table(s) to export; repeatable.")
+@click.option("--with-users", is_flag=True, help="Include user rows (NDJSON only).")
+@click.option("-o", "--output", type=click.File("w", encoding="utf-8"), default="-")
+def export_data_command(user_id, fmt, tables, with_users, output):
+    """Stream task/quest/study_log rows as NDJSON or CSV."""
+    from backend.datatransfer import USER_DATA_TABLES, export_csv, export_ndjson
+    from backend import sharding
+
+    tables = tables or USER_DATA_TABLES
+    if fmt == "csv" and len(tables) != 1:
+        raise click.UsageError("CSV export needs exactly one --table.")
+    # One user lives on one shard; a full export gathers every shard in turn.
+    shards = [None]
+    if sharding.enabled():
+        shards = [sharding.shard_for(user_id)] if user_id else sharding.shard_names()
+    for index, name in enumerate(shards):
+        with sharding.using_shard(name) if name else nullcontext():
+            if fmt == "csv":
+                lines = export_csv(tables[0], user_id)
+                if index:
+                    next(lines, None)  # header already written
+            else:
+                lines = export_ndjson((("user",) if with_users else ()) + tuple(tables), user_id)
+            for line in lines:
+                output.write(line)
+
+
+@click.command("import-data")
+@click.argument("source", type=click.File("r", encoding="utf-8"))
+@click.option("--user-id", type=int, help="Assign every row to this user (drops source ids).")
+@click.option("--table", help="Target table when SOURCE is CSV.")
+@click.option("--batch-size", type=int, default=5000, show_default=True)
+def import_data_command(source, user_id, table, batch_size):
+    """Bulk insert rows from an NDJSON (or CSV with --table) export."""
+    from backend import sharding
+    from backend.datatransfer import import_csv, import_ndjson
+
+    if sharding.enabled():
+        if not user_id:
+            raise click.UsageError("With SHARDS set, import one user at a time with --user-id.")
+        sharding.use_shard_for(user_id)
+    try:
+        if table:
+            counts = import_csv(table, source, user_id=user_id, batch_size=batch_size)
+        else:
+            counts = import_ndjson(source, user_id=user_id, batch_size=batch_size)
+    except ValueError as e:
+        raise click.ClickException(f"Nothing imported: {e}")
+    for name, count in counts.items():
+        click.echo(f"{name}: {count} rows")
+
+
+@click.command("retention")
+@click.option("--batch-size", type=int, help="Rows per batch (default RETENTION_BATCH_SIZE).")
+@click.option("--max-batches", type=int, help="Stop after this many batches.")
+@click.option("--skip-optimize", is_flag=True, help="Do not run ANALYZE/VACUUM afterwards.")
+def retention_command(batch_size, max_batches, skip_optimize):
+    """Compact old rows into activity_rollup, then ANALYZE (and VACUUM)."""
+    from backend.retention import optimize_database, run_retention
+    from backend.sharding import bind_for, each_shard
+
+    for shard in each_shard():
+        prefix = f"[{shard}] " if shard else ""
+        for kind, count in run_retention(batch_size=batch_size, max_batches=max_batches).items():
+            click.echo(f"{prefix}{kind}: {count} rows compacted")
+        if not skip_optimize and shard:
+            click.echo(f"{prefix}Ran " + ", ".join(optimize_database(engine=bind_for("task")["bind"])))
+    if not skip_optimize:
+        click.echo("Ran " + ", ".join(optimize_database()))
+
+
+@click.command("replay-progress")
+@click.option("--user-id", type=int, help="Only this user.")
+@click.option("--backfill", is_flag=True, help="First write events for past activity of users without any.")
+def replay_progress_command(user_id, backfill):
+    """Rebuild streaks, counters, milestones and XP history from the progress event log."""
+    from sqlalchemy import select
+
+    from backend.models import User
+    from backend.progress_engine import backfill as backfill_user
+    from backend.progress_engine import rebuild_xp_history, replay
+    from backend.sharding import each_shard
+
+    users = written = 0
+    for _ in each_shard():
+        ids = [user_id] if user_id is not None else db.session.execute(select(User.id)).scalars().all()
+        for uid in ids:
+            if db.session.get(User, uid) is None:
+                continue
+            if backfill:
+                written += backfill_user(uid)
+            replay(uid)
+            rebuild_xp_history(uid)
+            db.session.commit()
+            users += 1
+    click.echo(f"Replayed {users} users" + (f", {written} events backfilled." if backfill else "."))
+
+
+@click.command("rebuild-search")
+def rebuild_search_command():
+    """Rebuild the full-text search indexes from the task/study_log tables."""
+    from backend.search import rebuild
+
+    rebuild()
+    click.echo("Search indexes rebuilt.")
+
+
+@click.command("build-doc-index")
+@click.option("--source", type=click.Path(exists=True, file_okay=False), help="Defaults to DOCS_DIR.")
+@click.option("--chunk-words", type=int, default=60, show_default=True)
+def build_doc_index_command(source, chunk_words):
+    """Index ms-documents for /ask (BM25, memory-mapped)."""
+    from flask import current_app
+
+    from backend.docindex import build, index_path
+
+    stats = build(source or current_app.config["DOCS_DIR"], index_path(), chunk_words)
+    click.echo(f"{stats['chunks']} chunks, {stats['terms']} terms from {', '.join(stats['sources']) or 'no files'}.")
+    if stats["skipped"]:
+        click.echo(f"Skipped (install pypdf to index PDFs): {', '.join(stats['skipped'])}")
+
+
+@click.command("tts-warm")
+def tts_warm_command():
+    """Pre-synthesize every fixed /voice_command reply into the TTS cache."""
+    from backend.blueprints.assistant import canned_replies
+    from backend.tts import TTSError, warm
+
+    try:
+        made, cached = warm(canned_replies())
+    except TTSError as e:
+        raise click.ClickException(str(e))
+    click.echo(f"TTS cache: {made} synthesized, {cached} already cached.")
+
+
+@click.command("run-jobs")
+@click.option("-p", "--processes", type=int, default=1, show_default=True, help="Worker processes.")
+@click.option("--batch-size", type=int, help="Jobs claimed per batch (default JOB_BATCH_SIZE).")
+@click.option("--burst", is_flag=True, help="Exit once no job is ready instead of polling.")
+def run_jobs_command(processes, batch_size, burst):
+    """Run background job workers in the foreground."""
+    from flask import current_app
+
+    from backend.jobs import run_workers, stats
+
+    run_workers(current_app._get_current_object(), processes, batch_size, burst)
+    click.echo(", ".join(f"{status}: {count}" for status, count in sorted(stats().items())) or "No jobs.")
+
+
+@click.command("job-stats")
+def job_stats_command():
+    """Show background job counts per status."""
+    from backend.jobs import stats
+
+    for status, count in sorted(stats().items()):
+        click.echo(f"{status}: {count}")
+
+
+@click.command("rebalance-shards")
+@click.option("--dry-run", is_flag=True, help="Only report which users would move.")
+def rebalance_shards_command(dry_run):
+    """Move users onto the shard SHARDS now maps them to (also splits the main DB)."""
+    from backend import sharding
+
+    if not sharding.enabled():
+        raise click.ClickException("SHARDS is not configured.")
+    for name in sharding.shard_names():
+        sharding.init_shard(sharding.shard_engine(name))
+    moves = sharding.rebalance(dry_run=dry_run)
+    for (source, target), count in sorted(moves.items()):
+        click.echo(f"{source} -> {target}: {count} users" + (" (dry run)" if dry_run else ""))
+    click.echo(f"{sum(moves.values())} users {'to move' if dry_run else 'moved'}.")
+
+
+def init_db():
+    # Models must be imported so their tables are on db.metadata.
+    import backend.models  # noqa: F401
+    from sqlalchemy import inspect
+
+    from backend import sharding
+    from backend.migrations import upgrade_schema
+    from backend.models import QuestTemplate, QuizQuestion
+    from backend.quest_engine import get_pools, link_legacy_quests, sync_templates
+    from backend.quiz import load_questions, sync_questions
+    from backend.search import install as install_search
+
+    upgrade_schema()
+    if sharding.enabled():
+        db.metadata.create_all(db.engine, tables=[
+            t for t in db.metadata.sorted_tables if t.name not in sharding.SHARDED_TABLES
+        ])
+        for name in sharding.shard_names():
+            sharding.init_shard(sharding.shard_engine(name))
+    else:
+        db.create_all()
+        # FTS tables, views and triggers sit on top of the tables create_all() made.
+        with db.engine.begin() as conn:
+            install_search(conn)
+    if not QuestTemplate.query.first():
+        sync_templates(get_pools())
+    if not QuizQuestion.query.first():
+        sync_questions(load_questions())
+    if inspect(db.engine).has_table("quest"):
+        link_legacy_quests()
+
+
+def register_commands(app):
+    app.cli.add_command(init_db_command)
+    app.cli.add_command(sync_quests_command)
+    app.cli.add_command(sync_quiz_command)
+    app.cli.add_command(migrate_quests_command)
+    app.cli.add_command(export_data_command)
+    app.cli.add_command(import_data_command)
+    app.cli.add_command(retention_command)
+    app.cli.add_command(replay_progress_command)
+    app.cli.add_command(rebuild_search_command)
+    app.cli.add_command(tts_warm_command)
+    app.cli.add_command(build_doc_index_command)
+    app.cli.add_command(run_jobs_command)
+    app.cli.add_command(job_stats_command)
+    app.cli.add_command(rebalance_shards_command)
@@ -0,0 +1,93 @@
+# backend/dashboard.py
+"""Everything the profile/dashboard pages show, in one response.
+
+Only the requested fields are built, and building them never writes quests.
+``user`` needs no query, since ``current_user`` is already loaded. ``stats``
+is one SELECT: live counts and archived rollups as scalar subqueries.
+``tasks`` and ``latest_task`` share one query. ``quests`` returns what
+/get_user_quests would and leaves regenerating due periods to /quests.
+``achievements`` reads the stored progress state, which is replayed first if
+the rules changed. Timestamps are left as datetimes for backend.fastjson.
+"""
+from sqlalchemy import select
+
+from backend import progress_engine
+from backend.extensions import db
+from backend.fastjson import records
+from backend.models import StudyLog, Task
+from backend.progress import activity_counts, calculate_stats, get_level, get_rank
+from backend.quest_engine import get_user_quests
+
+FIELDS = ("user", "stats", "quests", "tasks", "latest_task", "study_logs", "achievements")
+
+
+def _user(user, ctx):
+    points = user.points or 0
+    return {
+        "id": user.id,
+        "username": user.username,
+        "quote": user.quote,
+        "profile_pic": user.profile_pic,
+        "points": points,
+        "level": get_level(points),
+        "rank": get_rank(points),
+    }
+
+
+def _stats(user, ctx):
+    counts = activity_counts(user.id)
+    return dict(calculate_stats(user, counts), completed=counts)
+
+
+def _quests(user, ctx):
+    # Read-only, like /get_user_quests: a GET must not replace the quest set.
+    return get_user_quests(user.id, ctx.get("quest_period"))
+
+
+def _pending_tasks(user, ctx):
+    if "pending_tasks" not in ctx:
+        rows = db.session.execute(
+            select(Task.id, Task.title, Task.created_at, Task.alarm_time, Task.next_occurrence)
+            .where(Task.user_id == user.id, Task.completed.is_(False))
+            .order_by(Task.created_at.desc()).limit(ctx["task_limit"])
+        ).all()
+        ctx["pending_tasks"] = [
+            {"id": r.id, "title": r.title, "completed": False, "alarm_time": r.alarm_time,
+             "next_occurrence": r.next_occurrence}
+            for r in rows
+        ]
+    return ctx["pending_tasks"]
+
+
+def _latest_task(user, ctx):
+    tasks = _pending_tasks(user, ctx)
+    return {"id": tasks[0]["id"], "title": tasks[0]["title"]} if tasks else None
+
+
+def _study_logs(user, ctx):
+    return records(db.session.execute(
+        select(StudyLog.id, StudyLog.subject, StudyLog.duration, StudyLog.notes, StudyLog.created_at)
+        .where(StudyLog.user_id == user.id)
+        .order_by(StudyLog.created_at.desc()).limit(ctx["log_limit"])
+    ))
+
+
+def _achievements(user, ctx):
+    return progress_engine.view(progress_engine.load_state(user.id))
+
+
+_BUILDERS = {
+    "user": _user,
+    "stats": _stats,
+    "quests": _quests,
+    "tasks": _pending_tasks,
+    "latest_task": _latest_task,
+    "study_logs": _study_logs,
+    "achievements": _achievements,
+}
+
+
+def snapshot(user, fields=FIELDS, task_limit=20, log_limit=10, quest_period=None):
+    """``{field: value}`` for the requested ``fields`` (names from FIELDS)."""
+    ctx = {"task_limit": task_limit, "log_limit": log_limit, "quest_period": quest_period}
+    return {field: _BUILDERS[field](user, ctx) for field in fields}
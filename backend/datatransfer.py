@@ -0,0 +1,280 @@
+# backend/datatransfer.py
+"""Streaming export and chunked import of user data.
+
+Exports walk each table with a streaming cursor (``yield_per``) and yield one
+encoded line at a time, so memory stays flat no matter how many rows a user
+has. Imports read lines lazily and insert them with ``executemany`` in
+batches. The whole import is one transaction: a bad record or a conflicting
+row raises ``ValueError`` and nothing is kept. When source ids are dropped,
+tasks are inserted one at a time to learn their new ids, and the occurrences
+that point at them are rewritten to match. Imported tasks get their
+``next_occurrence`` recomputed.
+
+Imported rows are taken as they are, completed flags and study logs
+included, so importing is an operator's restore path (``flask
+import-data``), not something users can run on their own account.
+"""
+import csv
+import io
+import json
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+
+from backend.extensions import db
+from backend.models import Quest, QuestTemplate, StudyLog, Task, TaskOccurrence, User
+from backend.versioning import TABLE_COLLECTIONS, bump_many
+
+# Order matters for imports: users before the rows that reference them.
+TABLES = {
+    "user": User.__table__,
+    "task": Task.__table__,
+    "task_occurrence": TaskOccurrence.__table__,
+    "quest": Quest.__table__,
+    "study_log": StudyLog.__table__,
+}
+USER_DATA_TABLES = ("task", "task_occurrence", "quest", "study_log")
+
+# table -> ((column, referenced table), ...) for ids renumbered on import
+_ID_REFS = {
+    "task_occurrence": (("task_id", "task"),),
+}
+_REFERENCED = {parent for refs in _ID_REFS.values() for _, parent in refs}
+
+# Quests are exported with their template's natural key so they can be
+# re-linked on an instance whose quest_template ids differ.
+_TEMPLATE_KEYS = ("template_pool", "template_title")
+
+
+def _export_query(name, user_id):
+    table = TABLES[name]
+    stmt = select(table)
+    if user_id is not None:
+        stmt = stmt.where((table.c.id if name == "user" else table.c.user_id) == user_id)
+    return stmt.order_by(table.c.id)
+
+
+def iter_rows(name, user_id=None, batch_size=1000):
+    """Yield row mappings of table ``name``, optionally for one user only."""
+    templates = None
+    if name == "quest":
+        # quest_template stays in the main database when quests are sharded,
+        # so the template keys come from the catalog snapshot, not a join.
+        from backend.quest_engine import get_catalog
+
+        templates = get_catalog().templates
+    result = db.session.execute(
+        _export_query(name, user_id), execution_options={"yield_per": batch_size}
+    )
+    for partition in result.mappings().partitions():
+        if templates is None:
+            yield from partition
+            continue
+        for row in partition:
+            template = templates.get(row["template_id"])
+            yield dict(row, template_pool=template and template.pool, template_title=template and template.title)
+
+
+def _jsonable(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def export_ndjson(tables=USER_DATA_TABLES, user_id=None, batch_size=1000):
+    """Yield NDJSON lines tagged with a ``_table`` key."""
+    for name in tables:
+        for row in iter_rows(name, user_id, batch_size):
+            record = {"_table": name}
+            record.update((k, _jsonable(v)) for k, v in row.items())
+            yield json.dumps(record, ensure_ascii=False) + "\n"
+
+
+def export_columns(name):
+    columns = [c.name for c in TABLES[name].columns]
+    return columns + list(_TEMPLATE_KEYS) if name == "quest" else columns
+
+
+def export_csv(name, user_id=None, batch_size=1000):
+    """Yield CSV lines (header first) for a single table."""
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    columns = export_columns(name)
+
+    def flush():
+        data = buf.getvalue()
+        buf.seek(0)
+        buf.truncate()
+        return data
+
+    writer.writerow(columns)
+    yield flush()
+    for row in iter_rows(name, user_id, batch_size):
+        writer.writerow(["" if row[c] is None else _jsonable(row[c]) for c in columns])
+        yield flush()
+
+
+# ----------------- IMPORT -----------------
+def _coerce(column, value):
+    if value is None or value == "":
+        return None
+    if isinstance(value, (dict, list)):
+        raise TypeError("not a scalar")
+    python_type = column.type.python_type
+    if python_type is datetime:
+        return value if isinstance(value, datetime) else datetime.fromisoformat(value)
+    if python_type is bool:
+        if isinstance(value, str):
+            return value.lower() in ("1", "true", "t", "yes")
+        return bool(value)
+    if python_type in (int, float):
+        return python_type(value)
+    return value
+
+
+class _Importer:
+    def __init__(self, user_id, keep_ids, batch_size):
+        self.user_id = user_id
+        self.keep_ids = keep_ids
+        self.batch_size = batch_size
+        self.pending = {}
+        self.counts = {}
+        self.new_ids = {}
+        self.inserted = {}
+        self._templates = None
+
+    def _template_id(self, pool, title):
+        if self._templates is None:
+            rows = db.session.execute(select(QuestTemplate.pool, QuestTemplate.title, QuestTemplate.id))
+            self._templates = {(p, t): i for p, t, i in rows}
+        return self._templates.get((pool, title))
+
+    def add(self, name, record):
+        if name not in TABLES:
+            raise ValueError(f"Unknown table in import: {name!r}")
+        if name == "user" and self.user_id is not None:
+            raise ValueError("User rows cannot be imported into a single account")
+        table = TABLES[name]
+        row = {}
+        for column in table.columns:
+            if column.name in record:
+                try:
+                    row[column.name] = _coerce(column, record[column.name])
+                except (TypeError, ValueError):
+                    raise ValueError(f"Invalid value for {name}.{column.name}: {record[column.name]!r}")
+        if name == "quest" and record.get("template_title"):
+            row["template_id"] = self._template_id(record.get("template_pool"), record["template_title"])
+        if not self.keep_ids:
+            old_id = row.pop("id", None)
+            if name in _REFERENCED:
+                # Kept aside until flush() learns the new id.
+                row["_old_id"] = old_id
+        if self.user_id is not None:
+            row["user_id"] = self.user_id
+        batch = self.pending.setdefault(name, [])
+        batch.append(row)
+        if len(batch) >= self.batch_size:
+            # Flush parents first so a batch never lands before its users.
+            for parent in TABLES:
+                self.flush(parent)
+                if parent == name:
+                    break
+
+    def flush(self, name):
+        rows = self.pending.pop(name, [])
+        if not rows:
+            return
+        table = TABLES[name]
+        if not self.keep_ids:
+            for column, parent in _ID_REFS.get(name, ()):
+                ids = self.new_ids.get(parent, {})
+                for row in rows:
+                    if row.get(column) not in ids:
+                        raise ValueError(f"{name} row refers to {parent} {row.get(column)!r}, "
+                                         f"which is not in the import")
+                    row[column] = ids[row[column]]
+        bulk = rows
+        try:
+            if name in _REFERENCED:
+                ids = self.new_ids.setdefault(name, {})
+                inserted = self.inserted.setdefault(name, [])
+                bulk = []
+                for row in rows:
+                    old = row.pop("_old_id", None)
+                    if row.get("id") is not None:
+                        inserted.append(row["id"])
+                        bulk.append(row)
+                        continue
+                    # One insert per row to learn each new id.
+                    new = db.session.execute(table.insert(), row).inserted_primary_key[0]
+                    inserted.append(new)
+                    if old is not None:
+                        ids[old] = new
+            # executemany needs every row in a call to share the same keys.
+            groups = {}
+            for row in bulk:
+                groups.setdefault(tuple(row), []).append(row)
+            for group in groups.values():
+                db.session.execute(table.insert(), group)
+        except IntegrityError as e:
+            # Duplicate ids, missing required columns, unknown users.
+            raise ValueError(f"Could not import {name} rows: {e.orig}")
+        if name in TABLE_COLLECTIONS:
+            bump_many([row["user_id"] for row in rows if row.get("user_id")], TABLE_COLLECTIONS[name])
+        self.counts[name] = self.counts.get(name, 0) + len(rows)
+
+    def _advance_tasks(self):
+        # The source's next_occurrence may be missing or stale; recompute it
+        # from the imported rule and completions so the tasks alarm again.
+        from backend import recurrence
+
+        task_ids = self.inserted.get("task", [])
+        for start in range(0, len(task_ids), self.batch_size):
+            for task in Task.query.filter(Task.id.in_(task_ids[start:start + self.batch_size])):
+                recurrence.advance(task)
+
+    def finish(self):
+        for name in list(TABLES):
+            self.flush(name)
+        self._advance_tasks()
+        db.session.commit()
+        return self.counts
+
+    def run(self, records):
+        """Add every ``(table, record)`` and commit; rolls back everything on error."""
+        try:
+            for name, record in records:
+                self.add(name, record)
+            return self.finish()
+        except Exception:
+            db.session.rollback()
+            raise
+
+
+def _ndjson_records(lines):
+    for number, line in enumerate(lines, start=1):
+        if isinstance(line, bytes):
+            line = line.decode("utf-8")
+        line = line.strip()
+        if not line:
+            continue
+        record = json.loads(line)
+        if not isinstance(record, dict) or not isinstance(record.get("_table"), str):
+            raise ValueError(f"Line {number}: expected a JSON object with a _table key")
+        yield record.pop("_table"), record
+
+
+def import_ndjson(lines, user_id=None, keep_ids=None, batch_size=1000):
+    """Insert records from NDJSON ``lines``; returns rows inserted per table.
+
+    With ``user_id`` every row is reassigned to that user and source ids are
+    dropped. Without it (whole-instance migration) ids are kept by default.
+    """
+    importer = _Importer(user_id, user_id is None if keep_ids is None else keep_ids, batch_size)
+    return importer.run(_ndjson_records(lines))
+
+
+def import_csv(name, lines, user_id=None, keep_ids=None, batch_size=1000):
+    """Insert rows of table ``name`` from CSV ``lines`` (with header)."""
+    importer = _Importer(user_id, user_id is None if keep_ids is None else keep_ids, batch_size)
+    text_lines = (l.decode("utf-8") if isinstance(l, bytes) else l for l in lines)
+    return importer.run((name, record) for record in csv.DictReader(text_lines))
@@ -0,0 +1,320 @@
+# backend/docindex.py
+"""BM25 retrieval over the project docs in ``ms-documents/`` for /ask.
+
+``flask build-doc-index`` chunks the documents (.txt/.md, and .pdf when
+pypdf is installed) and writes one read-only index file (``DOC_INDEX_FILE``,
+default instance/doc_index.bin). Each worker memory-maps it on first use.
+The sorted term table is binary-searched in place, so loading parses
+nothing but a small JSON header, and all workers share the same pages.
+
+Layout after the 4-byte header length and the JSON header (all integers
+are little-endian uint32):
+
+    term_offsets  n_terms + 1 offsets into term_bytes
+    term_bytes    UTF-8 terms, sorted bytewise
+    term_meta     (first posting, document frequency) per term
+    postings      (chunk, term frequency) pairs
+    chunk_meta    (text offset, text length, token count, source) per chunk
+    texts         UTF-8 chunk texts
+
+``context_for(query)`` returns the best chunks that fit ``ASK_CONTEXT_TOKENS``.
+``local_answer()`` answers a question on its own when one chunk clearly
+covers it, so the LLM is not called at all.
+"""
+import bisect
+import hashlib
+import heapq
+import json
+import math
+import mmap
+import os
+import re
+import struct
+import threading
+from collections import Counter, namedtuple
+
+from flask import current_app
+
+from backend import PROJECT_ROOT
+
+MAGIC = b"SAMDOCS1"
+_U32 = struct.Struct("<I")
+_PAIR = struct.Struct("<II")
+_CHUNK = struct.Struct("<IIII")
+
+STOPWORDS = frozenset(
+    "a an and are as at be by can do does for from how i in is it its me my of on or so that the their "
+    "this to was what when where which who why will with you your".split()
+)
+# Merge conflict markers left in some of the docs
+_CONFLICT = re.compile(r"^(<{7}|={7}|>{7})( .*)?$")
+
+Hit = namedtuple("Hit", "score source text terms")
+
+
+def tokenize(text):
+    tokens = []
+    for token in re.findall(r"\w+", text.lower()):
+        if len(token) < 2 or token in STOPWORDS:
+            continue
+        # Fold simple plurals: quests -> quest
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+
+# ----- building -----
+def _read(path):
+    if path.lower().endswith(".pdf"):
+        try:
+            from pypdf import PdfReader
+        except ImportError:
+            return None
+        return "\n\n".join(page.extract_text() or "" for page in PdfReader(path).pages)
+    with open(path, encoding="utf-8", errors="replace") as fh:
+        return fh.read()
+
+
+def chunk_text(text, words=60):
+    """Paragraph-aligned chunks of about ``words`` words.
+
+    Repeated paragraphs are kept once, which also folds the two identical
+    sides of a leftover merge conflict into one.
+    """
+    lines = [line for line in text.splitlines() if not _CONFLICT.match(line.strip())]
+    paragraphs = list(dict.fromkeys(p.strip() for p in re.split(r"\n\s*\n", "\n".join(lines)) if p.strip()))
+    chunks, current, size = [], [], 0
+    for paragraph in paragraphs:
+        n = len(paragraph.split())
+        if current and size + n > words:
+            chunks.append("\n".join(current))
+            current, size = [], 0
+        if n > words:
+            tokens = paragraph.split()
+            for i in range(0, len(tokens), words):
+                chunks.append(" ".join(tokens[i:i + words]))
+            continue
+        current.append(paragraph)
+        size += n
+    if current:
+        chunks.append("\n".join(current))
+    return chunks
+
+
+def build(source_dir, path, words=60):
+    """Index every document in ``source_dir`` into ``path``.
+
+    Returns ``{"chunks", "terms", "sources", "skipped"}``. Identical chunks
+    are stored once.
+    """
+    sources, skipped, chunks, seen = [], [], [], set()
+    for name in sorted(os.listdir(source_dir)):
+        if not name.lower().endswith((".txt", ".md", ".pdf")):
+            continue
+        text = _read(os.path.join(source_dir, name))
+        if text is None:
+            current_app.logger.warning("Not indexing %s: pypdf is not installed", name)
+            skipped.append(name)
+            continue
+        sources.append(name)
+        for chunk in chunk_text(text, words):
+            digest = hashlib.blake2b(chunk.encode(), digest_size=16).digest()
+            tokens = tokenize(chunk)
+            if tokens and digest not in seen:
+                seen.add(digest)
+                chunks.append((len(sources) - 1, chunk, tokens))
+
+    postings = {}
+    for chunk_id, (_, _, tokens) in enumerate(chunks):
+        for term, tf in Counter(tokens).items():
+            postings.setdefault(term.encode(), []).append((chunk_id, tf))
+    terms = sorted(postings)
+
+    term_offsets, term_meta, pairs = [0], [], []
+    for term in terms:
+        term_offsets.append(term_offsets[-1] + len(term))
+        term_meta.append((len(pairs), len(postings[term])))
+        pairs.extend(postings[term])
+    texts, chunk_meta = [], []
+    offset = 0
+    for source, text, tokens in chunks:
+        encoded = text.encode()
+        chunk_meta.append((offset, len(encoded), len(tokens), source))
+        texts.append(encoded)
+        offset += len(encoded)
+
+    sections = [
+        b"".join(_U32.pack(o) for o in term_offsets),
+        b"".join(terms),
+        b"".join(_PAIR.pack(*m) for m in term_meta),
+        b"".join(_PAIR.pack(*p) for p in pairs),
+        b"".join(_CHUNK.pack(*c) for c in chunk_meta),
+        b"".join(texts),
+    ]
+    total_tokens = sum(len(tokens) for _, _, tokens in chunks)
+    header = {
+        "sources": sources, "chunks": len(chunks), "terms": len(terms),
+        "avgdl": total_tokens / len(chunks) if chunks else 0.0,
+        "sections": [len(s) for s in sections],
+    }
+    encoded_header = json.dumps(header).encode()
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as fh:
+        fh.write(MAGIC + _U32.pack(len(encoded_header)) + encoded_header)
+        for section in sections:
+            fh.write(section)
+    os.replace(tmp, path)
+    return {"chunks": len(chunks), "terms": len(terms), "sources": sources, "skipped": skipped}
+
+
+# ----- reading -----
+class _Terms:
+    """The sorted term table as a sequence of bytes, for bisect."""
+
+    def __init__(self, index):
+        self.index = index
+
+    def __len__(self):
+        return self.index.n_terms
+
+    def __getitem__(self, i):
+        return self.index.term(i)
+
+
+class DocIndex:
+    def __init__(self, path):
+        with open(path, "rb") as fh:
+            self.map = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.map[:8] != MAGIC:
+            raise ValueError(f"{path} is not a doc index")
+        (size,) = _U32.unpack_from(self.map, 8)
+        header = json.loads(self.map[12:12 + size])
+        self.sources = header["sources"]
+        self.n_chunks = header["chunks"]
+        self.n_terms = header["terms"]
+        self.avgdl = header["avgdl"] or 1.0
+        offsets, position = [], 12 + size
+        for length in header["sections"]:
+            offsets.append(position)
+            position += length
+        (self.term_offsets, self.term_bytes, self.term_meta,
+         self.postings, self.chunk_meta, self.texts) = offsets
+
+    def term(self, i):
+        start, end = struct.unpack_from("<II", self.map, self.term_offsets + 4 * i)
+        return self.map[self.term_bytes + start:self.term_bytes + end]
+
+    def lookup(self, term):
+        """``[(chunk, tf), ...]`` for ``term``."""
+        key = term.encode()
+        i = bisect.bisect_left(_Terms(self), key)
+        if i == self.n_terms or self.term(i) != key:
+            return []
+        first, df = _PAIR.unpack_from(self.map, self.term_meta + 8 * i)
+        flat = struct.unpack_from(f"<{2 * df}I", self.map, self.postings + 8 * first)
+        return list(zip(flat[::2], flat[1::2]))
+
+    def chunk(self, chunk_id):
+        start, length, tokens, source = _CHUNK.unpack_from(self.map, self.chunk_meta + 16 * chunk_id)
+        text = self.map[self.texts + start:self.texts + start + length].decode()
+        return text, tokens, self.sources[source]
+
+    def search(self, query, k=5, k1=1.2, b=0.75):
+        terms = set(tokenize(query))
+        scores, matched = {}, {}
+        for term in terms:
+            postings = self.lookup(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (self.n_chunks - len(postings) + 0.5) / (len(postings) + 0.5))
+            for chunk_id, tf in postings:
+                dl = _CHUNK.unpack_from(self.map, self.chunk_meta + 16 * chunk_id)[2]
+                scores[chunk_id] = scores.get(chunk_id, 0.0) + idf * tf * (k1 + 1) / (
+                    tf + k1 * (1 - b + b * dl / self.avgdl))
+                matched[chunk_id] = matched.get(chunk_id, 0) + 1
+        hits = []
+        for chunk_id, score in heapq.nlargest(k, scores.items(), key=lambda item: item[1]):
+            text, _, source = self.chunk(chunk_id)
+            hits.append(Hit(score, source, text, matched[chunk_id] / len(terms)))
+        return hits
+
+
+_index = None
+_index_key = None
+_index_lock = threading.Lock()
+
+
+def index_path():
+    return current_app.config.get("DOC_INDEX_FILE") or os.path.join(PROJECT_ROOT, "instance", "doc_index.bin")
+
+
+def get_index():
+    """This worker's DocIndex, reopened if the file was rebuilt; None if there is none."""
+    global _index, _index_key
+    path = index_path()
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    if key != _index_key:
+        with _index_lock:
+            if key != _index_key:
+                _index = DocIndex(path)
+                _index_key = key
+    return _index
+
+
+def estimate_tokens(text):
+    # About four characters per token for English text
+    return len(text) // 4 + 1
+
+
+def context_for(query, budget=None, k=None):
+    """The best-scoring chunks for ``query`` that fit in ``budget`` tokens."""
+    config = current_app.config
+    index = get_index()
+    if index is None or not query:
+        return []
+    budget = config.get("ASK_CONTEXT_TOKENS", 600) if budget is None else budget
+    hits, used = [], 0
+    for hit in index.search(query, k or config.get("ASK_CONTEXT_CHUNKS", 3)):
+        if hit.score < config.get("ASK_CONTEXT_MIN_SCORE", 1.0):
+            break
+        # A passage sharing one word with a long question is noise.
+        if hit.terms < config.get("ASK_CONTEXT_MIN_COVERAGE", 0.5):
+            continue
+        cost = estimate_tokens(hit.text)
+        if used + cost > budget:
+            continue
+        hits.append(hit)
+        used += cost
+    return hits
+
+
+def system_prompt(hits):
+    parts = [f"[{hit.source}]\n{hit.text}" for hit in hits]
+    return (
+        "You are the assistant of SAM AI-1408, a gamified productivity app. "
+        "Use these excerpts from its documentation when they are relevant:\n\n" + "\n\n".join(parts)
+    )
+
+
+def local_answer(query, hits):
+    """A reply built from the docs alone, or None when the LLM is needed.
+
+    Only short questions are answered locally, and only when every term
+    appears in the top chunk, it scores at least ASK_LOCAL_MIN_SCORE and it
+    beats the runner-up by ASK_LOCAL_MARGIN times.
+    """
+    config = current_app.config
+    if not (hits and config.get("ASK_LOCAL_ANSWERS", True)):
+        return None
+    top = hits[0]
+    if len(tokenize(query)) > 12 or top.terms < 1.0 or top.score < config.get("ASK_LOCAL_MIN_SCORE", 5.0):
+        return None
+    if len(hits) > 1 and top.score < hits[1].score * config.get("ASK_LOCAL_MARGIN", 1.5):
+        return None
+    return f"From the SAM AI-1408 docs ({top.source}):\n\n{top.text}"
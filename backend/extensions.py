@@ -0,0 +1,12 @@
+# backend/extensions.py
+from flask_login import LoginManager
+from flask_sqlalchemy import SQLAlchemy
+
+from backend.sharding import ShardedSession
+
+db = SQLAlchemy(session_options={"class_": ShardedSession})
+
+login_manager = LoginManager()
+login_manager.login_view = "auth.login"
+login_manager.login_message = "Please log in to access this page."
+login_manager.login_message_category = "warning"
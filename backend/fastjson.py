@@ -0,0 +1,67 @@
+# backend/fastjson.py
+"""Fast JSON responses for the list endpoints.
+
+List views select only the columns they return, as plain rows
+(``db.session.execute(select(Model.a, Model.b))``), so nothing is loaded into
+the ORM identity map. ``rows_response(result)`` turns those rows into a JSON
+array of objects keyed by column label.
+
+The encoder is chosen by ``JSON_ENCODER``: "orjson" or "json" (stdlib). The
+default uses orjson when it is installed. Both write datetimes and dates as
+ISO 8601 (``2025-09-09T20:00:00``, no microseconds) and produce the same
+output.
+"""
+import json
+from datetime import date, datetime
+
+from flask import current_app
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+
+def _iso(value):
+    if isinstance(value, datetime):
+        return value.isoformat(timespec="seconds")
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _dumps_json(data):
+    return json.dumps(data, default=_iso, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _dumps_orjson(data):
+    return orjson.dumps(data, option=orjson.OPT_OMIT_MICROSECONDS | orjson.OPT_NON_STR_KEYS)
+
+
+ENCODERS = {"json": _dumps_json}
+if orjson is not None:
+    ENCODERS["orjson"] = _dumps_orjson
+
+
+def dumps(data):
+    """``data`` as UTF-8 JSON bytes, using the configured encoder."""
+    name = current_app.config.get("JSON_ENCODER") or ("orjson" if orjson is not None else "json")
+    try:
+        encoder = ENCODERS[name]
+    except KeyError:
+        raise RuntimeError(f"JSON_ENCODER {name!r} is not available; use one of {sorted(ENCODERS)}") from None
+    return encoder(data)
+
+
+def records(result):
+    """Rows of a Core/ORM column select as a list of dicts."""
+    keys = tuple(result.keys())
+    return [dict(zip(keys, row)) for row in result]
+
+
+def response(data, status=200):
+    return current_app.response_class(dumps(data), status=status, mimetype="application/json")
+
+
+def rows_response(result, status=200):
+    return response(records(result), status)
@@ -0,0 +1,225 @@
+# backend/game_sessions.py
+"""Server-side scoring for the mini-games.
+
+A game starts with ``start()``, which returns a signed token holding the
+session id, the user, the game and the start time. The token is the whole
+session state; the only row written at the start is an ``OpenGame`` entry.
+A user holds at most ``GAME_MAX_OPEN_SESSIONS`` of them: starting another
+closes the oldest, and a closed session can no longer be scored.
+
+- Event batches (``[[ms_since_start, kind], ...]``) are checked against the
+  game's Rules and folded into a fresh token that carries the running count,
+  last event time and XP.
+- A game can also end with a single ``result`` dict, scored by the rules'
+  result function.
+- ``finish()`` swaps the ``OpenGame`` entry for one ``GameResult`` row and
+  adds the XP to the session; the caller commits. ``(user_id, session_id)``
+  is the row's primary key, so a token can only ever be scored once.
+
+Event times may not run ahead of the server's clock, so the XP a client can
+claim is bounded by how long the game has really been running.
+"""
+import secrets
+import time
+from datetime import datetime, timedelta
+
+from flask import current_app
+from itsdangerous import BadSignature, URLSafeTimedSerializer
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from backend.actions import ActionError
+from backend.extensions import db
+from backend.models import GameResult, OpenGame
+from backend.progress_engine import GAME, emit
+
+
+class GameError(ActionError):
+    pass
+
+
+class Rules:
+    """Scoring for one game.
+
+    ``events`` maps an event kind to its XP. ``min_gap_ms`` is the shortest
+    plausible time between two events and ``max_events`` caps a session.
+    ``result`` scores a final result dict (``fn(result, elapsed_ms) -> xp``)
+    for games that report one instead of events. ``duration`` is the game's
+    length in seconds (None when untimed).
+    """
+
+    def __init__(self, duration=None, events=None, min_gap_ms=0, max_events=0, result=None):
+        self.duration = duration
+        self.events = events or {}
+        self.min_gap_ms = min_gap_ms
+        self.max_events = max_events
+        self.result = result
+
+    def describe(self):
+        return {"duration": self.duration, "events": self.events,
+                "max_events": self.max_events, "result": self.result is not None}
+
+
+SPINWHEEL_CHALLENGE_SECONDS = 30
+# The wheel needs at least 3 s to stop (on a 240 Hz display), and the page
+# only enables "Completed" once 10 s of the challenge timer have run.
+SPINWHEEL_SPIN_SECONDS = 3
+SPINWHEEL_MIN_CHALLENGE_SECONDS = 10
+
+
+def _quiz_result(result, elapsed_ms):
+    correct = result.get("correct")
+    if not isinstance(correct, int) or not 0 <= correct <= current_app.config.get("QUIZ_SET_SIZE", 14):
+        raise GameError("Invalid quiz result")
+    # At least a second to read and answer each question
+    if correct * 1000 > elapsed_ms:
+        raise GameError("Quiz answered too fast")
+    return correct * 5
+
+
+def _spinwheel_result(result, elapsed_ms):
+    if result.get("status") not in ("completed", "failed"):
+        raise GameError("Invalid challenge status")
+    if not isinstance(result.get("challenge"), str) or len(result["challenge"]) > 100:
+        raise GameError("Invalid challenge")
+    if result["status"] == "failed":
+        return 0
+    if elapsed_ms < (SPINWHEEL_SPIN_SECONDS + SPINWHEEL_MIN_CHALLENGE_SECONDS) * 1000:
+        raise GameError("Challenge completed too fast")
+    return 10
+
+
+GAMES = {
+    # a coin spawns every 800 ms during a 30 s round
+    "coin": Rules(duration=30, events={"coin": 10}, min_gap_ms=200, max_events=38),
+    # 8 pairs; each comparison takes 800 ms
+    "memory": Rules(events={"match": 5}, min_gap_ms=800, max_events=8),
+    "quiz": Rules(duration=180, result=_quiz_result),
+    # spin (a few seconds) plus the challenge timer
+    "spinwheel": Rules(duration=SPINWHEEL_CHALLENGE_SECONDS + 30, result=_spinwheel_result),
+}
+
+
+def _serializer():
+    return URLSafeTimedSerializer(current_app.config["SECRET_KEY"], salt="game-session")
+
+
+def _now_ms():
+    return int(time.time() * 1000)
+
+
+def _max_age(rules):
+    config = current_app.config
+    if rules.duration is None:
+        return config.get("GAME_SESSION_MAX_AGE", 3600)
+    return rules.duration + config.get("GAME_SESSION_GRACE", 30)
+
+
+def start(user, game, extra=None):
+    """A token for a new session of ``game``; ``extra`` is stored in it as ``x``.
+
+    Adds the session's ``OpenGame`` row, closing expired ones and any beyond
+    ``GAME_MAX_OPEN_SESSIONS`` (oldest first). The caller commits.
+    """
+    if game not in GAMES:
+        raise GameError(f"Unknown game: {game}")
+    now = datetime.utcnow()
+    keep = max(current_app.config.get("GAME_MAX_OPEN_SESSIONS", 5) - 1, 0)
+    newest = (
+        select(OpenGame.session_id).where(OpenGame.user_id == user.id, OpenGame.expires_at > now)
+        .order_by(OpenGame.started_at.desc()).limit(keep)
+    )
+    db.session.execute(delete(OpenGame).where(OpenGame.user_id == user.id, OpenGame.session_id.not_in(newest)))
+
+    state = {"s": secrets.token_hex(8), "u": user.id, "g": game, "t0": _now_ms(), "n": 0, "last": 0, "xp": 0}
+    if extra is not None:
+        state["x"] = extra
+    db.session.add(OpenGame(user_id=user.id, session_id=state["s"], started_at=now,
+                            expires_at=now + timedelta(seconds=_max_age(GAMES[game]))))
+    return _serializer().dumps(state)
+
+
+def load(user, token):
+    """The session state in ``token``; raises GameError if it is invalid or expired."""
+    try:
+        state = _serializer().loads(token)
+    except BadSignature:
+        raise GameError("Invalid game token")
+    rules = GAMES.get(state.get("g")) if isinstance(state, dict) else None
+    if rules is None or state.get("u") != user.id:
+        raise GameError("Invalid game token")
+    if _now_ms() - state["t0"] > _max_age(rules) * 1000:
+        raise GameError("Game session expired")
+    return state
+
+
+def apply_events(state, events):
+    """Validate a batch of ``[ms, kind]`` events and add them to ``state``."""
+    rules = GAMES[state["g"]]
+    if not isinstance(events, list):
+        raise GameError("events must be a list")
+    if not rules.events and events:
+        raise GameError("This game reports a result, not events")
+    if state["n"] + len(events) > rules.max_events:
+        raise GameError("Too many events")
+
+    elapsed = _now_ms() - state["t0"] + current_app.config.get("GAME_CLOCK_SLACK_MS", 2000)
+    limit = min(elapsed, rules.duration * 1000) if rules.duration else elapsed
+    for event in events:
+        if not (isinstance(event, list) and len(event) == 2 and isinstance(event[0], int)):
+            raise GameError("Events are [ms_since_start, kind] pairs")
+        at, kind = event
+        if kind not in rules.events:
+            raise GameError(f"Unknown event: {kind}")
+        if at > limit:
+            raise GameError("Event is later than the game allows")
+        if state["n"] and at - state["last"] < rules.min_gap_ms:
+            raise GameError("Events are too close together")
+        state["n"] += 1
+        state["last"] = at
+        state["xp"] += rules.events[kind]
+    return state
+
+
+def save_events(user, token, events):
+    """Apply a batch mid-game; returns ``(new_token, xp_so_far)``."""
+    state = apply_events(load(user, token), events)
+    return _serializer().dumps(state), state["xp"]
+
+
+def finish(user, token, events=None, result=None):
+    """Score the session and add its XP to ``user``. Does not commit.
+
+    Returns ``{"game", "xp"}``, or None if this session was already scored.
+    """
+    state = load(user, token)
+    rules = GAMES[state["g"]]
+    if events:
+        apply_events(state, events)
+    xp = state["xp"]
+    if result is not None:
+        if rules.result is None:
+            raise GameError("This game reports events, not a result")
+        if not isinstance(result, dict):
+            raise GameError("result must be an object")
+        xp += rules.result(result, _now_ms() - state["t0"])
+
+    opened = db.session.execute(
+        delete(OpenGame).where(OpenGame.user_id == user.id, OpenGame.session_id == state["s"])
+    ).rowcount
+    if not opened:
+        if db.session.get(GameResult, (user.id, state["s"])) is not None:
+            return None
+        raise GameError("This game session was closed; start a new one", 409)
+
+    inserted = db.session.execute(
+        sqlite_insert(GameResult.__table__).values(
+            user_id=user.id, session_id=state["s"], game=state["g"], xp=xp,
+            duration_ms=_now_ms() - state["t0"], created_at=datetime.utcnow(),
+        ).on_conflict_do_nothing()
+    ).rowcount
+    if not inserted:
+        return None
+    user.points = (user.points or 0) + xp
+    emit(user, GAME, xp=xp, detail=state["g"])
+    return {"game": state["g"], "xp": xp}
@@ -0,0 +1,223 @@
+# backend/jobs.py
+"""Durable background jobs stored in the app's own SQLite database.
+
+Register a function with ``@job()`` and enqueue it from a route with
+``fn.delay(*args)`` or ``fn.apply(args, key=..., priority=..., countdown=...)``;
+``fn.map(arg_tuples)`` enqueues many at once.
+Enqueueing only adds a row to the current session. The route's commit makes
+the job visible, so a rolled-back request never leaves a stray job behind.
+
+``flask run-jobs`` starts worker processes. Each one claims a batch of ready
+jobs with a single ``UPDATE ... RETURNING`` that leases them until
+``JOB_VISIBILITY_TIMEOUT`` seconds from now, then runs them and records the
+outcome. A worker that dies mid-batch loses its lease, and the jobs become
+claimable again. Delivery is therefore at-least-once and job functions should
+be idempotent. Failures are retried with exponential backoff until
+``max_attempts``, then left as ``failed``.
+
+A job ``key`` is unique: enqueueing a key that is queued, running or done
+is a no-op until the retention job purges the old row. Enqueueing a key
+whose job failed queues that job again from its first attempt.
+"""
+import json
+import os
+import random
+import signal
+import socket
+import time
+from datetime import datetime
+from importlib import import_module
+
+from flask import current_app
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from backend.extensions import db
+from backend.models import Job
+
+# name -> JobFunction
+REGISTRY = {}
+
+
+class JobFunction:
+    def __init__(self, fn, name, priority, max_attempts):
+        self.fn = fn
+        self.name = name
+        self.priority = priority
+        self.max_attempts = max_attempts
+        self.__doc__ = fn.__doc__
+
+    def __call__(self, *args, **kwargs):
+        return self.fn(*args, **kwargs)
+
+    def delay(self, *args, **kwargs):
+        return self.apply(args, kwargs)
+
+    def map(self, arg_tuples):
+        """Enqueue one job per args tuple with a single executemany."""
+        now = time.time()
+        rows = [
+            {"name": self.name, "args": json.dumps([list(args), {}]), "priority": self.priority,
+             "status": "queued", "attempts": 0, "max_attempts": self.max_attempts,
+             "available_at": now, "created_at": datetime.utcnow()}
+            for args in arg_tuples
+        ]
+        if rows:
+            db.session.execute(Job.__table__.insert(), rows)
+        return len(rows)
+
+    def apply(self, args=(), kwargs=None, key=None, priority=None, countdown=0):
+        return enqueue(self.name, args, kwargs, key=key,
+                       priority=self.priority if priority is None else priority,
+                       max_attempts=self.max_attempts, countdown=countdown)
+
+
+def job(name=None, priority=0, max_attempts=5):
+    """Register the decorated function as a job called ``name``."""
+    def decorator(fn):
+        registered = JobFunction(fn, name or f"{fn.__module__}.{fn.__name__}", priority, max_attempts)
+        REGISTRY[registered.name] = registered
+        return registered
+    return decorator
+
+
+def enqueue(name, args=(), kwargs=None, key=None, priority=0, max_attempts=5, countdown=0):
+    """Add a job to the session; returns False if ``key`` already exists and has not failed."""
+    values = dict(
+        key=key, name=name, args=json.dumps([list(args), kwargs or {}]), priority=priority,
+        status="queued", attempts=0, max_attempts=max_attempts,
+        available_at=time.time() + countdown, created_at=datetime.utcnow(),
+    )
+    stmt = sqlite_insert(Job.__table__).values(**values)
+    if key is not None:
+        values.update(locked_by=None, last_error=None, finished_at=None)
+        values.pop("key")
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["key"], set_=values, where=Job.__table__.c.status == "failed",
+        )
+    return db.session.execute(stmt).rowcount > 0
+
+
+def load_job_modules():
+    """Import JOB_MODULES so their @job functions are registered."""
+    for module in current_app.config.get("JOB_MODULES", ()):
+        import_module(module)
+
+
+def _claim(worker_id, limit):
+    now = time.time()
+    rows = db.session.execute(text(
+        "UPDATE job SET status = 'running', attempts = attempts + 1,"
+        " locked_by = :worker, available_at = :lease_end"
+        " WHERE id IN (SELECT id FROM job"
+        "  WHERE status IN ('queued', 'running') AND available_at <= :now"
+        "  ORDER BY priority, available_at LIMIT :limit)"
+        " RETURNING id, name, args, priority, attempts, max_attempts"
+    ), {
+        "worker": worker_id, "now": now, "limit": limit,
+        "lease_end": now + current_app.config.get("JOB_VISIBILITY_TIMEOUT", 60),
+    }).all()
+    db.session.commit()
+    return sorted(rows, key=lambda r: (r.priority, r.id))
+
+
+def _backoff(attempts):
+    config = current_app.config
+    delay = min(config.get("JOB_BACKOFF_MAX", 3600), config.get("JOB_BACKOFF_BASE", 2) * 2 ** (attempts - 1))
+    return delay * random.uniform(0.5, 1.0)
+
+
+def run_batch(worker_id, batch_size=None):
+    """Claim and run one batch; returns how many jobs were claimed."""
+    rows = _claim(worker_id, batch_size or current_app.config.get("JOB_BATCH_SIZE", 50))
+    done, retry = [], []
+    for row in rows:
+        try:
+            fn = REGISTRY.get(row.name)
+            if fn is None:
+                raise LookupError(f"Unknown job: {row.name}")
+            if row.attempts > row.max_attempts:
+                raise RuntimeError("Lease expired on the last attempt")
+            args, kwargs = json.loads(row.args)
+            fn.fn(*args, **kwargs)
+            db.session.commit()
+            done.append(row.id)
+        except Exception as e:
+            db.session.rollback()
+            current_app.logger.warning("Job %s (%s) failed: %s", row.id, row.name, e)
+            final = row.attempts >= row.max_attempts or row.name not in REGISTRY
+            retry.append({
+                "id": row.id, "worker": worker_id, "error": f"{type(e).__name__}: {e}"[:2000],
+                "status": "failed" if final else "queued",
+                "at": time.time() + (0 if final else _backoff(row.attempts)),
+                "finished": datetime.utcnow() if final else None,
+            })
+
+    # Only touch jobs we still hold; a lease that expired belongs to someone else.
+    if done:
+        db.session.execute(text(
+            "UPDATE job SET status = 'done', locked_by = NULL, finished_at = :now"
+            " WHERE locked_by = :worker AND id IN (SELECT value FROM json_each(:ids))"
+        ), {"now": datetime.utcnow(), "worker": worker_id, "ids": json.dumps(done)})
+    if retry:
+        db.session.execute(text(
+            "UPDATE job SET status = :status, available_at = :at, last_error = :error,"
+            " locked_by = NULL, finished_at = :finished"
+            " WHERE id = :id AND locked_by = :worker"
+        ), retry)
+    db.session.commit()
+    return len(rows)
+
+
+def work(worker_id=None, batch_size=None, burst=False, should_stop=lambda: False):
+    """Process jobs until ``should_stop()``; with ``burst``, until none are ready.
+
+    Returns the number of jobs claimed.
+    """
+    worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+    poll = current_app.config.get("JOB_POLL_INTERVAL", 0.5)
+    processed = 0
+    while not should_stop():
+        claimed = run_batch(worker_id, batch_size)
+        processed += claimed
+        if not claimed:
+            if burst:
+                break
+            time.sleep(poll)
+    return processed
+
+
+def _worker_process(app, index, batch_size, burst):
+    stopping = []
+    signal.signal(signal.SIGTERM, lambda *_: stopping.append(True))
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    with app.app_context():
+        # Connections inherited from the parent must not be shared.
+        db.engine.dispose(close=False)
+        work(f"{socket.gethostname()}:{os.getpid()}:{index}", batch_size, burst, lambda: bool(stopping))
+
+
+def run_workers(app, processes=1, batch_size=None, burst=False):
+    """Run ``processes`` worker processes in the foreground until stopped."""
+    import multiprocessing
+
+    with app.app_context():
+        load_job_modules()
+        db.engine.dispose()
+    ctx = multiprocessing.get_context("fork")
+    children = [ctx.Process(target=_worker_process, args=(app, i, batch_size, burst)) for i in range(processes)]
+    for child in children:
+        child.start()
+    try:
+        for child in children:
+            child.join()
+    except KeyboardInterrupt:
+        for child in children:
+            child.terminate()
+        for child in children:
+            child.join()
+
+
+def stats():
+    """Job counts per status."""
+    return dict(db.session.execute(select(Job.status, func.count()).group_by(Job.status)).all())
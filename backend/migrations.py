@@ -0,0 +1,69 @@
+# backend/migrations.py
+"""Idempotent schema upgrades for databases created by older versions.
+
+``db.create_all()`` only adds missing tables. Anything that changes an
+existing table goes here and runs from ``init-db`` before create_all().
+SQLite cannot alter column constraints in place, so such tables are
+rebuilt: renamed, recreated from the model, and copied across.
+Columns that are only added use ALTER TABLE ... ADD COLUMN instead, which
+also leaves the search triggers on that table alone.
+"""
+from sqlalchemy import inspect, text
+
+from backend.extensions import db
+
+
+def _rebuild_table(conn, table, columns):
+    old = f"_old_{table.name}"
+    conn.execute(text(f"ALTER TABLE {table.name} RENAME TO {old}"))
+    table.create(conn)
+    cols = ", ".join(columns)
+    conn.execute(text(f"INSERT INTO {table.name} ({cols}) SELECT {cols} FROM {old}"))
+    conn.execute(text(f"DROP TABLE {old}"))
+
+
+def quest_template_refs(conn, inspector):
+    """quest gains template_id and its copied display columns become nullable."""
+    from backend.models import Quest
+
+    if not inspector.has_table("quest"):
+        return
+    columns = [c["name"] for c in inspector.get_columns("quest")]
+    if "template_id" in columns:
+        return
+    _rebuild_table(conn, Quest.__table__, columns)
+
+
+def task_recurrence(conn, inspector):
+    """task gains rrule and next_occurrence; open alarms seed the pointer."""
+    if not inspector.has_table("task"):
+        return
+    columns = [c["name"] for c in inspector.get_columns("task")]
+    if "rrule" not in columns:
+        conn.execute(text("ALTER TABLE task ADD COLUMN rrule VARCHAR(200)"))
+    if "next_occurrence" not in columns:
+        conn.execute(text("ALTER TABLE task ADD COLUMN next_occurrence DATETIME"))
+        conn.execute(text("UPDATE task SET next_occurrence = alarm_time WHERE completed IS NOT 1"))
+
+
+def per_user_indexes(conn, inspector):
+    """Indexes added to tables that create_all() will not touch again."""
+    from backend.models import Quest, StudyLog, Task, TaskOccurrence
+
+    for model in (Task, StudyLog, Quest, TaskOccurrence):
+        if inspector.has_table(model.__tablename__):
+            for index in model.__table__.indexes:
+                index.create(conn, checkfirst=True)
+
+
+MIGRATIONS = [
+    quest_template_refs,
+    task_recurrence,
+    per_user_indexes,
+]
+
+
+def upgrade_schema(engine=None):
+    with (engine or db.engine).begin() as conn:
+        for migration in MIGRATIONS:
+            migration(conn, inspect(conn))
@@ -0,0 +1,283 @@
+# backend/models.py
+from datetime import datetime
+
+from flask_login import UserMixin
+
+from backend.extensions import db, login_manager
+from backend.sharding import use_shard_for
+
+
+class User(db.Model, UserMixin):
+    id = db.Column(db.Integer, primary_key=True)
+    username = db.Column(db.String(100), nullable=False, unique=True)
+    password = db.Column(db.String(200), nullable=False)
+    profile_pic = db.Column(db.String(200), nullable=True)
+    quote = db.Column(db.String(300), nullable=False, default="Stay focused. Keep leveling up.")
+    rank = db.Column(db.String(50), default="Bronze")
+    level = db.Column(db.Integer, default=1)
+    points = db.Column(db.Integer, default=0)
+    strength = db.Column(db.Integer, default=50)
+    health = db.Column(db.Integer, default=50)
+    growth = db.Column(db.Integer, default=50)
+    wisdom = db.Column(db.Integer, default=50)
+    finance = db.Column(db.Integer, default=50)
+
+    # Personal
+    age = db.Column(db.Integer, nullable=True)
+    height_cm = db.Column(db.Float, nullable=True)
+    weight_kg = db.Column(db.Float, nullable=True)
+    fitness_level = db.Column(db.String(50), default="Beginner")
+
+    # Quest timestamps
+    last_daily_quest = db.Column(db.DateTime, default=None)
+    last_weekly_quest = db.Column(db.DateTime, default=None)
+    last_monthly_quest = db.Column(db.DateTime, default=None)
+
+
+class Task(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=False)
+    title = db.Column(db.String(150), nullable=False)
+    description = db.Column(db.Text, nullable=True)
+    completed = db.Column(db.Boolean, default=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    alarm_time = db.Column(db.DateTime, nullable=True)
+    # Recurrence rule (backend.recurrence); alarm_time is the first occurrence
+    rrule = db.Column(db.String(200), nullable=True)
+    # Next open occurrence (alarm_time for one-off tasks); NULL when done
+    next_occurrence = db.Column(db.DateTime, nullable=True)
+
+    user = db.relationship("User", backref=db.backref("tasks", lazy=True))
+
+    __table_args__ = (
+        db.Index("ix_task_user_created", "user_id", "created_at"),
+        db.Index("ix_task_user_next", "user_id", "next_occurrence"),
+    )
+
+
+class TaskOccurrence(db.Model):
+    """One occurrence of a recurring task that was completed or edited.
+
+    Occurrences follow from the task's rule; only the ones that differ from
+    it get a row, keyed by the time the rule scheduled them.
+    """
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=False)
+    task_id = db.Column(db.Integer, db.ForeignKey("task.id"), nullable=False)
+    occurs_at = db.Column(db.DateTime, nullable=False)
+    title = db.Column(db.String(150), nullable=True)
+    moved_to = db.Column(db.DateTime, nullable=True)
+    completed_at = db.Column(db.DateTime, nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        db.UniqueConstraint("task_id", "occurs_at", name="uq_task_occurrence"),
+        db.Index("ix_task_occurrence_user_at", "user_id", "occurs_at"),
+        # due_alarms(): edited occurrences by their new alarm time
+        db.Index("ix_task_occurrence_user_moved", "user_id", "moved_to"),
+    )
+
+
+class StudyLog(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=False)
+    subject = db.Column(db.String(100), nullable=False)
+    duration = db.Column(db.Integer, nullable=False)
+    notes = db.Column(db.Text, nullable=True)
+    started_at = db.Column(db.String(50))
+    ended_at = db.Column(db.String(50))
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    __table_args__ = (db.Index("ix_study_log_user_created", "user_id", "created_at"),)
+
+    def __repr__(self):
+        return f"<StudyLog {self.subject} - {self.duration} min>"
+
+
+class QuestTemplate(db.Model):
+    """One catalog entry. Generated quests point here instead of copying it."""
+    id = db.Column(db.Integer, primary_key=True)
+    pool = db.Column(db.String(50), nullable=False)  # daily/weekly/monthly/bmi
+    title = db.Column(db.String(255), nullable=False)
+    category = db.Column(db.String(50), nullable=False)
+    type = db.Column(db.String(50), nullable=False)
+    difficulty = db.Column(db.String(50), nullable=False)
+    xp = db.Column(db.Integer, default=10)
+    active = db.Column(db.Boolean, default=True)
+
+    __table_args__ = (db.UniqueConstraint("pool", "title"),)
+
+
+class CatalogVersion(db.Model):
+    """Bumped whenever a catalog table changes so workers reload their snapshot."""
+    name = db.Column(db.String(50), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+
+
+class Quest(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=False)
+    template_id = db.Column(db.Integer, db.ForeignKey("quest_template.id"), nullable=True)
+    type = db.Column(db.String(50), nullable=False)  # daily/weekly/monthly
+    completed = db.Column(db.Boolean, default=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    # Only set for quests that have no template (rows created before the
+    # catalog table existed); everything else is read from the snapshot.
+    title = db.Column(db.String(255), nullable=True)
+    category = db.Column(db.String(50), nullable=True)
+    difficulty = db.Column(db.String(50), nullable=True)
+    xp = db.Column(db.Integer, nullable=True)
+
+    __table_args__ = (db.Index("ix_quest_user_type", "user_id", "type"),)
+
+
+class QuestCompletion(db.Model):
+    """A completed quest in derived mode: which template, in which period."""
+    user_id = db.Column(db.Integer, db.ForeignKey("user.id"), primary_key=True)
+    template_id = db.Column(db.Integer, db.ForeignKey("quest_template.id"), primary_key=True)
+    period_start = db.Column(db.Date, primary_key=True)
+
+    __table_args__ = {"sqlite_with_rowid": False}
+
+
+class CollectionVersion(db.Model):
+    """Per-user change counter for a list endpoint's data (tasks, quests, ...)."""
+    user_id = db.Column(db.Integer, db.ForeignKey("user.id"), primary_key=True)
+    collection = db.Column(db.String(30), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+
+    __table_args__ = {"sqlite_with_rowid": False}
+
+
+class SyncOperation(db.Model):
+    """Result of an operation applied through /sync, keyed by the client's id."""
+    user_id = db.Column(db.Integer, db.ForeignKey("user.id"), primary_key=True)
+    key = db.Column(db.String(64), primary_key=True)
+    type = db.Column(db.String(30), nullable=False)
+    result = db.Column(db.Text, nullable=False)  # JSON
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+
+
+class ActivityRollup(db.Model):
+    """Per-user, per-day totals for rows removed by the retention job."""
+    user_id = db.Column(db.Integer, db.ForeignKey("user.id"), primary_key=True)
+    kind = db.Column(db.String(20), primary_key=True)  # task/study_log/quest
+    day = db.Column(db.Date, primary_key=True)
+    count = db.Column(db.Integer, nullable=False, default=0)
+    minutes = db.Column(db.Integer, nullable=False, default=0)
+    xp = db.Column(db.Integer, nullable=False, default=0)
+
+
+class GameResult(db.Model):
+    """A scored mini-game session (backend.game_sessions); one row per token."""
+    user_id = db.Column(db.Integer, db.ForeignKey("user.id"), primary_key=True)
+    session_id = db.Column(db.String(16), primary_key=True)
+    game = db.Column(db.String(20), nullable=False)
+    xp = db.Column(db.Integer, nullable=False, default=0)
+    duration_ms = db.Column(db.Integer, nullable=False, default=0)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+
+
+class OpenGame(db.Model):
+    """A started game session that is not scored yet (backend.game_sessions)."""
+    user_id = db.Column(db.Integer, db.ForeignKey("user.id"), primary_key=True)
+    session_id = db.Column(db.String(16), primary_key=True)
+    started_at = db.Column(db.DateTime, nullable=False)
+    expires_at = db.Column(db.DateTime, nullable=False)
+
+
+class QuizQuestion(db.Model):
+    """One question of the quiz bank; ``options`` is a JSON list of strings."""
+    id = db.Column(db.Integer, primary_key=True)
+    topic = db.Column(db.String(50), nullable=False, default="General")
+    question = db.Column(db.String(500), nullable=False, unique=True)
+    options = db.Column(db.Text, nullable=False)
+    answer = db.Column(db.String(200), nullable=False)  # the correct option's text
+    active = db.Column(db.Boolean, default=True)
+
+
+class QuizReview(db.Model):
+    """Spaced-repetition state of one question for one user."""
+    user_id = db.Column(db.Integer, db.ForeignKey("user.id"), primary_key=True)
+    question_id = db.Column(db.Integer, db.ForeignKey("quiz_question.id"), primary_key=True)
+    box = db.Column(db.Integer, nullable=False, default=0)  # Leitner box, 0 = relearn
+    due_at = db.Column(db.Float, nullable=False)  # unix time
+    reps = db.Column(db.Integer, nullable=False, default=0)
+    lapses = db.Column(db.Integer, nullable=False, default=0)
+    answered_at = db.Column(db.DateTime, nullable=True)
+
+    __table_args__ = (
+        db.Index("ix_quiz_review_user_due", "user_id", "due_at"),
+        {"sqlite_with_rowid": False},
+    )
+
+
+class ProgressEvent(db.Model):
+    """One XP-awarding action, appended by backend.progress_engine.emit()."""
+    user_id = db.Column(db.Integer, db.ForeignKey("user.id"), primary_key=True)
+    seq = db.Column(db.Integer, primary_key=True)  # per user, from 1
+    kind = db.Column(db.String(20), nullable=False)  # task/study/quest/game/score
+    xp = db.Column(db.Integer, nullable=False, default=0)
+    value = db.Column(db.Integer, nullable=False, default=0)  # e.g. study minutes
+    detail = db.Column(db.String(50), nullable=True)  # e.g. which game
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    __table_args__ = {"sqlite_with_rowid": False}
+
+
+class ProgressState(db.Model):
+    """Streaks, counters and milestones folded from a user's progress events."""
+    user_id = db.Column(db.Integer, db.ForeignKey("user.id"), primary_key=True)
+    seq = db.Column(db.Integer, nullable=False, default=0)  # last event folded in
+    version = db.Column(db.String(20), nullable=False)  # rules.RULES_VERSION
+    state = db.Column(db.Text, nullable=False)  # JSON
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+
+class XpHistory(db.Model):
+    """XP earned per UTC day in one month, kept by backend.progress_engine.history."""
+    user_id = db.Column(db.Integer, db.ForeignKey("user.id"), primary_key=True)
+    month = db.Column(db.Integer, primary_key=True)  # year * 100 + month, e.g. 202509
+    # 31 little-endian int64s, day 1 first (248 bytes). Rows from before the
+    # slots were widened hold 31 int32s (124 bytes); they are read as such
+    # and rewritten as int64s on their next award.
+    days = db.Column(db.LargeBinary, nullable=False)
+    total = db.Column(db.Integer, nullable=False, default=0)
+
+    __table_args__ = {"sqlite_with_rowid": False}
+
+
+class Job(db.Model):
+    """A unit of deferred work for backend.jobs; ``key`` dedupes enqueues."""
+    id = db.Column(db.Integer, primary_key=True)
+    key = db.Column(db.String(128), unique=True, nullable=True)
+    name = db.Column(db.String(100), nullable=False)
+    args = db.Column(db.Text, nullable=False, default="[]")  # JSON [args, kwargs]
+    priority = db.Column(db.Integer, nullable=False, default=0)  # lower runs first
+    status = db.Column(db.String(10), nullable=False, default="queued")  # queued/running/done/failed
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    max_attempts = db.Column(db.Integer, nullable=False, default=5)
+    # Unix time the job may next be claimed: its run_at while queued, the
+    # end of the worker's lease while running.
+    available_at = db.Column(db.Float, nullable=False)
+    locked_by = db.Column(db.String(64), nullable=True)
+    last_error = db.Column(db.Text, nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    finished_at = db.Column(db.DateTime, nullable=True)
+
+    __table_args__ = (
+        db.Index("ix_job_ready", "priority", "available_at",
+                 sqlite_where=db.text("status IN ('queued', 'running')")),
+    )
+
+
+class UserDirectory(db.Model):
+    """Main-database username -> id map that allocates user ids when sharded."""
+    id = db.Column(db.Integer, primary_key=True)
+    username = db.Column(db.String(100), nullable=False, unique=True)
+
+
+@login_manager.user_loader
+def load_user(user_id):
+    use_shard_for(user_id)
+    return db.session.get(User, int(user_id))
@@ -0,0 +1,100 @@
+# backend/passwords.py
+"""Password hashing on a small bounded thread pool.
+
+scrypt and pbkdf2 run inside OpenSSL with the GIL released, so a thread pool
+gives real parallelism without a process pool's fork and pickling costs. The
+pool is per process and has ``PASSWORD_POOL_WORKERS`` threads. At most
+``PASSWORD_POOL_QUEUE`` more calls may wait for a thread. Beyond that, callers
+wait up to ``PASSWORD_POOL_TIMEOUT`` seconds and then get ``PasswordBusy``,
+so a login storm is turned away early. It does not pile up scrypt buffers.
+
+Hashes use Werkzeug's ``method$salt$hash`` format, so existing rows keep
+working. ``verify()`` reports when a stored hash was made with other
+parameters than ``PASSWORD_METHOD``, so login can rehash it.
+"""
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import current_app
+from werkzeug.security import DEFAULT_PBKDF2_ITERATIONS, check_password_hash, generate_password_hash
+
+
+class PasswordBusy(Exception):
+    """Every hashing slot is taken; the caller should retry later."""
+
+
+_lock = threading.Lock()
+_pool = None
+_slots = None
+_pid = None
+_prefixes = {}
+
+
+def _executor():
+    """The process's pool, created lazily and recreated after a fork."""
+    global _pool, _slots, _pid
+    if _pid != os.getpid():
+        with _lock:
+            if _pid != os.getpid():
+                config = current_app.config
+                workers = config.get("PASSWORD_POOL_WORKERS", 2)
+                _pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password")
+                _slots = threading.BoundedSemaphore(workers + config.get("PASSWORD_POOL_QUEUE", 8))
+                _pid = os.getpid()
+    return _pool, _slots
+
+
+def _run(fn, *args):
+    pool, slots = _executor()
+    if not slots.acquire(timeout=current_app.config.get("PASSWORD_POOL_TIMEOUT", 2.0)):
+        raise PasswordBusy()
+    try:
+        future = pool.submit(fn, *args)
+    except BaseException:
+        slots.release()
+        raise
+    future.add_done_callback(lambda _: slots.release())
+    return future.result()
+
+
+def _method():
+    return current_app.config.get("PASSWORD_METHOD", "scrypt")
+
+
+def _prefix(method):
+    """The ``method`` part Werkzeug writes for ``method``, defaults filled in."""
+    prefix = _prefixes.get(method)
+    if prefix is None:
+        # "scrypt" is stored as "scrypt:32768:8:1"; these are Werkzeug 3.0's
+        # defaults (see werkzeug.security._hash_internal).
+        name, *args = method.split(":")
+        if name == "scrypt" and not args:
+            prefix = "scrypt:32768:8:1"
+        elif name == "pbkdf2" and len(args) < 2:
+            prefix = f"pbkdf2:{args[0] if args else 'sha256'}:{DEFAULT_PBKDF2_ITERATIONS}"
+        else:
+            prefix = method
+        _prefixes[method] = prefix
+    return prefix
+
+
+def hash_password(password):
+    """Hash ``password`` with the configured method on the pool."""
+    method = _method()
+    return _run(generate_password_hash, password, method, current_app.config.get("PASSWORD_SALT_LENGTH", 16))
+
+
+def needs_rehash(stored):
+    return stored.split("$", 1)[0] != _prefix(_method())
+
+
+def verify(stored, password):
+    """``(ok, new_hash)``; ``new_hash`` is set when the parameters changed."""
+    if not stored:
+        return False, None
+    if not _run(check_password_hash, stored, password):
+        return False, None
+    if needs_rehash(stored):
+        return True, hash_password(password)
+    return True, None
@@ -0,0 +1,157 @@
+# backend/prefork.py
+"""Warm the app once in the gunicorn master, before workers fork.
+
+With ``preload_app`` (see gunicorn.conf.py) the master imports the app and
+calls ``preload()``. That imports the modules request handlers would load
+lazily, compiles every Jinja template, builds the read-only catalogs (quest
+templates, quiz bank, doc index), and then runs ``gc.freeze()``. Workers
+start with all of it already in memory, shared copy-on-write, and the
+frozen objects are never touched by the children's collector, so those
+pages stay shared.
+
+``after_fork()`` runs in each worker. It drops the database connections
+inherited from the master and reseeds ``random``. Caches that are keyed by
+process (password pool, rate limiter) already rebuild themselves after a
+fork.
+
+``memory_usage()`` reads RSS/PSS/USS from /proc for the startup report.
+"""
+import gc
+import random
+import time
+from importlib import import_module
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from backend.extensions import db
+
+
+def _import_modules(names):
+    loaded, missing = [], []
+    for name in names:
+        try:
+            import_module(name)
+        except ImportError:
+            missing.append(name)
+        else:
+            loaded.append(name)
+    return loaded, missing
+
+
+def compile_templates(app):
+    """Load every template into the Jinja cache; returns (compiled, failed names)."""
+    env = app.jinja_env
+    names = env.list_templates(extensions=("html",))
+    # Keep every compiled template: the default LRU holds 400.
+    if env.cache is not None and getattr(env.cache, "capacity", len(names)) < len(names):
+        env.cache = {}
+    compiled, failed = 0, []
+    for name in names:
+        try:
+            env.get_template(name)
+        except Exception:
+            failed.append(name)
+        else:
+            compiled += 1
+    return compiled, failed
+
+
+def build_catalogs():
+    """Build the per-process read-only snapshots; returns the names built."""
+    from backend.docindex import get_index
+    from backend.quest_engine import get_catalog, get_pools
+    from backend.quiz import get_bank
+
+    built = []
+    get_pools()
+    built.append("quest pools")
+    for name, build in (("quest catalog", get_catalog), ("quiz bank", get_bank)):
+        try:
+            build()
+        except SQLAlchemyError:
+            # No schema yet (init-db not run); workers build it on first use.
+            db.session.rollback()
+        else:
+            built.append(name)
+    if get_index() is not None:
+        built.append("doc index")
+    db.session.remove()
+    return built
+
+
+def preload(app):
+    """Warm ``app`` for forking and freeze the heap; returns a summary dict."""
+    started = time.perf_counter()
+    loaded, missing = _import_modules(app.config.get("PRELOAD_MODULES", ()))
+    # Werkzeug builds the URL matcher on first bind; do it here once.
+    app.url_map.update()
+    compiled, failed = compile_templates(app)
+    with app.app_context():
+        catalogs = build_catalogs()
+        # Workers must not share the master's SQLite connections.
+        for engine in db.engines.values():
+            engine.dispose()
+    gc.collect()
+    gc.freeze()
+    return {
+        "seconds": time.perf_counter() - started,
+        "modules": loaded,
+        "missing_modules": missing,
+        "templates": compiled,
+        "failed_templates": failed,
+        "catalogs": catalogs,
+        "frozen_objects": gc.get_freeze_count(),
+    }
+
+
+def after_fork(app):
+    """Per-worker reset after a preloaded fork."""
+    with app.app_context():
+        # close=False: the pooled connections belong to the master.
+        for engine in db.engines.values():
+            engine.dispose(close=False)
+    random.seed()
+
+
+def memory_usage(pid="self"):
+    """``{"rss", "pss", "uss"}`` in KiB for ``pid`` (Linux /proc); {} elsewhere.
+
+    PSS splits shared pages between the processes mapping them and USS counts
+    only private ones, so they show what copy-on-write sharing saves.
+    """
+    fields = {}
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as fh:
+            for line in fh:
+                key, _, rest = line.partition(":")
+                parts = rest.split()
+                if parts and parts[-1] == "kB":
+                    fields[key] = int(parts[0])
+    except OSError:
+        return {}
+    return {
+        "rss": fields.get("Rss", 0),
+        "pss": fields.get("Pss", 0),
+        "uss": fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0),
+    }
+
+
+def describe(usage):
+    """``memory_usage()`` as a log-friendly string."""
+    if not usage:
+        return "memory n/a"
+    return ", ".join(f"{key.upper()} {value / 1024:.1f} MiB" for key, value in usage.items())
+
+
+def summary_lines(summary):
+    """Log lines for a ``preload()`` summary."""
+    lines = [
+        f"Preloaded in {summary['seconds'] * 1000:.0f} ms: {len(summary['modules'])} modules, "
+        f"{summary['templates']} templates, catalogs: {', '.join(summary['catalogs']) or 'none'}, "
+        f"{summary['frozen_objects']} objects frozen",
+    ]
+    if summary["failed_templates"]:
+        lines.append("Templates that failed to compile: " + ", ".join(summary["failed_templates"]))
+    if summary["missing_modules"]:
+        lines.append("Preload modules not installed: " + ", ".join(summary["missing_modules"]))
+    return lines
@@ -0,0 +1,106 @@
+# backend/progress.py
+import heapq
+
+from sqlalchemy import func, select
+
+from backend.extensions import db
+from backend.models import ActivityRollup, Quest, QuestCompletion, StudyLog, Task, TaskOccurrence, User
+from backend.sharding import scatter
+
+
+# ----------------- RANK/LEVEL/STATS UTIL -----------------
+def get_rank(points: int) -> str:
+    ranks = [
+        ("E", 00, 999),
+        ("E+", 1000, 1999),
+        ("E++", 2000, 2999),
+        ("D", 3000, 4999),
+        ("D+", 5000, 6999),
+        ("D++", 7000, 8999),
+        ("C", 9000, 11999),
+        ("C+", 12000, 14999),
+        ("C++", 15000, 17999),
+        ("B", 18000, 21999),
+        ("B+", 22000, 25999),
+        ("B++", 26000, 29999),
+        ("A", 30000, 34999),
+        ("A+", 35000, 39999),
+        ("A++", 40000, 44999),
+        ("S", 45000, 49999),
+        ("S+", 50000, 59999),
+        ("SS", 60000, 69999),
+        ("SS+", 70000, 79999),
+        ("SSS", 80000, 89999),
+        ("National Rank", 90000, 99999999),
+    ]
+    for rank, low, high in ranks:
+        if low <= points <= high:
+            return rank
+    return "Unranked"
+
+
+def get_level(points: int) -> int:
+    level = 1
+    thresholds = [50, 150, 300, 500, 750, 1050, 1400, 1800, 2250, 2750]
+    for i, threshold in enumerate(thresholds, start=1):
+        if points >= threshold:
+            level = i + 1
+    return level
+
+
+def activity_counts(user_id):
+    """Completed tasks/quests and study logs, archived rows included, in one query.
+
+    A recurring task counts once per completed occurrence, like the XP it
+    awards, and not again when its series ends.
+    """
+    def count(model, *conditions):
+        return select(func.count()).select_from(model).where(model.user_id == user_id, *conditions).scalar_subquery()
+
+    def archived(kind):
+        return (
+            select(func.coalesce(func.sum(ActivityRollup.count), 0))
+            .where(ActivityRollup.user_id == user_id, ActivityRollup.kind == kind)
+            .scalar_subquery()
+        )
+
+    row = db.session.execute(select(
+        (count(Task, Task.completed.is_(True), Task.rrule.is_(None))
+         + count(TaskOccurrence, TaskOccurrence.completed_at.is_not(None)) + archived("task")).label("tasks"),
+        (count(Quest, Quest.completed.is_(True)) + count(QuestCompletion) + archived("quest")).label("quests"),
+        (count(StudyLog) + archived("study_log")).label("study_logs"),
+    )).one()
+    return {"tasks": row.tasks, "quests": row.quests, "study_logs": row.study_logs}
+
+
+def calculate_stats(user, counts=None):
+    base = user.points or 0
+    # Simple derived stats — extend as you like
+    # Rows removed by the retention job still count through their rollups.
+    counts = counts or activity_counts(user.id)
+    completed_tasks = counts["tasks"]
+    completed_quests = counts["quests"]
+    completed_academics = counts["study_logs"]
+    return {
+        "strength": base // 10 + completed_tasks * 5,
+        "finance": base // 20 + completed_academics * 3,
+        "wisdom": base // 15 + completed_quests * 4,
+        "growth": (completed_tasks + completed_academics + completed_quests) * 7,
+        "mental": 50 + (base // 30),
+    }
+
+
+def leaderboard(limit=10):
+    """Top ``limit`` users by points; one query per shard, merged here."""
+    def top(session):
+        return session.execute(
+            select(User.id, User.username, User.points)
+            .order_by(User.points.desc(), User.id).limit(limit)
+        ).all()
+
+    rows = heapq.nsmallest(limit, (r for part in scatter(top) for r in part), key=lambda r: (-(r.points or 0), r.id))
+    return [
+        {"id": r.id, "username": r.username, "points": r.points or 0,
+         "level": get_level(r.points or 0), "rank": get_rank(r.points or 0)}
+        for r in rows
+    ]
@@ -0,0 +1,22 @@
+# backend/progress_engine/__init__.py
+from backend.progress_engine.events import STAT_EFFECTS, backfill, emit, load_state, replay
+from backend.progress_engine.history import DEFAULT_RANGE, RANGES
+from backend.progress_engine.history import rebuild as rebuild_xp_history
+from backend.progress_engine.history import series as xp_series
+from backend.progress_engine.rules import (
+    GAME,
+    KINDS,
+    MILESTONES,
+    QUEST,
+    RULES,
+    RULES_VERSION,
+    SCORE,
+    STUDY,
+    TASK,
+    Counter,
+    Milestone,
+    Streak,
+    fold,
+    initial_state,
+    view,
+)
@@ -0,0 +1,190 @@
+# backend/progress_engine/events.py
+"""Progress events: the append-only log and the per-user state folded from it.
+
+Every code path that awards XP calls ``emit(user, kind, xp, ...)`` inside
+its transaction. ``emit`` appends a ``progress_event`` row with the user's
+next ``seq`` and folds it into the one ``progress_state`` row. It also
+applies the event's stat effects to the user (a task adds strength, study
+adds wisdom) and adds its XP to that day's ``xp_history`` slot. Nothing
+rescans history, because each event touches one state row and one history
+row. ``emit`` claims the ``seq`` with an upsert before it reads anything, so
+its transaction holds SQLite's write lock from then on: a concurrent emit
+for the same user waits for it and then reads the state it committed,
+instead of claiming the same ``seq``.
+
+``replay(user_id)`` rebuilds a state from the log. It runs on its own when
+``RULES_VERSION`` changes. ``backfill(user_id)`` writes the log for
+activity recorded before events existed (``flask replay-progress --backfill``).
+"""
+import json
+from datetime import datetime
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from backend.extensions import db
+from backend.models import (
+    ActivityRollup,
+    GameResult,
+    ProgressEvent,
+    ProgressState,
+    Quest,
+    QuestCompletion,
+    StudyLog,
+    Task,
+    TaskOccurrence,
+)
+from backend.progress_engine import history as xp_history
+from backend.progress_engine.rules import GAME, KINDS, QUEST, RULES_VERSION, STUDY, TASK, fold, initial_state
+from backend.versioning import PROGRESS, bump
+
+# kind -> (user column, amount per event); applied by emit(), never by replay
+STAT_EFFECTS = {
+    TASK: ("strength", lambda event: 2),
+    STUDY: ("wisdom", lambda event: event.xp // 2),
+}
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _dumps(state):
+    return json.dumps(state, separators=(",", ":"))
+
+
+def _state_row(user_id):
+    row = db.session.get(ProgressState, user_id)
+    if row is not None and row.version != RULES_VERSION:
+        row = replay(user_id)
+    return row
+
+
+def _claim_seq(user_id):
+    """Increment ``user_id``'s state seq in the database (creating the row) and return it."""
+    table = ProgressState.__table__
+    stmt = sqlite_insert(table).values(user_id=user_id, seq=1, version=RULES_VERSION,
+                                       state=_dumps(initial_state()), updated_at=datetime.utcnow())
+    stmt = stmt.on_conflict_do_update(index_elements=["user_id"], set_={"seq": table.c.seq + 1})
+    return db.session.execute(stmt.returning(table.c.seq)).scalar_one()
+
+
+def emit(user, kind, xp=0, value=0, detail=None, now=None):
+    """Record an XP-awarding action for ``user``. Does not commit.
+
+    Returns the keys of milestones this event unlocked.
+    """
+    if kind not in KINDS:
+        raise ValueError(f"Unknown progress event kind: {kind}")
+    seq = _claim_seq(user.id)
+    # Read after the claim: the row may have changed since it was last loaded.
+    row = db.session.get(ProgressState, user.id, populate_existing=True)
+    if row.version != RULES_VERSION:
+        row = replay(user.id)
+    event = ProgressEvent(user_id=user.id, seq=seq, kind=kind, xp=xp or 0, value=value or 0,
+                          detail=detail, created_at=now or datetime.utcnow())
+    db.session.add(event)
+
+    state = json.loads(row.state)
+    unlocked = fold(state, event)
+    row.state = _dumps(state)
+    row.seq = event.seq
+    row.updated_at = event.created_at
+
+    xp_history.record(user.id, event.created_at, event.xp)
+
+    effect = STAT_EFFECTS.get(kind)
+    if effect is not None:
+        column, amount = effect
+        setattr(user, column, (getattr(user, column) or 0) + amount(event))
+    bump(user.id, PROGRESS)
+    return unlocked
+
+
+def load_state(user_id):
+    """The folded state of ``user_id`` (replayed first if the rules changed)."""
+    row = _state_row(user_id)
+    return json.loads(row.state) if row is not None else initial_state()
+
+
+def replay(user_id, batch_size=1000):
+    """Rebuild ``user_id``'s state from its events; returns the state row. Does not commit."""
+    state, seq = initial_state(), 0
+    result = db.session.execute(
+        select(ProgressEvent.seq, ProgressEvent.kind, ProgressEvent.xp, ProgressEvent.value, ProgressEvent.created_at)
+        .where(ProgressEvent.user_id == user_id).order_by(ProgressEvent.seq),
+        execution_options={"yield_per": batch_size},
+    )
+    for event in result:
+        fold(state, event)
+        seq = event.seq
+    row = db.session.get(ProgressState, user_id)
+    if row is None:
+        row = ProgressState(user_id=user_id)
+        db.session.add(row)
+    row.seq, row.version, row.state, row.updated_at = seq, RULES_VERSION, _dumps(state), datetime.utcnow()
+    bump(user_id, PROGRESS)
+    return row
+
+
+def _history(user_id):
+    """``(created_at, kind, xp, value, detail)`` for activity stored before events existed."""
+    from backend.quest_engine import get_catalog
+
+    templates = get_catalog().templates
+
+    def template_xp(template_id, fallback=0):
+        template = templates.get(template_id)
+        return (template.xp if template else fallback) or 0
+
+    for created_at, in db.session.execute(select(Task.created_at).where(
+            Task.user_id == user_id, Task.completed.is_(True), Task.rrule.is_(None))):
+        yield created_at, TASK, 10, 0, None
+    for completed_at, in db.session.execute(select(TaskOccurrence.completed_at).where(
+            TaskOccurrence.user_id == user_id, TaskOccurrence.completed_at.is_not(None))):
+        yield completed_at, TASK, 10, 0, None
+    for created_at, duration in db.session.execute(select(StudyLog.created_at, StudyLog.duration).where(
+            StudyLog.user_id == user_id)):
+        duration = duration or 0
+        yield created_at, STUDY, max(1, duration // 5) if duration > 0 else 1, duration, None
+    for created_at, template_id, xp in db.session.execute(select(Quest.created_at, Quest.template_id, Quest.xp).where(
+            Quest.user_id == user_id, Quest.completed.is_(True))):
+        yield created_at, QUEST, template_xp(template_id, xp), 0, None
+    for period_start, template_id in db.session.execute(select(
+            QuestCompletion.period_start, QuestCompletion.template_id).where(QuestCompletion.user_id == user_id)):
+        yield datetime.combine(period_start, datetime.min.time()), QUEST, template_xp(template_id), 0, None
+    for created_at, xp, game in db.session.execute(select(GameResult.created_at, GameResult.xp, GameResult.game).where(
+            GameResult.user_id == user_id)):
+        yield created_at, GAME, xp, 0, game
+    # Rows the retention job folded into daily rollups: spread each day evenly.
+    for kind, day, count, minutes, xp in db.session.execute(select(
+            ActivityRollup.kind, ActivityRollup.day, ActivityRollup.count, ActivityRollup.minutes, ActivityRollup.xp
+    ).where(ActivityRollup.user_id == user_id, ActivityRollup.kind.in_(("task", "study_log", "quest")))):
+        at = datetime.combine(day, datetime.min.time())
+        for _ in range(count or 0):
+            if kind == "task":
+                yield at, TASK, 10, 0, None
+            elif kind == "study_log":
+                each = (minutes or 0) // count
+                yield at, STUDY, max(1, each // 5) if each > 0 else 1, each, None
+            else:
+                yield at, QUEST, (xp or 0) // count, 0, None
+
+
+def backfill(user_id):
+    """Write events for ``user_id``'s past activity if it has none yet; returns how many.
+
+    Update-score awards left no trace and cannot be recovered. Stat effects
+    are not applied again; the state and XP history are rebuilt. Does not
+    commit.
+    """
+    if db.session.execute(select(func.count()).where(ProgressEvent.user_id == user_id)).scalar():
+        return 0
+    history = sorted(_history(user_id), key=lambda item: item[0] or _EPOCH)
+    if history:
+        db.session.execute(ProgressEvent.__table__.insert(), [
+            {"user_id": user_id, "seq": seq, "kind": kind, "xp": xp or 0, "value": value or 0,
+             "detail": detail, "created_at": created_at or _EPOCH}
+            for seq, (created_at, kind, xp, value, detail) in enumerate(history, start=1)
+        ])
+    replay(user_id)
+    xp_history.rebuild(user_id)
+    return len(history)
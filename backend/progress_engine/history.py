@@ -0,0 +1,131 @@
+# backend/progress_engine/history.py
+"""XP per day for progress charts, packed one row per user and month.
+
+The progress event log is the XP ledger. ``emit()`` also adds each award
+to the user's ``xp_history`` row for that month: 31 little-endian int64 day
+slots plus the month's total. Recording an award rewrites eight bytes of one
+row, however long the log is. Only awards count: events with no or negative
+XP leave the history alone. A chart is one primary-key range read of at
+most one row per month; the day slots are then summed into days, weeks or
+months.
+
+Rows written before the slots were widened hold 31 int32s; they are read as
+they are and widened the next time an award is recorded in them.
+``rebuild(user_id)`` recomputes the rows from the log; ``flask
+replay-progress`` runs it.
+"""
+import struct
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import delete, func, select
+
+from backend.extensions import db
+from backend.models import ProgressEvent, XpHistory
+
+_SLOT = struct.Struct("<q")
+_MONTH = struct.Struct("<31q")
+_MONTH_INT32 = struct.Struct("<31i")
+_EMPTY = bytes(_MONTH.size)
+
+# ?range= -> (days back including today, or None for everything; bucket size)
+RANGES = {
+    "7d": (7, "day"),
+    "30d": (30, "day"),
+    "90d": (90, "day"),
+    "1y": (365, "week"),
+    "all": (None, "month"),
+}
+DEFAULT_RANGE = "30d"
+
+
+def month_key(day):
+    return day.year * 100 + day.month
+
+
+def _month_start(key):
+    return date(key // 100, key % 100, 1)
+
+
+def _next_month(day):
+    return date(day.year + day.month // 12, day.month % 12 + 1, 1)
+
+
+def _unpack(days):
+    return (_MONTH_INT32 if len(days) == _MONTH_INT32.size else _MONTH).unpack(days)
+
+
+def record(user_id, at, xp):
+    """Add ``xp`` to ``user_id``'s slot for the UTC day of ``at``. Does not commit."""
+    if not xp or xp < 0:
+        return
+    key = month_key(at)
+    row = db.session.get(XpHistory, (user_id, key))
+    if row is None:
+        row = XpHistory(user_id=user_id, month=key, days=_EMPTY, total=0)
+        db.session.add(row)
+    days = bytearray(row.days if len(row.days) == _MONTH.size else _MONTH.pack(*_unpack(row.days)))
+    offset = (at.day - 1) * _SLOT.size
+    _SLOT.pack_into(days, offset, _SLOT.unpack_from(days, offset)[0] + xp)
+    row.days = bytes(days)
+    row.total = (row.total or 0) + xp
+
+
+def series(user_id, range_name=DEFAULT_RANGE, today=None):
+    """XP per bucket over ``RANGES[range_name]`` up to ``today`` (UTC).
+
+    Returns ``{"range", "step", "start", "end", "labels", "xp", "total"}``;
+    ``labels`` are the ISO dates the buckets start on (weeks start on Monday).
+    """
+    days_back, step = RANGES[range_name]
+    today = today or datetime.utcnow().date()
+    start = today - timedelta(days=days_back - 1) if days_back else None
+    if step == "week":
+        start -= timedelta(days=start.weekday())
+
+    query = select(XpHistory.month, XpHistory.days, XpHistory.total).where(
+        XpHistory.user_id == user_id, XpHistory.month <= month_key(today))
+    if start is not None:
+        query = query.where(XpHistory.month >= month_key(start))
+    rows = db.session.execute(query.order_by(XpHistory.month)).all()
+    if start is None:
+        start = _month_start(rows[0].month) if rows else today.replace(day=1)
+
+    labels, values = [], []
+    if step == "month":
+        totals = {row.month: row.total for row in rows}
+        month = start
+        while month <= today:
+            labels.append(month.isoformat())
+            values.append(totals.get(month_key(month), 0))
+            month = _next_month(month)
+    else:
+        months = {row.month: _unpack(row.days) for row in rows}
+        width = 7 if step == "week" else 1
+        day = start
+        while day <= today:
+            if (day - start).days % width == 0:
+                labels.append(day.isoformat())
+                values.append(0)
+            slots = months.get(month_key(day))
+            if slots is not None:
+                values[-1] += slots[day.day - 1]
+            day += timedelta(days=1)
+    return {"range": range_name, "step": step, "start": start.isoformat(), "end": today.isoformat(),
+            "labels": labels, "xp": values, "total": sum(values)}
+
+
+def rebuild(user_id):
+    """Recompute ``user_id``'s rows from its progress events; returns months written. Does not commit."""
+    db.session.execute(delete(XpHistory).where(XpHistory.user_id == user_id))
+    day = func.date(ProgressEvent.created_at)
+    months = {}
+    for text, xp in db.session.execute(select(day, func.sum(ProgressEvent.xp)).where(
+            ProgressEvent.user_id == user_id, ProgressEvent.xp > 0).group_by(day)):
+        when = date.fromisoformat(text)
+        months.setdefault(month_key(when), [0] * 31)[when.day - 1] += xp
+    if months:
+        db.session.execute(XpHistory.__table__.insert(), [
+            {"user_id": user_id, "month": key, "days": _MONTH.pack(*slots), "total": sum(slots)}
+            for key, slots in months.items()
+        ])
+    return len(months)
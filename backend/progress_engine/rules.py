@@ -0,0 +1,161 @@
+# backend/progress_engine/rules.py
+"""Rule evaluators folded over progress events.
+
+A user's progress state is a plain dict, ``{rule key: value}``, plus the
+milestones unlocked so far. ``fold()`` applies one event in O(1): every
+rule interested in the event's kind updates its own slot, and only the
+milestones that read a changed slot are checked.
+
+Adding a rule or milestone (or changing one) changes ``RULES_VERSION``.
+States saved under another version are rebuilt by replaying the user's
+events once (``backend.progress_engine.events.replay``).
+"""
+import hashlib
+from datetime import datetime
+
+# Event kinds
+TASK = "task"
+STUDY = "study"
+QUEST = "quest"
+GAME = "game"
+SCORE = "score"
+KINDS = (TASK, STUDY, QUEST, GAME, SCORE)
+
+
+class Counter:
+    """Sum of ``field`` ("xp", "value", or None to count events) over ``kinds``."""
+
+    def __init__(self, key, kinds=KINDS, field=None):
+        self.key = key
+        self.kinds = frozenset(kinds)
+        self.field = field
+
+    def initial(self):
+        return 0
+
+    def apply(self, value, event, day):
+        return value + (1 if self.field is None else (getattr(event, self.field) or 0))
+
+    def signature(self):
+        return ("counter", self.key, sorted(self.kinds), self.field)
+
+
+class Streak:
+    """Consecutive days with at least one event of ``kinds``: ``[current, best, last day]``.
+
+    Days are ordinals of the event's UTC date, like every timestamp here.
+    """
+
+    def __init__(self, key, kinds=KINDS):
+        self.key = key
+        self.kinds = frozenset(kinds)
+
+    def initial(self):
+        return [0, 0, 0]
+
+    def apply(self, value, event, day):
+        current, best, last = value
+        # Same day, or a late event for a day already past: nothing changes.
+        if day <= last:
+            return value
+        current = current + 1 if day == last + 1 else 1
+        return [current, max(best, current), day]
+
+    def signature(self):
+        return ("streak", self.key, sorted(self.kinds))
+
+
+class Milestone:
+    """Unlocked once ``metric(state)`` reaches ``threshold``; ``metric`` reads ``rule``'s slot."""
+
+    def __init__(self, key, title, description, rule, threshold, index=None):
+        self.key = key
+        self.title = title
+        self.description = description
+        self.rule = rule
+        self.threshold = threshold
+        self.index = index
+
+    def progress(self, state):
+        value = state[self.rule]
+        return value[self.index] if self.index is not None else value
+
+    def signature(self):
+        return ("milestone", self.key, self.rule, self.index, self.threshold)
+
+
+RULES = [
+    Counter("xp", field="xp"),
+    Counter("tasks", kinds=[TASK]),
+    Counter("study_minutes", kinds=[STUDY], field="value"),
+    Counter("quests", kinds=[QUEST]),
+    Counter("games", kinds=[GAME]),
+    Streak("active_streak"),
+    Streak("study_streak", kinds=[STUDY]),
+]
+
+MILESTONES = [
+    Milestone("first_task", "First step", "Complete your first task.", "tasks", 1),
+    Milestone("tasks_50", "Task master", "Complete 50 tasks.", "tasks", 50),
+    Milestone("study_10h", "Bookworm", "Log 10 hours of study.", "study_minutes", 600),
+    Milestone("quests_25", "Adventurer", "Complete 25 quests.", "quests", 25),
+    Milestone("games_20", "Player", "Finish 20 mini-games.", "games", 20),
+    Milestone("xp_1000", "Rising star", "Earn 1,000 XP.", "xp", 1000),
+    Milestone("streak_3", "On a roll", "Be active 3 days in a row.", "active_streak", 3, index=1),
+    Milestone("streak_7", "Week warrior", "Be active 7 days in a row.", "active_streak", 7, index=1),
+    Milestone("streak_30", "Unstoppable", "Be active 30 days in a row.", "active_streak", 30, index=1),
+    Milestone("study_streak_5", "Scholar", "Study 5 days in a row.", "study_streak", 5, index=1),
+]
+
+RULES_VERSION = hashlib.blake2b(
+    repr([r.signature() for r in RULES] + [m.signature() for m in MILESTONES]).encode(), digest_size=6
+).hexdigest()
+
+# event kind -> rules that read it; rule key -> milestones that read it
+_RULES_BY_KIND = {kind: [r for r in RULES if kind in r.kinds] for kind in KINDS}
+_MILESTONES_BY_RULE = {}
+for _m in MILESTONES:
+    _MILESTONES_BY_RULE.setdefault(_m.rule, []).append(_m)
+
+
+def initial_state():
+    state = {rule.key: rule.initial() for rule in RULES}
+    state["unlocked"] = {}
+    return state
+
+
+def fold(state, event):
+    """Apply ``event`` to ``state`` in place; returns the keys of newly unlocked milestones."""
+    day = event.created_at.toordinal()
+    unlocked = []
+    for rule in _RULES_BY_KIND.get(event.kind, ()):
+        before = state[rule.key]
+        after = rule.apply(before, event, day)
+        if after == before:
+            continue
+        state[rule.key] = after
+        for milestone in _MILESTONES_BY_RULE.get(rule.key, ()):
+            if milestone.key not in state["unlocked"] and milestone.progress(state) >= milestone.threshold:
+                state["unlocked"][milestone.key] = event.created_at.date().isoformat()
+                unlocked.append(milestone.key)
+    return unlocked
+
+
+def view(state, today=None):
+    """The client form of ``state``: counters, live streaks and every milestone."""
+    today = (today or datetime.utcnow().date()).toordinal()
+    streaks = {}
+    for rule in RULES:
+        if isinstance(rule, Streak):
+            current, best, last = state[rule.key]
+            # A streak survives until the end of the day after its last event.
+            streaks[rule.key] = {"current": current if today - last <= 1 else 0, "best": best}
+    return {
+        "counters": {r.key: state[r.key] for r in RULES if isinstance(r, Counter)},
+        "streaks": streaks,
+        "milestones": [
+            {"key": m.key, "title": m.title, "description": m.description, "threshold": m.threshold,
+             "progress": min(m.progress(state), m.threshold), "unlocked_on": state["unlocked"].get(m.key)}
+            for m in MILESTONES
+        ],
+    }
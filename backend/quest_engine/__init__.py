@@ -0,0 +1,28 @@
+# backend/quest_engine/__init__.py
+from backend.quest_engine.catalog import (
+    CatalogSnapshot,
+    get_catalog,
+    invalidate_catalog,
+    link_legacy_quests,
+    sync_templates,
+)
+from backend.quest_engine.derived import (
+    assigned_templates,
+    complete_derived_quest,
+    get_derived_quests,
+    migrate_stored_quests,
+)
+from backend.quest_engine.engine import (
+    complete_user_quest,
+    generate_quests_for_user,
+    get_pools,
+    get_user_quests,
+    quest_view,
+)
+from backend.quest_engine.periods import COUNTS, PERIODS, REGEN, period_start
+from backend.quest_engine.sources import (
+    FilePoolSource,
+    ModulePoolSource,
+    TablePoolSource,
+    load_pool_source,
+)
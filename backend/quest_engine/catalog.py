@@ -0,0 +1,176 @@
+# backend/quest_engine/catalog.py
+"""Quest templates: the ``quest_template`` table and its in-memory snapshot.
+
+Every worker keeps one immutable ``CatalogSnapshot``. It is rebuilt only when
+the ``catalog_version`` row for "quest" changes, and that row is checked at
+most once per ``QUEST_CATALOG_TTL`` seconds, so listing quests normally costs
+no catalog queries at all.
+"""
+import time
+from collections import namedtuple
+from types import MappingProxyType
+
+from flask import current_app
+from sqlalchemy import text
+
+from backend.extensions import db
+from backend.models import CatalogVersion, QuestTemplate
+
+CATALOG_NAME = "quest"
+
+# Personalized daily quests picked by BMI; always part of the catalog.
+BMI_POOL = [
+    {"title": "Standard Exercise", "category": "Physical", "type": "daily", "difficulty": "Medium", "xp": 10},
+    {"title": "Light Workout", "category": "Physical", "type": "daily", "difficulty": "Medium", "xp": 15},
+    {"title": "Moderate Cardio", "category": "Physical", "type": "daily", "difficulty": "Medium", "xp": 20},
+]
+
+
+def bmi_title(user):
+    """Title of the user's BMI_POOL quest, or None without body data."""
+    if not (user.weight_kg and user.height_cm):
+        return None
+    bmi = user.weight_kg / ((user.height_cm / 100) ** 2)
+    if bmi < 18.5:
+        return "Light Workout"
+    if bmi > 25:
+        return "Moderate Cardio"
+    return "Standard Exercise"
+
+
+TemplateEntry = namedtuple("TemplateEntry", "id pool title category type difficulty xp")
+
+
+class CatalogSnapshot:
+    """Read-only view of the active quest templates at one catalog version."""
+
+    __slots__ = ("version", "templates", "pools")
+
+    def __init__(self, version, entries, active_ids):
+        self.version = version
+        # Inactive templates stay resolvable so existing quests still render.
+        self.templates = MappingProxyType({e.id: e for e in entries})
+        pools = {}
+        for e in entries:
+            if e.id in active_ids:
+                pools.setdefault(e.pool, []).append(e)
+        self.pools = MappingProxyType({name: tuple(items) for name, items in pools.items()})
+
+    def find(self, pool, title):
+        for entry in self.pools.get(pool, ()):
+            if entry.title == title:
+                return entry
+        return None
+
+
+_snapshot = None
+_checked_at = 0.0
+
+
+def _current_version():
+    row = db.session.get(CatalogVersion, CATALOG_NAME)
+    return row.version if row else 0
+
+
+def _load_snapshot(version):
+    rows = QuestTemplate.query.with_entities(
+        QuestTemplate.id, QuestTemplate.pool, QuestTemplate.title, QuestTemplate.category,
+        QuestTemplate.type, QuestTemplate.difficulty, QuestTemplate.xp, QuestTemplate.active,
+    ).order_by(QuestTemplate.id).all()
+    entries = [TemplateEntry(*row[:7]) for row in rows]
+    active_ids = {row.id for row in rows if row.active}
+    return CatalogSnapshot(version, entries, active_ids)
+
+
+def get_catalog():
+    """Return the current snapshot, reloading it if the version moved."""
+    global _snapshot, _checked_at
+    now = time.monotonic()
+    if _snapshot is not None and now - _checked_at < current_app.config.get("QUEST_CATALOG_TTL", 5):
+        return _snapshot
+    version = _current_version()
+    if _snapshot is None or _snapshot.version != version:
+        _snapshot = _load_snapshot(version)
+    _checked_at = now
+    return _snapshot
+
+
+def invalidate_catalog():
+    """Force the next get_catalog() call in this worker to recheck the version."""
+    global _checked_at
+    _checked_at = 0.0
+
+
+def bump_version():
+    row = db.session.get(CatalogVersion, CATALOG_NAME)
+    if row is None:
+        row = CatalogVersion(name=CATALOG_NAME, version=0)
+        db.session.add(row)
+    row.version += 1
+    return row.version
+
+
+def sync_templates(pools, prune=False):
+    """Upsert ``pools`` into quest_template and bump the catalog version.
+
+    Templates missing from ``pools`` are deactivated when ``prune`` is set;
+    they are never deleted because generated quests still reference them.
+    Returns ``(added, updated, deactivated)``.
+    """
+    pools = dict(pools)
+    pools["bmi"] = BMI_POOL
+    existing = {(t.pool, t.title): t for t in QuestTemplate.query.all()}
+    seen = set()
+    added = updated = deactivated = 0
+    for pool, items in pools.items():
+        for item in items:
+            key = (pool, item["title"])
+            if key in seen:
+                continue
+            seen.add(key)
+            values = {
+                "category": item.get("category", "General"),
+                "type": item.get("type", pool),
+                "difficulty": item.get("difficulty", "Medium"),
+                "xp": item.get("xp", 10),
+                "active": True,
+            }
+            template = existing.get(key)
+            if template is None:
+                db.session.add(QuestTemplate(pool=pool, title=item["title"], **values))
+                added += 1
+            elif any(getattr(template, k) != v for k, v in values.items()):
+                for k, v in values.items():
+                    setattr(template, k, v)
+                updated += 1
+    if prune:
+        for key, template in existing.items():
+            if key not in seen and template.active:
+                template.active = False
+                deactivated += 1
+    if added or updated or deactivated:
+        bump_version()
+    db.session.commit()
+    invalidate_catalog()
+    return added, updated, deactivated
+
+
+def link_legacy_quests():
+    """Point denormalized quest rows at their template and drop the copies.
+
+    Legacy rows only ever exist in the main database, next to quest_template.
+    """
+    bind = {"bind": db.engine}
+    db.session.execute(text(
+        "UPDATE quest SET template_id = ("
+        " SELECT t.id FROM quest_template t"
+        " WHERE t.title = quest.title AND t.type = quest.type AND t.xp = quest.xp"
+        " ORDER BY t.id LIMIT 1)"
+        " WHERE template_id IS NULL AND title IS NOT NULL"
+    ), bind_arguments=bind)
+    result = db.session.execute(text(
+        "UPDATE quest SET title = NULL, category = NULL, difficulty = NULL, xp = NULL"
+        " WHERE template_id IS NOT NULL AND title IS NOT NULL"
+    ), bind_arguments=bind)
+    db.session.commit()
+    return result.rowcount
@@ -0,0 +1,182 @@
+# backend/quest_engine/default_pools.py
+# Built-in quest catalog. Loaded through ModulePoolSource on first use, so
+# workers that never serve a quest page do not pay for building it.
+
+DEFAULT_POOLS = {
+    "daily": [
+        # Academics / Mental / Physical / Financial
+        {"title": "Read 20 pages of a book", "category": "Academics", "type": "daily", "difficulty": "Easy", "xp": 15},
+        {"title": "Practice coding for 30 minutes", "category": "Academics", "type": "daily", "difficulty": "Medium", "xp": 20},
+        {"title": "Meditate for 10 minutes", "category": "Mental", "type": "daily", "difficulty": "Easy", "xp": 10},
+        {"title": "Do 20 push-ups", "category": "Physical", "type": "daily", "difficulty": "Easy", "xp": 15},
+        {"title": "Perform 10 pull-ups", "category": "Physical", "type": "daily", "difficulty": "Medium", "xp": 25},
+        {"title": "Solve 3 logic puzzles", "category": "Mental", "type": "daily", "difficulty": "Medium", "xp": 20},
+        {"title": "Spend 20 minutes learning finance basics", "category": "Financial", "type": "daily", "difficulty": "Easy", "xp": 15},
+        {"title": "Write down 3 business ideas", "category": "Financial", "type": "daily", "difficulty": "Medium", "xp": 20},
+        # Add 42 more daily quests
+        {"title": "Read 1 chapter of a book daily", "category": "Academics", "type": "weekly", "difficulty": "Medium", "xp": 50},
+    {"title": "Complete 3 coding exercises", "category": "Academics", "type": "weekly", "difficulty": "Medium", "xp": 50},
+    {"title": "Meditate for 20 minutes total this week", "category": "Mental", "type": "weekly", "difficulty": "Easy", "xp": 40},
+    {"title": "Do 100 push-ups total this week", "category": "Physical", "type": "weekly", "difficulty": "Medium", "xp": 60},
+    {"title": "Attend 1 online workshop", "category": "Academics", "type": "weekly", "difficulty": "Medium", "xp": 50},
+    {"title": "Solve 5 Sudoku puzzles", "category": "Mental", "type": "weekly", "difficulty": "Medium", "xp": 50},
+    {"title": "Run or walk 10 km total this week", "category": "Physical", "type": "weekly", "difficulty": "Medium", "xp": 60},
+    {"title": "Track all expenses for the week", "category": "Financial", "type": "weekly", "difficulty": "Medium", "xp": 50},
+    {"title": "Plan next week’s schedule", "category": "Academics", "type": "weekly", "difficulty": "Easy", "xp": 40},
+    {"title": "Learn 5 new logical reasoning techniques", "category": "Mental", "type": "weekly", "difficulty": "Medium", "xp": 50},
+    {"title": "Practice MMA or self-defense 2 times", "category": "Physical", "type": "weekly", "difficulty": "Medium", "xp": 60},
+    {"title": "Read an article on financial education", "category": "Financial", "type": "weekly", "difficulty": "Easy", "xp": 40},
+    {"title": "Complete a mini coding project", "category": "Academics", "type": "weekly", "difficulty": "Hard", "xp": 70},
+    {"title": "Do 50 burpees total this week", "category": "Physical", "type": "weekly", "difficulty": "Medium", "xp": 60},
+    {"title": "Solve a weekly crossword puzzle", "category": "Mental", "type": "weekly", "difficulty": "Medium", "xp": 50},
+    {"title": "Write a reflection journal for 3 days", "category": "Mental", "type": "weekly", "difficulty": "Easy", "xp": 40},
+    {"title": "Try 1 new side hustle idea", "category": "Financial", "type": "weekly", "difficulty": "Medium", "xp": 50},
+    {"title": "Do 3 strength training workouts", "category": "Physical", "type": "weekly", "difficulty": "Medium", "xp": 60},
+    {"title": "Read 1 technical article", "category": "Academics", "type": "weekly", "difficulty": "Medium", "xp": 50},
+    {"title": "Solve 10 brain teasers", "category": "Mental", "type": "weekly", "difficulty": "Medium", "xp": 50},
+    {"title": "Complete 2 high-intensity cardio sessions", "category": "Physical", "type": "weekly", "difficulty": "Hard", "xp": 70},
+    {"title": "Research 1 small business opportunity", "category": "Financial", "type": "weekly", "difficulty": "Medium", "xp": 50},
+    {"title": "Practice 30 minutes of meditation daily", "category": "Mental", "type": "weekly", "difficulty": "Medium", "xp": 60},
+    {"title": "Learn a new concept in your study field", "category": "Academics", "type": "weekly", "difficulty": "Medium", "xp": 50},
+    {"title": "Plan 1 healthy meal plan for the week", "category": "Physical", "type": "weekly", "difficulty": "Easy", "xp": 40},
+    {"title": "Do 3 flexibility exercises sessions", "category": "Physical", "type": "weekly", "difficulty": "Medium", "xp": 50},
+    {"title": "Track your net worth weekly", "category": "Financial", "type": "weekly", "difficulty": "Medium", "xp": 50},
+    {"title": "Solve 1 logic grid puzzle", "category": "Mental", "type": "weekly", "difficulty": "Medium", "xp": 50},
+    {"title": "Complete 1 online quiz", "category": "Academics", "type": "weekly", "difficulty": "Easy", "xp": 40},
+    {"title": "Do 3 sets of MMA drills", "category": "Physical", "type": "weekly", "difficulty": "Hard", "xp": 70},
+    {"title": "Write 1 financial reflection journal", "category": "Financial", "type": "weekly", "difficulty": "Medium", "xp": 50},
+    {"title": "Practice mindfulness daily for a week", "category": "Mental", "type": "weekly", "difficulty": "Medium", "xp": 60},
+    {"title": "Complete 1 mini research project", "category": "Academics", "type": "weekly", "difficulty": "Medium", "xp": 60},
+    {"title": "Run 5 km in a single session", "category": "Physical", "type": "weekly", "difficulty": "Medium", "xp": 60},
+    {"title": "Complete 2 coding challenges", "category": "Academics", "type": "weekly", "difficulty": "Medium", "xp": 50},
+    {"title": "Solve 5 puzzles with increasing difficulty", "category": "Mental", "type": "weekly", "difficulty": "Medium", "xp": 50},
+    {"title": "Plan a budget for next week", "category": "Financial", "type": "weekly", "difficulty": "Medium", "xp": 50},
+    {"title": "Do 3 full-body workouts", "category": "Physical", "type": "weekly", "difficulty": "Hard", "xp": 70},
+    {"title": "Read 1 book summary", "category": "Academics", "type": "weekly", "difficulty": "Easy", "xp": 40},
+    {"title": "Practice visualization and mental focus exercises", "category": "Mental", "type": "weekly", "difficulty": "Medium", "xp": 50},
+    {"title": "Complete 1 side hustle task", "category": "Financial", "type": "weekly", "difficulty": "Medium", "xp": 50},
+    {"title": "Do 50 lunges per leg", "category": "Physical", "type": "weekly", "difficulty": "Medium", "xp": 60},
+    {"title": "Learn and apply 1 new problem-solving strategy", "category": "Mental", "type": "weekly", "difficulty": "Medium", "xp": 50},
+
+    ] + [
+        {"title": f"Daily Quest #{i}", "category": "Mixed", "type": "daily", "difficulty": "Easy", "xp": 10+i}
+        for i in range(9, 51)
+    ],
+
+    "weekly": [
+        {"title": "Finish one small project", "category": "Project", "type": "weekly", "difficulty": "Hard", "xp": 80},
+        {"title": "Workout 4 times this week", "category": "Physical", "type": "weekly", "difficulty": "Hard", "xp": 70},
+        {"title": "Solve 10 logic problems", "category": "Mental", "type": "weekly", "difficulty": "Medium", "xp": 50},
+        {"title": "Research 3 side hustles", "category": "Financial", "type": "weekly", "difficulty": "Medium", "xp": 40},
+        # Add 46 more weekly quests
+        {"title": "Stretch for 10 minutes", "category": "Physical", "type": "daily", "difficulty": "Easy", "xp": 10},
+        {"title": "Do 30 squats", "category": "Physical", "type": "daily", "difficulty": "Medium", "xp": 20},
+        {"title": "Practice shadow boxing for 15 minutes", "category": "Physical", "type": "daily", "difficulty": "Medium", "xp": 25},
+        {"title": "Run 2 km", "category": "Physical", "type": "daily", "difficulty": "Medium", "xp": 20},
+        {"title": "Try 5 new yoga poses", "category": "Physical", "type": "daily", "difficulty": "Easy", "xp": 15},
+        {"title": "Solve 5 Sudoku puzzles", "category": "Mental", "type": "daily", "difficulty": "Medium", "xp": 20},
+        {"title": "Complete a brain teaser", "category": "Mental", "type": "daily", "difficulty": "Easy", "xp": 15},
+        {"title": "Practice memory exercise for 10 minutes", "category": "Mental", "type": "daily", "difficulty": "Medium", "xp": 20},
+        {"title": "Write a journal entry", "category": "Mental", "type": "daily", "difficulty": "Easy", "xp": 10},
+        {"title": "Learn 5 new vocabulary words", "category": "Academics", "type": "daily", "difficulty": "Easy", "xp": 15},
+        {"title": "Review 10 math problems", "category": "Academics", "type": "daily", "difficulty": "Medium", "xp": 20},
+        {"title": "Read an article on finance", "category": "Financial", "type": "daily", "difficulty": "Easy", "xp": 10},
+        {"title": "Track your daily expenses", "category": "Financial", "type": "daily", "difficulty": "Medium", "xp": 15},
+        {"title": "Plan tomorrow’s budget", "category": "Financial", "type": "daily", "difficulty": "Medium", "xp": 20},
+        {"title": "Do 15 lunges per leg", "category": "Physical", "type": "daily", "difficulty": "Medium", "xp": 20},
+        {"title": "Meditate using guided audio", "category": "Mental", "type": "daily", "difficulty": "Medium", "xp": 20},
+        {"title": "Solve 2 logic grid puzzles", "category": "Mental", "type": "daily", "difficulty": "Medium", "xp": 25},
+        {"title": "Learn a new programming concept", "category": "Academics", "type": "daily", "difficulty": "Medium", "xp": 25},
+        {"title": "Watch an educational video", "category": "Academics", "type": "daily", "difficulty": "Easy", "xp": 15},
+        {"title": "Practice 5 minutes of mindfulness breathing", "category": "Mental", "type": "daily", "difficulty": "Easy", "xp": 10},
+        {"title": "Do 50 jumping jacks", "category": "Physical", "type": "daily", "difficulty": "Easy", "xp": 15},
+        {"title": "Perform 20 sit-ups", "category": "Physical", "type": "daily", "difficulty": "Easy", "xp": 15},
+        {"title": "Learn about investing basics", "category": "Financial", "type": "daily", "difficulty": "Medium", "xp": 20},
+        {"title": "Research 1 small business idea", "category": "Financial", "type": "daily", "difficulty": "Medium", "xp": 20},
+        {"title": "Solve a daily crossword", "category": "Mental", "type": "daily", "difficulty": "Easy", "xp": 10},
+        {"title": "Practice deep breathing for 5 minutes", "category": "Mental", "type": "daily", "difficulty": "Easy", "xp": 10},
+        {"title": "Read a news article and summarize it", "category": "Academics", "type": "daily", "difficulty": "Medium", "xp": 20},
+        {"title": "Practice a new skill for 15 minutes", "category": "Academics", "type": "daily", "difficulty": "Medium", "xp": 20},
+        {"title": "Walk 3 km", "category": "Physical", "type": "daily", "difficulty": "Medium", "xp": 20},
+        {"title": "Practice MMA combinations for 10 minutes", "category": "Physical", "type": "daily", "difficulty": "Hard", "xp": 30},
+        {"title": "Solve 3 brain teasers", "category": "Mental", "type": "daily", "difficulty": "Medium", "xp": 20},
+        {"title": "Complete a small coding challenge", "category": "Academics", "type": "daily", "difficulty": "Medium", "xp": 25},
+        {"title": "Track your daily water intake", "category": "Physical", "type": "daily", "difficulty": "Easy", "xp": 10},
+        {"title": "Plan your weekly fitness schedule", "category": "Physical", "type": "daily", "difficulty": "Medium", "xp": 20},
+        {"title": "Spend 15 minutes learning a new language", "category": "Academics", "type": "daily", "difficulty": "Medium", "xp": 20},
+        {"title": "Solve a math puzzle", "category": "Mental", "type": "daily", "difficulty": "Medium", "xp": 20},
+        {"title": "Check your savings progress", "category": "Financial", "type": "daily", "difficulty": "Easy", "xp": 15},
+        {"title": "Research a side hustle opportunity", "category": "Financial", "type": "daily", "difficulty": "Medium", "xp": 20},
+        {"title": "Practice 10 burpees", "category": "Physical", "type": "daily", "difficulty": "Medium", "xp": 25},
+        {"title": "Do 5 minutes of stretching after workout", "category": "Physical", "type": "daily", "difficulty": "Easy", "xp": 10},
+        {"title": "Write down 3 things you are grateful for", "category": "Mental", "type": "daily", "difficulty": "Easy", "xp": 10},
+        {"title": "Read a short article on finance", "category": "Financial", "type": "daily", "difficulty": "Easy", "xp": 10},
+        {"title": "Create a mini budget for today", "category": "Financial", "type": "daily", "difficulty": "Medium", "xp": 20},
+        {"title": "Practice shadow boxing for 5 minutes", "category": "Physical", "type": "daily", "difficulty": "Easy", "xp": 15},
+
+    ] + [
+        {"title": f"Weekly Quest #{i}", "category": "Mixed", "type": "weekly", "difficulty": "Medium", "xp": 40+i}
+        for i in range(5, 51)
+    ],
+
+    "monthly": [
+        {"title": "Complete a mini-course", "category": "Academics", "type": "monthly", "difficulty": "Hard", "xp": 200},
+        {"title": "Read a full book", "category": "Academics", "type": "monthly", "difficulty": "Medium", "xp": 150},
+        {"title": "Complete a financial plan for the month", "category": "Financial", "type": "monthly", "difficulty": "Hard", "xp": 180},
+        {"title": "Achieve a fitness milestone", "category": "Physical", "type": "monthly", "difficulty": "Hard", "xp": 170},
+        {"title": "Solve 50 logic puzzles", "category": "Mental", "type": "monthly", "difficulty": "Hard", "xp": 160},
+        {"title": "Complete a 30-day workout challenge", "category": "Physical", "type": "monthly", "difficulty": "Hard", "xp": 180},
+    {"title": "Learn a new programming language basics", "category": "Academics", "type": "monthly", "difficulty": "Hard", "xp": 200},
+    {"title": "Meditate 15 minutes daily for a month", "category": "Mental", "type": "monthly", "difficulty": "Medium", "xp": 150},
+    {"title": "Read 2 books", "category": "Academics", "type": "monthly", "difficulty": "Medium", "xp": 180},
+    {"title": "Track all monthly expenses", "category": "Financial", "type": "monthly", "difficulty": "Medium", "xp": 150},
+    {"title": "Research and start one side hustle", "category": "Financial", "type": "monthly", "difficulty": "Hard", "xp": 200},
+    {"title": "Complete 4 long-distance runs", "category": "Physical", "type": "monthly", "difficulty": "Medium", "xp": 160},
+    {"title": "Solve 100 logic puzzles", "category": "Mental", "type": "monthly", "difficulty": "Hard", "xp": 180},
+    {"title": "Complete one advanced coding project", "category": "Academics", "type": "monthly", "difficulty": "Hard", "xp": 220},
+    {"title": "Write a summary of all books read this month", "category": "Academics", "type": "monthly", "difficulty": "Medium", "xp": 150},
+    {"title": "Create a monthly investment plan", "category": "Financial", "type": "monthly", "difficulty": "Hard", "xp": 200},
+    {"title": "Practice MMA or self-defense 8 times", "category": "Physical", "type": "monthly", "difficulty": "Hard", "xp": 180},
+    {"title": "Learn 20 new logic puzzles techniques", "category": "Mental", "type": "monthly", "difficulty": "Medium", "xp": 160},
+    {"title": "Complete one online course", "category": "Academics", "type": "monthly", "difficulty": "Hard", "xp": 200},
+    {"title": "Track 30 days of mindfulness or journaling", "category": "Mental", "type": "monthly", "difficulty": "Medium", "xp": 150},
+    {"title": "Create a small business prototype", "category": "Financial", "type": "monthly", "difficulty": "Hard", "xp": 220},
+    {"title": "Read financial news daily", "category": "Financial", "type": "monthly", "difficulty": "Medium", "xp": 150},
+    {"title": "Achieve a personal best in running or cycling", "category": "Physical", "type": "monthly", "difficulty": "Hard", "xp": 200},
+    {"title": "Solve a complex puzzle game", "category": "Mental", "type": "monthly", "difficulty": "Hard", "xp": 180},
+    {"title": "Practice a skill daily for a month (language, coding, etc.)", "category": "Academics", "type": "monthly", "difficulty": "Medium", "xp": 160},
+    {"title": "Plan and follow a healthy meal plan", "category": "Physical", "type": "monthly", "difficulty": "Medium", "xp": 150},
+    {"title": "Write a monthly reflection journal", "category": "Mental", "type": "monthly", "difficulty": "Easy", "xp": 120},
+    {"title": "Learn investment strategies for beginners", "category": "Financial", "type": "monthly", "difficulty": "Medium", "xp": 150},
+    {"title": "Attend a workshop or webinar", "category": "Academics", "type": "monthly", "difficulty": "Medium", "xp": 160},
+    {"title": "Complete 20 home workouts", "category": "Physical", "type": "monthly", "difficulty": "Medium", "xp": 150},
+    {"title": "Solve 200 logic or brain puzzles", "category": "Mental", "type": "monthly", "difficulty": "Hard", "xp": 200},
+    {"title": "Read a book on entrepreneurship", "category": "Financial", "type": "monthly", "difficulty": "Medium", "xp": 150},
+    {"title": "Start a journal of 30 daily entries", "category": "Mental", "type": "monthly", "difficulty": "Medium", "xp": 150},
+    {"title": "Complete a 30-day flexibility challenge", "category": "Physical", "type": "monthly", "difficulty": "Medium", "xp": 160},
+    {"title": "Create a monthly financial report for personal finances", "category": "Financial", "type": "monthly", "difficulty": "Hard", "xp": 200},
+    {"title": "Complete a 30-day coding challenge", "category": "Academics", "type": "monthly", "difficulty": "Hard", "xp": 220},
+    {"title": "Plan and execute one mini-project", "category": "Academics", "type": "monthly", "difficulty": "Medium", "xp": 160},
+    {"title": "Perform 3 hours of cardio per week", "category": "Physical", "type": "monthly", "difficulty": "Medium", "xp": 150},
+    {"title": "Meditate daily for 15 minutes", "category": "Mental", "type": "monthly", "difficulty": "Medium", "xp": 150},
+    {"title": "Research and learn a new side hustle", "category": "Financial", "type": "monthly", "difficulty": "Medium", "xp": 160},
+    {"title": "Write a 5-page essay on a chosen topic", "category": "Academics", "type": "monthly", "difficulty": "Medium", "xp": 160},
+    {"title": "Complete a 30-day strength training challenge", "category": "Physical", "type": "monthly", "difficulty": "Hard", "xp": 200},
+    {"title": "Solve 50 advanced brain teasers", "category": "Mental", "type": "monthly", "difficulty": "Hard", "xp": 200},
+    {"title": "Learn budgeting and track monthly expenses", "category": "Financial", "type": "monthly", "difficulty": "Medium", "xp": 160},
+    {"title": "Read one personal development book", "category": "Mental", "type": "monthly", "difficulty": "Medium", "xp": 150},
+    {"title": "Complete 4 long-distance cycling sessions", "category": "Physical", "type": "monthly", "difficulty": "Medium", "xp": 170},
+    {"title": "Practice meditation and journaling together for 30 days", "category": "Mental", "type": "monthly", "difficulty": "Medium", "xp": 160},
+    {"title": "Start a small entrepreneurial project", "category": "Financial", "type": "monthly", "difficulty": "Hard", "xp": 200},
+    {"title": "Complete 10 high-intensity interval workouts", "category": "Physical", "type": "monthly", "difficulty": "Hard", "xp": 180},
+    {"title": "Learn and apply problem-solving techniques", "category": "Mental", "type": "monthly", "difficulty": "Medium", "xp": 160},
+    {"title": "Write a monthly plan with goals and milestones", "category": "Academics", "type": "monthly", "difficulty": "Medium", "xp": 160},
+    {"title": "Track and analyze monthly fitness progress", "category": "Physical", "type": "monthly", "difficulty": "Medium", "xp": 150},
+    {"title": "Read a book on mental health or mindfulness", "category": "Mental", "type": "monthly", "difficulty": "Medium", "xp": 150},
+    {"title": "Complete a finance-related online course", "category": "Financial", "type": "monthly", "difficulty": "Hard", "xp": 200},
+    {"title": "Complete a personal 30-day challenge of your choice", "category": "Mixed", "type": "monthly", "difficulty": "Medium", "xp": 160},
+    ] + [
+        {"title": f"Monthly Quest #{i}", "category": "Mixed", "type": "monthly", "difficulty": "Medium", "xp": 150+i}
+        for i in range(6, 51)
+    ],
+}
@@ -0,0 +1,164 @@
+# backend/quest_engine/derived.py
+"""Derived quest mode (``QUEST_MODE = "derived"``).
+
+A user's active quests are never stored. For each period they are the
+``count`` catalog templates with the highest hash of
+``(user_id, period, period_start, template_id)`` (rendezvous hashing), so the
+set is stable for the whole period and adding a template only displaces a
+quest if it outranks it. Reads are pure; the only writes are
+``quest_completion`` rows.
+
+Quest ids in this mode are strings of the form ``"<period>-<template_id>"``.
+"""
+import hashlib
+from collections import OrderedDict
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from backend.extensions import db
+from backend.models import Quest, QuestCompletion, User
+from backend.progress import get_level, get_rank
+from backend.progress_engine import QUEST, emit
+from backend.quest_engine.catalog import bmi_title, get_catalog
+from backend.quest_engine.periods import PERIODS, period_start
+from backend.versioning import QUESTS, bump
+
+_CACHE_SIZE = 4096
+# (user_id, period, start, catalog version) -> tuple of TemplateEntry
+_assignments = OrderedDict()
+
+
+def _score(seed, template_id):
+    return hashlib.blake2b(b"%s:%d" % (seed, template_id), digest_size=8).digest()
+
+
+def assigned_templates(user_id, period, start, catalog):
+    """The templates a user gets for ``period`` starting at ``start``."""
+    key = (user_id, period, start, catalog.version)
+    chosen = _assignments.get(key)
+    if chosen is not None:
+        _assignments.move_to_end(key)
+        return chosen
+    seed = f"{user_id}:{period}:{start.isoformat()}".encode()
+    pool = catalog.pools.get(period, ())
+    ranked = sorted(pool, key=lambda t: _score(seed, t.id), reverse=True)
+    chosen = _assignments[key] = tuple(ranked[:PERIODS[period]["count"]])
+    if len(_assignments) > _CACHE_SIZE:
+        _assignments.popitem(last=False)
+    return chosen
+
+
+def _active_set(user, periods, now, catalog):
+    """[(period, start, TemplateEntry)] for the user's current quests."""
+    active = []
+    for period in periods:
+        start = period_start(period, now)
+        templates = list(assigned_templates(user.id, period, start, catalog))
+        if period == "daily":
+            title = bmi_title(user)
+            bmi = title and catalog.find("bmi", title)
+            if bmi and all(t.title != bmi.title for t in templates):
+                templates.append(bmi)
+        active.extend((period, start, t) for t in templates)
+    return active
+
+
+def get_derived_quests(user_id, period=None, now=None):
+    """Same shape as get_user_quests(); one completion lookup, no writes."""
+    user = db.session.get(User, user_id)
+    if not user:
+        return []
+    now = now or datetime.utcnow()
+    periods = [period] if period else list(PERIODS)
+    if any(p not in PERIODS for p in periods):
+        return []
+    catalog = get_catalog()
+    active = _active_set(user, periods, now, catalog)
+    starts = {start for _, start, _ in active}
+    done = set(db.session.execute(
+        select(QuestCompletion.template_id, QuestCompletion.period_start)
+        .where(QuestCompletion.user_id == user_id, QuestCompletion.period_start.in_(starts))
+    ).all())
+    return [
+        {
+            "id": f"{p}-{t.id}",
+            "title": t.title,
+            "category": t.category,
+            "type": p,
+            "difficulty": t.difficulty,
+            "xp": t.xp,
+            "completed": (t.id, start) in done,
+        }
+        for p, start, t in active
+    ]
+
+
+def complete_derived_quest(user_id, quest_key, now=None, commit=True):
+    """Record a completion and award XP in one transaction."""
+    period, _, template_id = str(quest_key).partition("-")
+    if period not in PERIODS or not template_id.isdigit():
+        return False, "Quest not found or not owned by user"
+    user = db.session.get(User, user_id)
+    if not user:
+        return False, "Quest not found or not owned by user"
+    now = now or datetime.utcnow()
+    catalog = get_catalog()
+    match = [
+        (start, t) for _, start, t in _active_set(user, [period], now, catalog)
+        if t.id == int(template_id)
+    ]
+    if not match:
+        return False, "Quest not found or not owned by user"
+    start, template = match[0]
+
+    inserted = db.session.execute(
+        sqlite_insert(QuestCompletion.__table__)
+        .values(user_id=user_id, template_id=template.id, period_start=start)
+        .on_conflict_do_nothing()
+    ).rowcount
+    if not inserted:
+        if commit:
+            db.session.rollback()
+        return False, "Quest already completed"
+    user.points = (user.points or 0) + (template.xp or 0)
+    emit(user, QUEST, xp=template.xp or 0)
+    user.level = get_level(user.points)
+    user.rank = get_rank(user.points)
+    bump(user_id, QUESTS)
+    if commit:
+        db.session.commit()
+    return True, {"points": user.points, "quest_id": quest_key}
+
+
+def migrate_stored_quests(delete=False, batch_size=1000):
+    """Turn completed ``quest`` rows into ``quest_completion`` rows.
+
+    Each completion is filed under the period that contained the quest's
+    created_at. Returns the number of completions written.
+    """
+    written = 0
+    last_id = 0
+    while True:
+        rows = db.session.execute(
+            select(Quest.id, Quest.user_id, Quest.template_id, Quest.type, Quest.created_at)
+            .where(Quest.id > last_id, Quest.completed.is_(True), Quest.template_id.isnot(None))
+            .order_by(Quest.id).limit(batch_size)
+        ).all()
+        if not rows:
+            break
+        last_id = rows[-1].id
+        values = [
+            {"user_id": r.user_id, "template_id": r.template_id,
+             "period_start": period_start(r.type if r.type in PERIODS else "daily", r.created_at or datetime.utcnow())}
+            for r in rows
+        ]
+        written += db.session.execute(
+            sqlite_insert(QuestCompletion.__table__).on_conflict_do_nothing(), values
+        ).rowcount
+        db.session.commit()
+    if delete:
+        Quest.query.delete(synchronize_session=False)
+        db.session.commit()
+    return written
@@ -0,0 +1,163 @@
+# backend/quest_engine/engine.py
+from datetime import datetime
+from random import sample as rand_sample
+
+from flask import current_app
+from sqlalchemy import update
+
+from backend.extensions import db
+from backend.models import Quest, User
+from backend.progress import get_level, get_rank
+from backend.progress_engine import QUEST, emit
+from backend.quest_engine.catalog import bmi_title, get_catalog
+from backend.quest_engine.derived import complete_derived_quest, get_derived_quests
+from backend.quest_engine.periods import PERIODS
+from backend.quest_engine.sources import DEFAULT_SOURCE, load_pool_source
+from backend.versioning import QUESTS, bump
+
+# spec -> loaded pools, filled on first use per worker
+_pool_cache = {}
+
+
+def get_pools(source=None):
+    """Return the raw pools for ``source`` (defaults to QUEST_POOL_SOURCE).
+
+    These seed the quest_template table; generation itself samples from the
+    catalog snapshot.
+    """
+    spec = source or current_app.config.get("QUEST_POOL_SOURCE", DEFAULT_SOURCE)
+    pools = _pool_cache.get(spec)
+    if pools is None:
+        pools = _pool_cache[spec] = load_pool_source(spec).load()
+    return pools
+
+
+def _derived_mode():
+    return current_app.config.get("QUEST_MODE", "stored") == "derived"
+
+
+def _choose_sample(pool, count):
+    if not pool:
+        return []
+    if len(pool) <= count:
+        return list(pool)
+    return rand_sample(pool, count)
+
+
+def quest_view(row, catalog):
+    """Quest as a dict, with display fields resolved from the catalog."""
+    template = catalog.templates.get(row.template_id)
+    fields = template or row
+    return {
+        "id": row.id,
+        "title": fields.title,
+        "category": fields.category,
+        "type": row.type,
+        "difficulty": fields.difficulty,
+        "xp": fields.xp,
+        "completed": bool(row.completed),
+    }
+
+
+def quest_xp(quest, catalog):
+    template = catalog.templates.get(quest.template_id)
+    return (template.xp if template else quest.xp) or 0
+
+
+# ----------------- QUEST UTILITIES -----------------
+def generate_quests_for_user(user_id):
+    """Generate quests for a user only when the regen period has passed.
+
+    All due periods are replaced in one transaction: a single DELETE for the
+    stale quests and one batched INSERT for the new ones. New rows only store
+    a template reference. Does nothing in derived mode.
+    """
+    if _derived_mode():
+        return
+    user = db.session.get(User, user_id)
+    if not user:
+        return
+
+    now = datetime.utcnow()
+    due = [
+        name for name, period in PERIODS.items()
+        if not getattr(user, period["last_field"])
+        or (now - getattr(user, period["last_field"])).total_seconds() >= period["regen"]
+    ]
+    if not due:
+        return
+
+    Quest.query.filter(Quest.user_id == user.id, Quest.type.in_(due)).delete(synchronize_session=False)
+
+    catalog = get_catalog()
+    chosen = []
+    for name in due:
+        chosen.extend(_choose_sample(catalog.pools.get(name, ()), PERIODS[name]["count"]))
+        setattr(user, PERIODS[name]["last_field"], now)
+
+    if "daily" in due:
+        title = bmi_title(user)
+        bmi = title and catalog.find("bmi", title)
+        # don't duplicate same title for same day
+        if bmi and not any(t.title == bmi.title and t.type == "daily" for t in chosen):
+            chosen.append(bmi)
+
+    db.session.add_all(
+        Quest(user_id=user.id, template_id=t.id, type=t.type, completed=False) for t in chosen
+    )
+    bump(user.id, QUESTS)
+    db.session.commit()
+
+
+def get_user_quests(user_id, period=None):
+    """Return all quests for user as dicts; if period provided filter by type."""
+    if _derived_mode():
+        return get_derived_quests(user_id, period)
+    q = Quest.query.with_entities(
+        Quest.id, Quest.template_id, Quest.type, Quest.completed,
+        Quest.title, Quest.category, Quest.difficulty, Quest.xp,
+    ).filter_by(user_id=user_id)
+    if period:
+        q = q.filter_by(type=period)
+    catalog = get_catalog()
+    return [quest_view(row, catalog) for row in q.order_by(Quest.created_at.desc())]
+
+
+def complete_user_quest(user_id, quest_id, commit=True):
+    """Mark a quest done and award its XP in a single transaction.
+
+    The completed flag is flipped with a guarded UPDATE so two concurrent
+    requests cannot both award the same quest. With ``commit=False`` the
+    caller owns the transaction (used by /sync).
+    """
+    if _derived_mode():
+        return complete_derived_quest(user_id, quest_id, commit=commit)
+    try:
+        quest_id = int(quest_id)
+    except (TypeError, ValueError):
+        return False, "Invalid quest ID"
+    quest = db.session.get(Quest, quest_id)
+    if not quest or quest.user_id != user_id:
+        return False, "Quest not found or not owned by user"
+
+    flipped = db.session.execute(
+        update(Quest)
+        .where(Quest.id == quest_id, Quest.user_id == user_id, Quest.completed.isnot(True))
+        .values(completed=True)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    if not flipped:
+        if commit:
+            db.session.rollback()
+        return False, "Quest already completed"
+
+    user = db.session.get(User, user_id)
+    xp = quest_xp(quest, get_catalog())
+    user.points = (user.points or 0) + xp
+    emit(user, QUEST, xp=xp)
+    user.level = get_level(user.points)
+    user.rank = get_rank(user.points)
+    bump(user_id, QUESTS)
+    if commit:
+        db.session.commit()
+    return True, {"points": user.points, "quest_id": quest.id}
@@ -0,0 +1,32 @@
+# backend/quest_engine/periods.py
+from datetime import date, timedelta
+
+# Single source of truth for quest periods. Anything that needs to know how
+# many quests a period gets, or how long it lasts, reads it from here.
+
+PERIODS = {
+    "daily": {"count": 3, "regen": 24 * 3600, "last_field": "last_daily_quest"},
+    "weekly": {"count": 2, "regen": 7 * 24 * 3600, "last_field": "last_weekly_quest"},
+    "monthly": {"count": 1, "regen": 30 * 24 * 3600, "last_field": "last_monthly_quest"},
+}
+
+# How many to create per period
+COUNTS = {name: p["count"] for name, p in PERIODS.items()}
+
+# Seconds to wait before regenerating quests (approx)
+REGEN = {name: p["regen"] for name, p in PERIODS.items()}
+
+
+def period_start(name, when):
+    """Calendar start of the period containing ``when`` (used by derived mode).
+
+    Days start at UTC midnight, weeks on Monday, months on the 1st.
+    """
+    day = when.date() if hasattr(when, "date") else when
+    if name == "daily":
+        return day
+    if name == "weekly":
+        return day - timedelta(days=day.weekday())
+    if name == "monthly":
+        return date(day.year, day.month, 1)
+    raise ValueError(f"Unknown quest period: {name!r}")
@@ -0,0 +1,78 @@
+# backend/quest_engine/sources.py
+import json
+from importlib import import_module
+
+from sqlalchemy import text
+
+from backend.extensions import db
+from backend.quest_engine.periods import PERIODS
+
+DEFAULT_SOURCE = "module:backend.quest_engine.default_pools"
+
+_QUEST_FIELDS = ("title", "category", "type", "difficulty", "xp")
+
+
+class ModulePoolSource:
+    """Pools from a module-level ``DEFAULT_POOLS`` dict."""
+
+    def __init__(self, module_name, attr="DEFAULT_POOLS"):
+        self.module_name = module_name
+        self.attr = attr
+
+    def load(self):
+        return getattr(import_module(self.module_name), self.attr)
+
+
+class FilePoolSource:
+    """Pools from a JSON or YAML file shaped like ``{"daily": [{...}], ...}``."""
+
+    def __init__(self, path):
+        self.path = path
+
+    def load(self):
+        with open(self.path, encoding="utf-8") as fh:
+            if self.path.endswith((".yaml", ".yml")):
+                try:
+                    import yaml
+                except ImportError:
+                    raise RuntimeError("PyYAML is required to load YAML quest pools")
+                return yaml.safe_load(fh)
+            return json.load(fh)
+
+
+class TablePoolSource:
+    """Pools from a table with title/category/type/difficulty/xp columns.
+
+    ``period_column`` names the column that says which period pool a row
+    belongs to.
+    """
+
+    def __init__(self, table, period_column="type"):
+        self.table = table
+        self.period_column = period_column
+
+    def load(self):
+        columns = ", ".join(_QUEST_FIELDS)
+        rows = db.session.execute(
+            text(f"SELECT {self.period_column} AS pool, {columns} FROM {self.table}")
+        ).mappings()
+        pools = {name: [] for name in PERIODS}
+        for row in rows:
+            pools.setdefault(row["pool"], []).append({f: row[f] for f in _QUEST_FIELDS})
+        return pools
+
+
+def load_pool_source(spec):
+    """Build a pool source from a ``kind:target`` spec.
+
+    ``module:package.module``, ``file:path/to/pools.json`` (or ``.yaml``) and
+    ``table:quest_table`` are supported.
+    """
+    kind, _, target = spec.partition(":")
+    if kind == "module":
+        return ModulePoolSource(target)
+    if kind == "file":
+        return FilePoolSource(target)
+    if kind == "table":
+        return TablePoolSource(target)
+    raise ValueError(f"Unknown quest pool source: {spec!r}")
@@ -0,0 +1,9 @@
+# backend/quiz/__init__.py
+from backend.quiz.bank import (
+    QuestionBank,
+    get_bank,
+    invalidate_bank,
+    load_questions,
+    sync_questions,
+)
+from backend.quiz.scheduler import BOX_INTERVALS, forget, next_set, record_answers
@@ -0,0 +1,145 @@
+# backend/quiz/bank.py
+"""Quiz questions: the ``quiz_question`` table and its in-memory snapshot.
+
+Works like the quest catalog: every worker keeps one immutable
+``QuestionBank``, rebuilt only when the ``catalog_version`` row for "quiz"
+changes, which is checked at most once per ``QUIZ_BANK_TTL`` seconds.
+
+The snapshot stores each question in the exact form the client gets:
+options are shuffled once when the snapshot is built, seeded by the question
+id. The order is therefore the same in every worker, and an answer, sent as
+an option index, can be graded anywhere.
+"""
+import json
+import random
+import time
+from collections import namedtuple
+from importlib import import_module
+from types import MappingProxyType
+
+from flask import current_app
+
+from backend.extensions import db
+from backend.models import CatalogVersion, QuizQuestion
+
+CATALOG_NAME = "quiz"
+DEFAULT_SOURCE = "backend.quiz.default_bank"
+
+# ``public`` is what /quiz/set sends; ``answer`` indexes its options.
+QuestionEntry = namedtuple("QuestionEntry", "id topic public answer")
+
+
+class QuestionBank:
+    """Read-only view of the quiz questions at one catalog version."""
+
+    __slots__ = ("version", "questions", "order")
+
+    def __init__(self, version, rows):
+        self.version = version
+        questions = {}
+        order = []
+        for row in rows:
+            options = json.loads(row.options)
+            if row.answer not in options:
+                continue
+            random.Random(row.id).shuffle(options)
+            public = MappingProxyType({"id": row.id, "topic": row.topic, "q": row.question, "o": tuple(options)})
+            questions[row.id] = QuestionEntry(row.id, row.topic, public, options.index(row.answer))
+            if row.active:
+                order.append(row.id)
+        # Inactive questions stay gradable until their open sets are answered.
+        self.questions = MappingProxyType(questions)
+        # The order new questions are introduced in
+        random.Random(version).shuffle(order)
+        self.order = tuple(order)
+
+
+_bank = None
+_checked_at = 0.0
+
+
+def _current_version():
+    row = db.session.get(CatalogVersion, CATALOG_NAME)
+    return row.version if row else 0
+
+
+def _load_bank(version):
+    rows = QuizQuestion.query.with_entities(
+        QuizQuestion.id, QuizQuestion.topic, QuizQuestion.question,
+        QuizQuestion.options, QuizQuestion.answer, QuizQuestion.active,
+    ).order_by(QuizQuestion.id).all()
+    return QuestionBank(version, rows)
+
+
+def get_bank():
+    """Return the current snapshot, reloading it if the version moved."""
+    global _bank, _checked_at
+    now = time.monotonic()
+    if _bank is not None and now - _checked_at < current_app.config.get("QUIZ_BANK_TTL", 5):
+        return _bank
+    version = _current_version()
+    if _bank is None or _bank.version != version:
+        _bank = _load_bank(version)
+    _checked_at = now
+    return _bank
+
+
+def invalidate_bank():
+    global _checked_at
+    _checked_at = 0.0
+
+
+def load_questions(source=None):
+    """Questions from a JSON file (a list of question dicts) or a module's DEFAULT_QUESTIONS."""
+    source = source or DEFAULT_SOURCE
+    if source.endswith(".json"):
+        with open(source, encoding="utf-8") as fh:
+            return json.load(fh)
+    return import_module(source).DEFAULT_QUESTIONS
+
+
+def sync_questions(questions, prune=False):
+    """Upsert ``questions`` (keyed by question text) and bump the bank version.
+
+    Questions missing from ``questions`` are deactivated when ``prune`` is
+    set, never deleted, because review rows reference them.
+    Returns ``(added, updated, deactivated)``.
+    """
+    existing = {q.question: q for q in QuizQuestion.query.all()}
+    seen = set()
+    added = updated = deactivated = 0
+    for item in questions:
+        text = item["question"]
+        if text in seen:
+            continue
+        seen.add(text)
+        if item["answer"] not in item["options"]:
+            raise ValueError(f"Answer is not one of the options: {text!r}")
+        values = {
+            "topic": item.get("topic", "General"),
+            "options": json.dumps(item["options"]),
+            "answer": item["answer"],
+            "active": True,
+        }
+        question = existing.get(text)
+        if question is None:
+            db.session.add(QuizQuestion(question=text, **values))
+            added += 1
+        elif any(getattr(question, k) != v for k, v in values.items()):
+            for k, v in values.items():
+                setattr(question, k, v)
+            updated += 1
+    if prune:
+        for text, question in existing.items():
+            if text not in seen and question.active:
+                question.active = False
+                deactivated += 1
+    if added or updated or deactivated:
+        row = db.session.get(CatalogVersion, CATALOG_NAME)
+        if row is None:
+            row = CatalogVersion(name=CATALOG_NAME, version=0)
+            db.session.add(row)
+        row.version += 1
+    db.session.commit()
+    invalidate_bank()
+    return added, updated, deactivated
@@ -0,0 +1,20 @@
+# backend/quiz/default_bank.py
+# Built-in quiz questions, seeded into quiz_question by init-db. Load a
+# bigger bank with ``flask sync-quiz questions.json``.
+
+DEFAULT_QUESTIONS = [
+    {"topic": "Chemistry", "question": "Which element has the atomic number 82?", "options": ["Lead", "Gold", "Mercury", "Bismuth"], "answer": "Lead"},
+    {"topic": "History", "question": "In which year did the Titanic sink?", "options": ["1912", "1905", "1915", "1920"], "answer": "1912"},
+    {"topic": "Literature", "question": "Who wrote 'Crime and Punishment'?", "options": ["Tolstoy", "Dostoevsky", "Chekhov", "Pushkin"], "answer": "Dostoevsky"},
+    {"topic": "Math", "question": "What is the derivative of sin(x)?", "options": ["cos(x)", "-sin(x)", "-cos(x)", "tan(x)"], "answer": "cos(x)"},
+    {"topic": "Science", "question": "Which gas is most abundant in Earth's atmosphere?", "options": ["Oxygen", "Nitrogen", "Carbon Dioxide", "Argon"], "answer": "Nitrogen"},
+    {"topic": "Sports", "question": "Which country won the first FIFA World Cup?", "options": ["Brazil", "Uruguay", "Italy", "Germany"], "answer": "Uruguay"},
+    {"topic": "Physics", "question": "E = mc² is an equation formulated by?", "options": ["Newton", "Einstein", "Tesla", "Bohr"], "answer": "Einstein"},
+    {"topic": "Science", "question": "Which planet has the fastest orbit around the Sun?", "options": ["Mercury", "Venus", "Earth", "Mars"], "answer": "Mercury"},
+    {"topic": "Math", "question": "What is the integral of 1/x?", "options": ["ln(x)", "1/x²", "x²/2", "e^x"], "answer": "ln(x)"},
+    {"topic": "Chemistry", "question": "Which element is a noble gas?", "options": ["Oxygen", "Neon", "Chlorine", "Sodium"], "answer": "Neon"},
+    {"topic": "Physics", "question": "Which scientist proposed the uncertainty principle?", "options": ["Bohr", "Planck", "Heisenberg", "Dirac"], "answer": "Heisenberg"},
+    {"topic": "Computing", "question": "Which programming language is primarily used for AI?", "options": ["Python", "C", "HTML", "Java"], "answer": "Python"},
+    {"topic": "Geography", "question": "Which country is known as the Land of the Rising Sun?", "options": ["China", "Japan", "Thailand", "Korea"], "answer": "Japan"},
+    {"topic": "Biology", "question": "Which organ purifies blood in the human body?", "options": ["Heart", "Lungs", "Kidney", "Liver"], "answer": "Kidney"},
+]
@@ -0,0 +1,146 @@
+# backend/quiz/scheduler.py
+"""Spaced repetition for the quiz: which questions a user sees next.
+
+Each answered question has a ``quiz_review`` row with a Leitner box and a
+due time. A right answer moves it up a box (a longer interval), a wrong
+one sends it back to box 0.
+
+``next_set()`` serves due reviews first, then questions the user has not
+seen yet, then the reviews that fall due soonest. It reads the user's
+reviews from a min-heap of ``(due_at, question_id)`` that each worker
+caches. The heap is rebuilt with one indexed query when the user's "quiz"
+collection version changes, so repeat requests touch neither the review
+table nor the whole question bank.
+
+``record_answers()`` grades a batch, writes every review row in one upsert
+and bumps the version once.
+"""
+import heapq
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+
+from flask import current_app
+from sqlalchemy import select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from backend.extensions import db
+from backend.models import QuizReview
+from backend.quiz.bank import get_bank
+from backend.versioning import QUIZ, bump, current_version
+
+# Seconds until the next review, per box
+BOX_INTERVALS = (600, 86400, 3 * 86400, 7 * 86400, 16 * 86400, 35 * 86400)
+
+
+class ReviewQueue:
+    __slots__ = ("key", "heap", "seen")
+
+    def __init__(self, key, heap):
+        self.key = key
+        self.heap = heap
+        self.seen = frozenset(qid for _, qid in heap)
+
+
+# user_id -> ReviewQueue, least recently used first
+_queues = OrderedDict()
+_queues_lock = threading.Lock()
+
+
+def _queue(user_id, bank):
+    key = (current_version(user_id, QUIZ), bank.version)
+    with _queues_lock:
+        queue = _queues.get(user_id)
+        if queue is not None and queue.key == key:
+            _queues.move_to_end(user_id)
+            return queue
+    rows = db.session.execute(
+        select(QuizReview.due_at, QuizReview.question_id).where(QuizReview.user_id == user_id)
+    ).all()
+    heap = [(due_at, qid) for due_at, qid in rows if qid in bank.questions]
+    heapq.heapify(heap)
+    queue = ReviewQueue(key, heap)
+    with _queues_lock:
+        _queues[user_id] = queue
+        _queues.move_to_end(user_id)
+        while len(_queues) > current_app.config.get("QUIZ_QUEUE_CACHE", 1024):
+            _queues.popitem(last=False)
+    return queue
+
+
+def forget(user_id):
+    """Drop this worker's cached queue for ``user_id``."""
+    with _queues_lock:
+        _queues.pop(user_id, None)
+
+
+def next_set(user_id, size, now=None):
+    """Up to ``size`` questions (client form, without answers) for ``user_id``."""
+    now = time.time() if now is None else now
+    bank = get_bank()
+    queue = _queue(user_id, bank)
+
+    soonest = heapq.nsmallest(size, queue.heap)
+    picked = [qid for due_at, qid in soonest if due_at <= now]
+    if len(picked) < size and len(queue.seen) < len(bank.order):
+        for qid in bank.order:
+            if qid not in queue.seen:
+                picked.append(qid)
+                if len(picked) == size:
+                    break
+    # Everything seen and nothing due: practise what comes up next.
+    for due_at, qid in soonest:
+        if len(picked) == size:
+            break
+        if due_at > now:
+            picked.append(qid)
+    return [dict(bank.questions[qid].public) for qid in picked]
+
+
+def _schedule(review, correct, now):
+    box, reps, lapses = review if review else (0, 0, 0)
+    if correct:
+        box = min(box + 1, len(BOX_INTERVALS) - 1) if review else 1
+    else:
+        box, lapses = 0, lapses + 1
+    return {"box": box, "due_at": now + BOX_INTERVALS[box], "reps": reps + 1, "lapses": lapses}
+
+
+def record_answers(user_id, answers, now=None):
+    """Grade ``[(question_id, option_index), ...]`` and reschedule the reviews.
+
+    Does not commit. Returns one ``{"id", "correct", "answer"}`` per graded
+    answer, where ``answer`` is the right option index. Unknown questions are
+    skipped. If a question appears twice, the first answer counts.
+    """
+    now = time.time() if now is None else now
+    bank = get_bank()
+    graded = {}
+    for qid, choice in answers:
+        entry = bank.questions.get(qid)
+        if entry is not None and qid not in graded:
+            graded[qid] = (choice == entry.answer, entry.answer)
+    if not graded:
+        return []
+
+    existing = {
+        row.question_id: (row.box, row.reps, row.lapses)
+        for row in db.session.execute(
+            select(QuizReview.question_id, QuizReview.box, QuizReview.reps, QuizReview.lapses)
+            .where(QuizReview.user_id == user_id, QuizReview.question_id.in_(list(graded)))
+        )
+    }
+    answered_at = datetime.utcnow()
+    rows = [
+        dict(_schedule(existing.get(qid), correct, now), user_id=user_id, question_id=qid, answered_at=answered_at)
+        for qid, (correct, _) in graded.items()
+    ]
+    stmt = sqlite_insert(QuizReview.__table__)
+    db.session.execute(stmt.on_conflict_do_update(
+        index_elements=["user_id", "question_id"],
+        set_={name: stmt.excluded[name] for name in ("box", "due_at", "reps", "lapses", "answered_at")},
+    ), rows)
+    bump(user_id, QUIZ)
+    forget(user_id)
+    return [{"id": qid, "correct": correct, "answer": answer} for qid, (correct, answer) in graded.items()]
@@ -0,0 +1,186 @@
+# backend/ratelimit.py
+"""Per-user and per-IP token buckets shared by every worker on the host.
+
+Limits are configured per route name in ``RATE_LIMITS``::
+
+    RATE_LIMITS = {"ask": {"user": (5, 60), "ip": (20, 60)}}
+
+``(capacity, seconds)`` allows a burst of ``capacity`` requests, refilled at
+``capacity / seconds`` tokens per second. ``@rate_limit("ask")`` goes above
+``@login_required`` so a denied request is answered with 429 before Flask-Login
+loads the user; the user id is read straight from the session cookie. The
+per-IP key is ``request.remote_addr``; behind a reverse proxy, set
+``TRUSTED_PROXIES`` so it is the client's address and not the proxy's.
+
+Buckets live in a memory-mapped file (``RATE_LIMIT_FILE``) of fixed 24-byte
+slots: key fingerprint, tokens, last update. Updates are serialized with
+flock, so all gunicorn workers see the same counts. The in-process fast path
+remembers denials: until a bucket has a token again, this worker rejects that
+key without touching the file. ``RATE_LIMIT_STORAGE = "memory"`` keeps
+buckets per process instead, for tests and platforms without fcntl.
+"""
+import hashlib
+import math
+import mmap
+import os
+import struct
+import threading
+import time
+from functools import wraps
+
+from flask import current_app, jsonify, request, session
+
+from backend import PROJECT_ROOT
+
+_SLOT = struct.Struct("<Qdd")  # fingerprint, tokens, updated (unix time)
+_PROBES = 8
+
+
+def _fingerprint(key):
+    # 0 marks an empty slot, so never hand it out.
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "little") or 1
+
+
+class MemoryStore:
+    """Buckets in a dict; one per process."""
+
+    def __init__(self):
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def transact(self, fn):
+        with self.lock:
+            return fn(lambda fp: self.buckets.get(fp), lambda fp, state: self.buckets.__setitem__(fp, state))
+
+
+class MmapStore:
+    """Buckets in a shared file; open addressing over ``slots`` slots."""
+
+    def __init__(self, path, slots):
+        import fcntl
+
+        self.fcntl = fcntl
+        self.slots = slots
+        self.lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        size = slots * _SLOT.size
+        if os.fstat(self.fd).st_size < size:
+            os.ftruncate(self.fd, size)
+        self.map = mmap.mmap(self.fd, size)
+
+    def _find(self, fp):
+        """Slot index for ``fp``: its own, a free one, else the least recently used."""
+        first = fp % self.slots
+        oldest, oldest_at = first, math.inf
+        for i in range(_PROBES):
+            index = (first + i) % self.slots
+            slot_fp, _, updated = _SLOT.unpack_from(self.map, index * _SLOT.size)
+            if slot_fp == fp or slot_fp == 0:
+                return index
+            if updated < oldest_at:
+                oldest, oldest_at = index, updated
+        return oldest
+
+    def transact(self, fn):
+        with self.lock:
+            self.fcntl.flock(self.fd, self.fcntl.LOCK_EX)
+            try:
+                found = {}
+
+                def get(fp):
+                    index = found[fp] = self._find(fp)
+                    slot_fp, tokens, updated = _SLOT.unpack_from(self.map, index * _SLOT.size)
+                    return (tokens, updated) if slot_fp == fp else None
+
+                def put(fp, state):
+                    _SLOT.pack_into(self.map, found[fp] * _SLOT.size, fp, *state)
+
+                return fn(get, put)
+            finally:
+                self.fcntl.flock(self.fd, self.fcntl.LOCK_UN)
+
+
+_store = None
+_store_pid = None
+_store_lock = threading.Lock()
+# fingerprint -> unix time until which this worker keeps denying it
+_denied_until = {}
+
+
+def _get_store():
+    """The process's store; reopened after fork because flock is per open file."""
+    global _store, _store_pid
+    if _store_pid != os.getpid():
+        with _store_lock:
+            if _store_pid != os.getpid():
+                config = current_app.config
+                if config.get("RATE_LIMIT_STORAGE", "mmap") == "memory":
+                    _store = MemoryStore()
+                else:
+                    path = config.get("RATE_LIMIT_FILE") or os.path.join(PROJECT_ROOT, "instance", "ratelimit.bin")
+                    _store = MmapStore(path, config.get("RATE_LIMIT_SLOTS", 65536))
+                _denied_until.clear()
+                _store_pid = os.getpid()
+    return _store
+
+
+def hit(buckets, now=None):
+    """Take one token from every bucket, or from none of them.
+
+    ``buckets`` is ``[(key, capacity, seconds)]``. Returns 0 when allowed,
+    otherwise the seconds until every bucket has a token again.
+    """
+    now = time.time() if now is None else now
+    keyed = [(_fingerprint(key), capacity, capacity / seconds) for key, capacity, seconds in buckets]
+
+    wait = max((_denied_until.get(fp, 0) - now for fp, _, _ in keyed), default=0)
+    if wait > 0:
+        return wait
+
+    def consume(get, put):
+        states = []
+        for fp, capacity, rate in keyed:
+            state = get(fp)
+            tokens = capacity if state is None else min(capacity, state[0] + (now - state[1]) * rate)
+            states.append((fp, tokens, rate))
+        short = {fp: (1 - tokens) / rate for fp, tokens, rate in states if tokens < 1}
+        if not short:
+            for fp, tokens, _ in states:
+                put(fp, (tokens - 1, now))
+        return short
+
+    short = _get_store().transact(consume)
+    if not short:
+        return 0
+    # Only the empty buckets are remembered: a shared IP bucket must not
+    # block other users just because one of them ran out.
+    for fp, wait in short.items():
+        _denied_until[fp] = now + wait
+    if len(_denied_until) > 10000:
+        for fp in [fp for fp, until in _denied_until.items() if until <= now]:
+            del _denied_until[fp]
+    return max(short.values())
+
+
+def rate_limit(name):
+    """Apply ``RATE_LIMITS[name]`` to a view; put it above ``@login_required``."""
+    def decorator(view):
+        @wraps(view)
+        def wrapped(*args, **kwargs):
+            config = current_app.config
+            limits = config.get("RATE_LIMITS", {}).get(name)
+            if limits and config.get("RATE_LIMIT_ENABLED", True):
+                buckets = []
+                user_id = session.get("_user_id")
+                if "user" in limits and user_id:
+                    buckets.append((f"{name}:u:{user_id}", *limits["user"]))
+                if "ip" in limits:
+                    buckets.append((f"{name}:ip:{request.remote_addr}", *limits["ip"]))
+                wait = hit(buckets)
+                if wait:
+                    response = jsonify({"success": False, "error": "Too many requests"})
+                    return response, 429, {"Retry-After": str(max(1, math.ceil(wait)))}
+            return view(*args, **kwargs)
+        return wrapped
+    return decorator
@@ -0,0 +1,299 @@
+# backend/recurrence.py
+"""Recurring tasks: a small RRULE subset, expanded lazily.
+
+A recurring task stores its rule text in ``task.rrule`` and its first
+occurrence in ``alarm_time``. Occurrences are never stored in advance:
+``occurrences()`` computes the ones in a requested window, jumping straight
+to the first period that can overlap it. A ``task_occurrence`` row is only
+written when one occurrence is completed or edited. Storage and reads
+therefore grow with completions, not with the length of the calendar.
+
+``task.next_occurrence`` is the next open occurrence (the alarm time for a
+one-off task), and it is indexed together with ``user_id``. The alarm path is
+one range scan over that index. ``advance()`` moves the pointer after a
+completion, and ``due_alarms()`` rolls it past occurrences that were missed.
+
+Supported rules (times are naive local wall-clock, like ``alarm_time``):
+
+    FREQ=DAILY|WEEKLY|MONTHLY   required
+    INTERVAL=n                  every n days/weeks/months (default 1)
+    BYDAY=MO,WE,FR              WEEKLY only; defaults to the start's weekday
+    COUNT=n | UNTIL=YYYYMMDD[THHMMSS]
+
+MONTHLY repeats on the start's day of month. In shorter months it falls on
+the last day instead of being skipped.
+"""
+import calendar
+from collections import namedtuple
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, select
+
+from backend.extensions import db
+
+WEEKDAYS = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+FREQS = ("DAILY", "WEEKLY", "MONTHLY")
+
+# Choices offered by the add-task form
+PRESETS = {
+    "daily": "FREQ=DAILY",
+    "weekdays": "FREQ=WEEKLY;BYDAY=MO,TU,WE,TH,FR",
+    "weekly": "FREQ=WEEKLY",
+    "monthly": "FREQ=MONTHLY",
+}
+
+
+class RecurrenceError(ValueError):
+    pass
+
+
+class Rule(namedtuple("Rule", "freq interval byday count until")):
+    __slots__ = ()
+
+    def __str__(self):
+        parts = [f"FREQ={self.freq}"]
+        if self.interval != 1:
+            parts.append(f"INTERVAL={self.interval}")
+        if self.byday:
+            parts.append("BYDAY=" + ",".join(WEEKDAYS[d] for d in self.byday))
+        if self.count is not None:
+            parts.append(f"COUNT={self.count}")
+        if self.until is not None:
+            parts.append("UNTIL=" + self.until.strftime("%Y%m%dT%H%M%S"))
+        return ";".join(parts)
+
+    # A period is one day, week or month (times INTERVAL), numbered from 0
+    # at the start. _period() lists its occurrences and _before() counts the
+    # ones in earlier periods, which COUNT needs without walking from the start.
+    def _days(self, dtstart):
+        return self.byday or (dtstart.weekday(),)
+
+    def _week0(self, dtstart):
+        return dtstart - timedelta(days=dtstart.weekday())
+
+    def _period(self, dtstart, p):
+        if self.freq == "DAILY":
+            return [dtstart + timedelta(days=p * self.interval)]
+        if self.freq == "WEEKLY":
+            week = self._week0(dtstart) + timedelta(weeks=p * self.interval)
+            days = [week + timedelta(days=d) for d in self._days(dtstart)]
+            return [d for d in days if d >= dtstart] if p == 0 else days
+        month = dtstart.year * 12 + dtstart.month - 1 + p * self.interval
+        year, month = divmod(month, 12)
+        day = min(dtstart.day, calendar.monthrange(year, month + 1)[1])
+        return [dtstart.replace(year=year, month=month + 1, day=day)]
+
+    def _before(self, dtstart, p):
+        if self.freq != "WEEKLY" or p == 0:
+            return p
+        return len(self._period(dtstart, 0)) + (p - 1) * len(self._days(dtstart))
+
+    def _index(self, dtstart, moment):
+        """A period at or before the one containing ``moment``."""
+        if moment <= dtstart:
+            return 0
+        if self.freq == "DAILY":
+            return (moment - dtstart).days // self.interval
+        if self.freq == "WEEKLY":
+            return (moment - self._week0(dtstart)).days // (7 * self.interval)
+        months = (moment.year - dtstart.year) * 12 + moment.month - dtstart.month
+        return max(0, months // self.interval - 1)
+
+    def occurrences(self, dtstart, start, end=None):
+        """Occurrences ``start <= t < end`` of a series starting at ``dtstart``."""
+        p = self._index(dtstart, start)
+        n = self._before(dtstart, p)
+        while True:
+            for occurrence in self._period(dtstart, p):
+                if self.count is not None and n >= self.count:
+                    return
+                if self.until is not None and occurrence > self.until:
+                    return
+                if end is not None and occurrence >= end:
+                    return
+                n += 1
+                if occurrence >= start:
+                    yield occurrence
+            p += 1
+
+    def after(self, dtstart, moment):
+        """The first occurrence strictly after ``moment``, or None."""
+        return next(self.occurrences(dtstart, moment + timedelta(microseconds=1)), None)
+
+    def includes(self, dtstart, moment):
+        return next(self.occurrences(dtstart, moment), None) == moment
+
+
+def _until(value):
+    for fmt in ("%Y%m%dT%H%M%S", "%Y%m%d"):
+        try:
+            until = datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+        # A date-only UNTIL includes that whole day.
+        return until if "T" in value else until + timedelta(days=1, seconds=-1)
+    raise RecurrenceError(f"Bad UNTIL: {value}")
+
+
+def parse(text):
+    """A Rule from rule text or a PRESETS name; raises RecurrenceError."""
+    text = PRESETS.get((text or "").strip().lower(), text or "").strip()
+    if text.upper().startswith("RRULE:"):
+        text = text[6:]
+    fields = {}
+    for part in filter(None, text.upper().split(";")):
+        key, sep, value = part.partition("=")
+        if not sep or key in fields:
+            raise RecurrenceError(f"Bad rule part: {part}")
+        fields[key.strip()] = value.strip()
+
+    freq = fields.pop("FREQ", None)
+    if freq not in FREQS:
+        raise RecurrenceError("FREQ must be DAILY, WEEKLY or MONTHLY")
+    try:
+        interval = int(fields.pop("INTERVAL", 1))
+        count = int(fields.pop("COUNT")) if "COUNT" in fields else None
+    except ValueError:
+        raise RecurrenceError("INTERVAL and COUNT must be whole numbers")
+    if not 1 <= interval <= 366 or (count is not None and count < 1):
+        raise RecurrenceError("INTERVAL and COUNT must be positive")
+    byday = ()
+    if "BYDAY" in fields:
+        if freq != "WEEKLY":
+            raise RecurrenceError("BYDAY is only supported with FREQ=WEEKLY")
+        names = fields.pop("BYDAY").split(",")
+        if not names or any(name not in WEEKDAYS for name in names):
+            raise RecurrenceError("BYDAY takes MO,TU,WE,TH,FR,SA,SU")
+        byday = tuple(sorted({WEEKDAYS.index(name) for name in names}))
+    until = _until(fields.pop("UNTIL")) if "UNTIL" in fields else None
+    if count is not None and until is not None:
+        raise RecurrenceError("Use COUNT or UNTIL, not both")
+    if fields:
+        raise RecurrenceError("Unsupported rule parts: " + ", ".join(sorted(fields)))
+    return Rule(freq, interval, byday, count, until)
+
+
+# ----- tasks -----
+def _completed(task_id, start, end=None):
+    from backend.models import TaskOccurrence
+
+    stmt = select(TaskOccurrence.occurs_at).where(
+        TaskOccurrence.task_id == task_id, TaskOccurrence.occurs_at >= start,
+        TaskOccurrence.completed_at.is_not(None),
+    )
+    if end is not None:
+        stmt = stmt.where(TaskOccurrence.occurs_at < end)
+    return set(db.session.execute(stmt).scalars())
+
+
+def advance(task, after=None):
+    """Point ``task.next_occurrence`` at its first open occurrence after ``after``.
+
+    With ``after=None`` the search starts from the series start (used when
+    the rule or start changes). A series with nothing left is marked completed.
+    """
+    if not task.rrule:
+        task.next_occurrence = None if task.completed else task.alarm_time
+        return task.next_occurrence
+    rule = parse(task.rrule)
+    start = task.alarm_time if after is None else after + timedelta(microseconds=1)
+    # Completions ahead of the pointer are rare (an occurrence ticked off
+    # early), so fetch them once and skip over them.
+    done = _completed(task.id, start) if task.id is not None else set()
+    for occurrence in rule.occurrences(task.alarm_time, start):
+        if occurrence not in done:
+            task.next_occurrence = occurrence
+            task.completed = False
+            return occurrence
+    task.next_occurrence = None
+    task.completed = True
+    return None
+
+
+def occurrences(user_id, start, end):
+    """Every task occurrence of ``user_id`` scheduled in ``[start, end)``.
+
+    One-off tasks with an alarm in the window are included. Edited
+    occurrences carry their new title and alarm time.
+    """
+    from backend.models import Task, TaskOccurrence
+
+    tasks = db.session.execute(
+        select(Task.id, Task.title, Task.alarm_time, Task.rrule, Task.completed)
+        .where(Task.user_id == user_id, Task.alarm_time.is_not(None), Task.alarm_time < end)
+        .where(Task.rrule.is_not(None) | (Task.alarm_time >= start))
+    ).all()
+    overrides = {
+        (row.task_id, row.occurs_at): row
+        for row in db.session.execute(
+            select(TaskOccurrence.task_id, TaskOccurrence.occurs_at, TaskOccurrence.title,
+                   TaskOccurrence.moved_to, TaskOccurrence.completed_at)
+            .where(TaskOccurrence.user_id == user_id,
+                   TaskOccurrence.occurs_at >= start, TaskOccurrence.occurs_at < end)
+        )
+    }
+    items = []
+    for task in tasks:
+        if not task.rrule:
+            items.append({"task_id": task.id, "title": task.title, "occurs_at": task.alarm_time,
+                          "alarm_time": task.alarm_time, "completed": bool(task.completed), "recurring": False})
+            continue
+        for occurs_at in parse(task.rrule).occurrences(task.alarm_time, start, end):
+            override = overrides.get((task.id, occurs_at))
+            items.append({
+                "task_id": task.id,
+                "title": (override and override.title) or task.title,
+                "occurs_at": occurs_at,
+                "alarm_time": (override and override.moved_to) or occurs_at,
+                "completed": bool(override and override.completed_at),
+                "recurring": True,
+            })
+    items.sort(key=lambda item: (item["alarm_time"], item["task_id"]))
+    return items
+
+
+def due_alarms(user_id, now, ahead, grace, limit=20):
+    """Open occurrences whose alarm falls in ``[now - grace, now + ahead]``.
+
+    Recurring tasks whose pointer is older than the grace period (missed
+    occurrences) are rolled forward first. Edited occurrences ring at their
+    new time with their new title, like in ``occurrences()``; completed ones
+    never ring. Returns ``(rows, rolled)``, where rows have ``id``, ``title``,
+    ``occurs_at``, ``alarm_time`` and ``rrule``, and ``rolled`` is True when
+    any pointer moved. The caller commits.
+    """
+    from backend.models import Task, TaskOccurrence
+
+    stale = db.session.execute(
+        select(Task).where(Task.user_id == user_id, Task.next_occurrence < now - grace, Task.rrule.is_not(None))
+    ).scalars().all()
+    for task in stale:
+        advance(task, after=now - grace - timedelta(microseconds=1))
+    if stale:
+        db.session.flush()
+    title = func.coalesce(TaskOccurrence.title, Task.title).label("title")
+    # The pointer's occurrence, unless it was moved (found below) or done early.
+    pointed = db.session.execute(
+        select(Task.id, title, Task.next_occurrence.label("occurs_at"),
+               Task.next_occurrence.label("alarm_time"), Task.rrule)
+        .outerjoin(TaskOccurrence, (TaskOccurrence.task_id == Task.id)
+                   & (TaskOccurrence.occurs_at == Task.next_occurrence))
+        .where(Task.user_id == user_id, Task.next_occurrence >= now - grace,
+               Task.next_occurrence <= now + ahead,
+               TaskOccurrence.moved_to.is_(None), TaskOccurrence.completed_at.is_(None))
+        .order_by(Task.next_occurrence).limit(limit)
+    ).all()
+    # Open occurrences moved into the window, wherever the rule put them.
+    moved = db.session.execute(
+        select(Task.id, title, TaskOccurrence.occurs_at, TaskOccurrence.moved_to.label("alarm_time"),
+               Task.rrule, Task.alarm_time.label("dtstart"))
+        .join(Task, Task.id == TaskOccurrence.task_id)
+        .where(TaskOccurrence.user_id == user_id, TaskOccurrence.moved_to >= now - grace,
+               TaskOccurrence.moved_to <= now + ahead, TaskOccurrence.completed_at.is_(None),
+               Task.rrule.is_not(None))
+        .order_by(TaskOccurrence.moved_to).limit(limit)
+    ).all()
+    # Rows left behind by a rule change are no longer occurrences.
+    moved = [row for row in moved if parse(row.rrule).includes(row.dtstart, row.occurs_at)]
+    rows = sorted(pointed + moved, key=lambda row: (row.alarm_time, row.id))[:limit]
+    return rows, bool(stale)
@@ -0,0 +1,210 @@
+# backend/retention.py
+"""Retention job: fold old rows into ``activity_rollup`` and tidy the file.
+
+Each policy names a table and an age in days. Eligible rows are handled in
+batches of ``batch_size``: one SELECT, one upsert into the rollup table, one
+DELETE by primary key and a commit, so the SQLite write lock is only ever
+held for a single small batch. ``max_batches`` bounds a single run, which
+lets the job be called often (cron, a worker loop) and catch up gradually.
+"""
+import time
+from datetime import datetime, timedelta
+
+from flask import current_app
+from sqlalchemy import case, func, select, text, tuple_
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from backend.extensions import db
+from backend.models import ActivityRollup, GameResult, Job, Quest, StudyLog, SyncOperation, Task, TaskOccurrence
+from backend.versioning import TABLE_COLLECTIONS, bump_many
+
+DEFAULT_POLICIES = {
+    "task": {"days": 90},
+    "study_log": {"days": 365},
+    "quest": {"days": 60},
+    # idempotency keys from /sync; only needed while clients may retry
+    "sync_operation": {"days": 7},
+    # finished background jobs (and the job keys they reserve)
+    "job": {"days": 7},
+    # scored game sessions; only needed until their tokens expire
+    "game_result": {"days": 30},
+}
+
+
+def _task_candidates(cutoff, limit):
+    # A finished series counts as its completed occurrences (see activity_counts).
+    occurrences = (
+        select(func.count()).select_from(TaskOccurrence)
+        .where(TaskOccurrence.task_id == Task.id, TaskOccurrence.completed_at.is_not(None))
+        .scalar_subquery()
+    )
+    completions = case((Task.rrule.is_(None), 1), else_=occurrences).label("completions")
+    return select(Task.id, Task.user_id, Task.created_at, completions).where(
+        Task.completed.is_(True), Task.created_at < cutoff
+    ).order_by(Task.id).limit(limit)
+
+
+def _study_candidates(cutoff, limit):
+    return select(StudyLog.id, StudyLog.user_id, StudyLog.created_at, StudyLog.duration).where(
+        StudyLog.created_at < cutoff
+    ).order_by(StudyLog.id).limit(limit)
+
+
+def _quest_candidates(cutoff, limit):
+    return select(Quest.id, Quest.user_id, Quest.created_at, Quest.template_id, Quest.xp).where(
+        Quest.completed.is_(True), Quest.created_at < cutoff
+    ).order_by(Quest.id).limit(limit)
+
+
+def _task_totals(row):
+    return row.completions, 0, 0
+
+
+def _study_totals(row):
+    return 1, row.duration or 0, 0
+
+
+def _quest_totals(row):
+    from backend.quest_engine import get_catalog
+
+    template = get_catalog().templates.get(row.template_id)
+    return 1, 0, (template.xp if template else row.xp) or 0
+
+
+# kind -> (model, candidate query, (count, minutes, xp) per row)
+_KINDS = {
+    "task": (Task, _task_candidates, _task_totals),
+    "study_log": (StudyLog, _study_candidates, _study_totals),
+    "quest": (Quest, _quest_candidates, _quest_totals),
+}
+
+
+# kind -> column of rows that go with a compacted row (a finished recurring
+# task's occurrences)
+_CHILDREN = {
+    "task": TaskOccurrence.__table__.c.task_id,
+}
+
+
+# kind -> (model, extra condition) for rows that are simply deleted, with no rollup
+_PURGE = {
+    "sync_operation": (SyncOperation, None),
+    "job": (Job, Job.status.in_(("done", "failed"))),
+    "game_result": (GameResult, None),
+}
+
+
+def _purge_batch(kind, cutoff, batch_size):
+    model, condition = _PURGE[kind]
+    table = model.__table__
+    pk = list(table.primary_key.columns)
+    ids = select(*pk).where(table.c.created_at < cutoff).limit(batch_size)
+    if condition is not None:
+        ids = ids.where(condition)
+    rows = db.session.execute(ids).all()
+    if rows:
+        db.session.execute(table.delete().where(tuple_(*pk).in_([tuple(r) for r in rows])))
+        db.session.commit()
+    return len(rows)
+
+
+def _compact_batch(kind, cutoff, batch_size):
+    model, candidates, totals = _KINDS[kind]
+    rows = db.session.execute(candidates(cutoff, batch_size)).all()
+    if not rows:
+        return 0
+
+    buckets = {}
+    for row in rows:
+        key = (row.user_id, (row.created_at or cutoff).date())
+        count, minutes, xp = totals(row)
+        bucket = buckets.setdefault(key, [0, 0, 0])
+        bucket[0] += count
+        bucket[1] += minutes
+        bucket[2] += xp
+
+    stmt = sqlite_insert(ActivityRollup.__table__)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["user_id", "kind", "day"],
+        set_={
+            "count": ActivityRollup.__table__.c.count + stmt.excluded.count,
+            "minutes": ActivityRollup.__table__.c.minutes + stmt.excluded.minutes,
+            "xp": ActivityRollup.__table__.c.xp + stmt.excluded.xp,
+        },
+    )
+    db.session.execute(stmt, [
+        {"user_id": user_id, "kind": kind, "day": day, "count": c, "minutes": m, "xp": x}
+        for (user_id, day), (c, m, x) in buckets.items()
+    ])
+    ids = [r.id for r in rows]
+    if kind in _CHILDREN:
+        child = _CHILDREN[kind]
+        db.session.execute(child.table.delete().where(child.in_(ids)))
+    db.session.execute(model.__table__.delete().where(model.__table__.c.id.in_(ids)))
+    bump_many([user_id for user_id, _ in buckets], TABLE_COLLECTIONS[kind])
+    db.session.commit()
+    return len(rows)
+
+
+def run_retention(policies=None, batch_size=None, max_batches=None, pause=None, now=None):
+    """Apply retention policies; returns rows compacted per kind.
+
+    ``pause`` seconds are slept between batches so request writers can
+    take the lock in between.
+    """
+    config = current_app.config
+    policies = policies or config.get("RETENTION_POLICIES", DEFAULT_POLICIES)
+    batch_size = batch_size or config.get("RETENTION_BATCH_SIZE", 500)
+    pause = config.get("RETENTION_PAUSE", 0.05) if pause is None else pause
+    now = now or datetime.utcnow()
+
+    done = {}
+    batches = 0
+    for kind, policy in policies.items():
+        days = policy.get("days")
+        if not days or (kind not in _KINDS and kind not in _PURGE):
+            continue
+        run_batch = _purge_batch if kind in _PURGE else _compact_batch
+        cutoff = now - timedelta(days=days)
+        done[kind] = 0
+        while max_batches is None or batches < max_batches:
+            count = run_batch(kind, cutoff, batch_size)
+            done[kind] += count
+            batches += 1
+            if count < batch_size:
+                break
+            if pause:
+                time.sleep(pause)
+    return done
+
+
+def rollup_totals(user_id):
+    """Compacted counts per kind for ``user_id``, e.g. {"task": 42}."""
+    rows = db.session.execute(
+        select(ActivityRollup.kind, func.sum(ActivityRollup.count))
+        .where(ActivityRollup.user_id == user_id)
+        .group_by(ActivityRollup.kind)
+    )
+    return {kind: total or 0 for kind, total in rows}
+
+
+def optimize_database(vacuum_ratio=None, engine=None):
+    """Run ANALYZE, and VACUUM once free pages pass ``vacuum_ratio``.
+
+    ``engine`` defaults to the main database. Returns the list of statements
+    that were executed.
+    """
+    if vacuum_ratio is None:
+        vacuum_ratio = current_app.config.get("RETENTION_VACUUM_RATIO", 0.25)
+    ran = []
+    db.session.commit()
+    # VACUUM cannot run inside a transaction.
+    with (engine or db.engine).connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("ANALYZE"))
+        ran.append("ANALYZE")
+        pages = conn.execute(text("PRAGMA page_count")).scalar() or 0
+        free = conn.execute(text("PRAGMA freelist_count")).scalar() or 0
+        if pages and free / pages >= vacuum_ratio:
+            conn.execute(text("VACUUM"))
+            ran.append("VACUUM")
+    return ran
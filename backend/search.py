@@ -0,0 +1,154 @@
+# backend/search.py
+"""Full-text search over tasks and study notes with SQLite FTS5.
+
+Each searchable table gets an external-content FTS5 index (no second copy of
+the text) fed through a small view that adds an ``owner`` token
+(``u<user_id>``). Queries always match ``owner:u<id>`` as well, so FTS5
+intersects the user's postings with the search terms instead of ranking
+everyone's rows and filtering afterwards. Triggers keep the indexes in sync.
+"""
+import re
+
+from markupsafe import escape
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from backend.extensions import db
+from backend.sharding import bind_for, each_shard
+
+# name -> (content table, indexed text columns, bm25 weights, columns returned)
+INDEXES = {
+    "tasks": {
+        "table": "task",
+        "columns": ("title", "description"),
+        "weights": (10.0, 4.0),
+        "label": "title",
+    },
+    "study_logs": {
+        "table": "study_log",
+        "columns": ("subject", "notes"),
+        "weights": (8.0, 4.0),
+        "label": "subject",
+    },
+}
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+# FTS5 marks matches with these; the text is escaped before they become <mark>.
+_OPEN, _CLOSE = "\x02", "\x03"
+
+
+def _ddl(spec):
+    table = spec["table"]
+    fts, src = f"{table}_fts", f"{table}_fts_src"
+    cols = ", ".join(spec["columns"])
+    new_vals = ", ".join(f"new.{c}" for c in spec["columns"])
+    old_vals = ", ".join(f"old.{c}" for c in spec["columns"])
+    return [
+        f"CREATE VIEW IF NOT EXISTS {src} AS SELECT id, 'u' || user_id AS owner, {cols} FROM {table}",
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+        f"owner, {cols}, content='{src}', content_rowid='id', "
+        f"tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN "
+        f"INSERT INTO {fts}(rowid, owner, {cols}) VALUES (new.id, 'u' || new.user_id, {new_vals}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, owner, {cols}) VALUES ('delete', old.id, 'u' || old.user_id, {old_vals}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF user_id, {cols} ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, owner, {cols}) VALUES ('delete', old.id, 'u' || old.user_id, {old_vals}); "
+        f"INSERT INTO {fts}(rowid, owner, {cols}) VALUES (new.id, 'u' || new.user_id, {new_vals}); END",
+    ]
+
+
+def install(conn):
+    """Create the FTS tables, views and triggers; returns False without FTS5."""
+    for spec in INDEXES.values():
+        fresh = not conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE name = :n"), {"n": f"{spec['table']}_fts"}
+        ).first()
+        try:
+            for statement in _ddl(spec):
+                conn.execute(text(statement))
+        except OperationalError:
+            # SQLite built without FTS5; search stays disabled.
+            return False
+        if fresh:
+            _rebuild(conn, spec)
+    return True
+
+
+def _rebuild(conn, spec):
+    fts = f"{spec['table']}_fts"
+    conn.execute(text(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')"))
+
+
+def rebuild():
+    """Rebuild and optimize every index (on every shard) from its content table."""
+    for _ in each_shard():
+        with bind_for("task")["bind"].begin() as conn:
+            install(conn)
+            for spec in INDEXES.values():
+                fts = f"{spec['table']}_fts"
+                _rebuild(conn, spec)
+                conn.execute(text(f"INSERT INTO {fts}({fts}) VALUES ('optimize')"))
+
+
+def build_match(query, user_id):
+    """FTS5 MATCH expression for free text: every word as a prefix term.
+
+    Returns None when the query has no searchable words.
+    """
+    terms = _TOKEN.findall(query or "")[:16]
+    if not terms:
+        return None
+    words = " ".join(f'"{t}"*' for t in terms)
+    # The column filter keeps words like "u12" from matching the owner token.
+    return f'owner:"u{int(user_id)}" AND - owner : ({words})'
+
+
+def _select(name, spec):
+    fts = f"{spec['table']}_fts"
+    weights = ", ".join(str(w) for w in spec["weights"])
+    # Column 0 is the owner token, which every row matches, so highlight the
+    # label and snippet the body explicitly instead of letting FTS5 choose.
+    return (
+        f"SELECT '{name}' AS type, {fts}.rowid AS id, {spec['label']} AS label, "
+        f"highlight({fts}, 1, char(2), char(3)) AS label_hl, "
+        f"snippet({fts}, 2, char(2), char(3), '…', 12) AS body_hl, "
+        f"bm25({fts}, 0.0, {weights}) AS score "
+        f"FROM {fts} WHERE {fts} MATCH :match"
+    )
+
+
+def _marked(value):
+    """``value`` HTML-escaped, with the FTS5 match markers turned into <mark>."""
+    return str(escape(value or "")).replace(_OPEN, "<mark>").replace(_CLOSE, "</mark>")
+
+
+def search(user_id, query, kinds=None, page=1, per_page=20):
+    """Ranked results for ``user_id``; returns ``(results, has_more)``.
+
+    Each ``snippet`` is safe to insert as HTML: the row's text is escaped and
+    only the ``<mark>`` tags around matches are markup.
+    """
+    match = build_match(query, user_id)
+    if match is None:
+        return [], False
+    kinds = [k for k in (kinds or INDEXES) if k in INDEXES]
+    if not kinds:
+        return [], False
+    sql = " UNION ALL ".join(_select(k, INDEXES[k]) for k in kinds)
+    rows = db.session.execute(
+        text(f"{sql} ORDER BY score LIMIT :limit OFFSET :offset"),
+        {"match": match, "limit": per_page + 1, "offset": (page - 1) * per_page},
+        bind_arguments=bind_for("task"),
+    ).mappings().all()
+    results = [
+        {
+            "type": r["type"],
+            "id": r["id"],
+            "label": r["label"],
+            "snippet": _marked(r["body_hl"] if _OPEN in (r["body_hl"] or "") else r["label_hl"]),
+            "score": -r["score"],
+        }
+        for r in rows[:per_page]
+    ]
+    return results, len(rows) > per_page
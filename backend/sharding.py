@@ -0,0 +1,399 @@
+# backend/sharding.py
+"""Optional partitioning of per-user data across several SQLite files.
+
+With ``SHARDS`` empty (the default) everything lives in the main database
+and nothing here changes behaviour. With shards configured, e.g.::
+
+    SHARDS = {"s0": "sqlite:///shard0.db", "s1": "sqlite:///shard1.db"}
+
+- the tables in ``SHARDED_TABLES`` live on the shards. ``user_id`` picks the
+  shard through a consistent-hash ring, so adding a shard moves only about
+  1/N of the users (see ``flask rebalance-shards``);
+- everything else (quest catalog, jobs, the ``user_directory`` that hands
+  out globally unique user ids and maps usernames to them) stays in the main
+  database;
+- a request works on one shard. ``load_user`` selects it, and the session
+  routes ORM and Core statements on sharded tables to that shard's engine.
+  Raw ``text()`` SQL on sharded tables must pass ``bind_arguments`` from
+  ``bind_for()``;
+- cross-user reads go through ``scatter()``. It runs a function once per
+  shard in parallel, each on its own session.
+
+Every shard has its own SQLite write lock, so writes for users on
+different shards do not queue behind one lock. That only pays off when
+writers actually contend for it (see benchmarks/bench_sharding.py); at
+ordinary load a single file is as fast, and sharding mainly bounds the
+size of each file.
+"""
+import bisect
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+import sqlalchemy as sa
+from flask import current_app, g
+from flask_sqlalchemy.session import Session
+from sqlalchemy.orm import Session as PlainSession
+from sqlalchemy.sql import visitors
+
+SHARDED_TABLES = frozenset({
+    "user", "task", "quest", "study_log", "quest_completion",
+    "collection_version", "sync_operation", "activity_rollup", "game_result", "open_game",
+    "quiz_review", "task_occurrence", "progress_event", "progress_state",
+    "xp_history",
+})
+
+
+def _hash(value):
+    return int.from_bytes(hashlib.blake2b(str(value).encode(), digest_size=8).digest(), "big")
+
+
+class HashRing:
+    """Consistent hashing with ``vnodes`` points per shard."""
+
+    def __init__(self, names, vnodes=64):
+        points = sorted((_hash(f"{name}#{i}"), name) for name in names for i in range(vnodes))
+        self.keys = [p for p, _ in points]
+        self.names = [n for _, n in points]
+
+    def shard_for(self, user_id):
+        index = bisect.bisect(self.keys, _hash(user_id)) % len(self.keys)
+        return self.names[index]
+
+
+def _table_of(clause):
+    """Name of the sharded table a statement targets, if any."""
+    if isinstance(clause, sa.Table):
+        return clause.name if clause.name in SHARDED_TABLES else None
+    table = getattr(clause, "table", None)  # INSERT / UPDATE / DELETE
+    if isinstance(table, sa.Table):
+        return _table_of(table)
+    if isinstance(clause, sa.Select):
+        # Walk the whole statement: scalar subqueries have no FROM of their own.
+        for element in visitors.iterate(clause):
+            if isinstance(element, sa.Table) and element.name in SHARDED_TABLES:
+                return element.name
+    return None
+
+
+class ShardedSession(Session):
+    """db.session: statements on sharded tables go to the selected shard."""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and enabled():
+            table = None
+            if mapper is not None:
+                table = _table_of(sa.inspect(mapper).local_table)
+            if table is None and clause is not None:
+                table = _table_of(clause)
+            if table is not None:
+                return shard_engine(current_shard())
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+# session.info["writes"] is set while a transaction holds uncommitted writes,
+# so use_shard() can refuse to drop them.
+def _wrote(session, *args):
+    session.info["writes"] = True
+
+
+def _wrote_dml(state):
+    if state.is_insert or state.is_update or state.is_delete:
+        _wrote(state.session)
+
+
+def _ended(session, *args):
+    session.info.pop("writes", None)
+
+
+sa.event.listen(ShardedSession, "after_flush", _wrote)
+sa.event.listen(ShardedSession, "do_orm_execute", _wrote_dml)
+sa.event.listen(ShardedSession, "after_commit", _ended)
+sa.event.listen(ShardedSession, "after_rollback", _ended)
+
+
+def has_pending_writes(session):
+    """True if ``session`` has changes that are not committed yet."""
+    return bool(session.new or session.dirty or session.deleted or session.info.get("writes"))
+
+
+def enabled():
+    return bool(current_app.config.get("SHARDS"))
+
+
+def shard_names():
+    return sorted(current_app.config.get("SHARDS") or ())
+
+
+def ring():
+    rings = current_app.extensions.setdefault("shard_ring", {})
+    names = tuple(shard_names())
+    if names not in rings:
+        rings[names] = HashRing(names, current_app.config.get("SHARD_VNODES", 64))
+    return rings[names]
+
+
+def shard_for(user_id):
+    return ring().shard_for(int(user_id))
+
+
+def shard_engine(name):
+    from backend.extensions import db
+
+    return db.engines[name]
+
+
+def current_shard():
+    name = g.get("shard")
+    if name is None:
+        raise RuntimeError("No shard selected; call use_shard_for(user_id) first")
+    return name
+
+
+def use_shard(name):
+    """Select the shard for the rest of this app context.
+
+    Switching shards ends the current session, because ids of rows other than
+    users are only unique within one shard. Commit or roll back first: with
+    uncommitted writes this raises ``RuntimeError`` rather than deciding for
+    the caller whether they should be kept.
+    """
+    from backend.extensions import db
+
+    if g.get("shard") not in (None, name):
+        if has_pending_writes(db.session):
+            raise RuntimeError(f"Uncommitted changes on shard {g.shard!r}; commit or roll back before switching")
+        db.session.remove()
+    g.shard = name
+
+
+def use_shard_for(user_id):
+    if enabled():
+        use_shard(shard_for(user_id))
+
+
+@contextmanager
+def using_shard(name):
+    """Select ``name`` for the block; commits it and restores the previous one."""
+    from backend.extensions import db
+
+    previous = g.get("shard")
+    use_shard(name)
+    try:
+        yield
+        db.session.commit()
+    finally:
+        db.session.remove()
+        if previous is None:
+            g.pop("shard", None)
+        else:
+            g.shard = previous
+
+
+def each_shard():
+    """Yield each shard name with it selected; once with None when unsharded."""
+    if not enabled():
+        yield None
+        return
+    for name in shard_names():
+        with using_shard(name):
+            yield name
+
+
+def bind_for(table_name):
+    """``bind_arguments`` for raw SQL on ``table_name``."""
+    from backend.extensions import db
+
+    if enabled() and table_name in SHARDED_TABLES:
+        return {"bind": shard_engine(current_shard())}
+    return {"bind": db.engine}
+
+
+def scatter(fn):
+    """Run ``fn(session)`` on every shard in parallel; returns the results.
+
+    Each call gets its own short-lived session. Without shards, ``fn`` runs
+    once against the main database.
+    """
+    from backend.extensions import db
+
+    if not enabled():
+        return [fn(db.session)]
+
+    # Engines are looked up here; the pool threads have no app context.
+    engines = [shard_engine(name) for name in shard_names()]
+
+    def run(engine):
+        with PlainSession(bind=engine) as session:
+            return fn(session)
+
+    with ThreadPoolExecutor(max_workers=len(engines)) as pool:
+        return list(pool.map(run, engines))
+
+
+# ----- users -----
+def find_user(username):
+    """The User called ``username`` (with its shard selected), or None."""
+    from backend.extensions import db
+    from backend.models import User, UserDirectory
+
+    if enabled():
+        entry = UserDirectory.query.filter_by(username=username).first()
+        if entry is None:
+            return None
+        use_shard_for(entry.id)
+        return db.session.get(User, entry.id)
+    return User.query.filter_by(username=username).first()
+
+
+def get_user(user_id):
+    """Read any user without switching the request's shard.
+
+    A user on another shard is loaded in a separate session and returned
+    detached, so it is for display only.
+    """
+    from backend.extensions import db
+    from backend.models import User
+
+    if not enabled() or shard_for(user_id) == g.get("shard"):
+        return db.session.get(User, user_id)
+    with PlainSession(bind=shard_engine(shard_for(user_id)), expire_on_commit=False) as session:
+        user = session.get(User, user_id)
+        if user is not None:
+            session.expunge(user)
+        return user
+
+
+def new_user(**fields):
+    """Add a User to the session; with shards its id comes from user_directory."""
+    from backend.extensions import db
+    from backend.models import User, UserDirectory
+
+    if enabled():
+        # Leave any selected shard first: the directory row written below
+        # must stay in the session that the new user's shard then uses.
+        use_shard(None)
+        entry = UserDirectory(username=fields["username"])
+        db.session.add(entry)
+        db.session.flush()
+        fields["id"] = entry.id
+        use_shard_for(entry.id)
+    user = User(**fields)
+    db.session.add(user)
+    return user
+
+
+def rename_user(user, username):
+    """Change a username; returns False if it is taken."""
+    from backend.extensions import db
+    from backend.models import User, UserDirectory
+
+    if enabled():
+        if UserDirectory.query.filter_by(username=username).first():
+            return False
+        entry = db.session.get(UserDirectory, user.id)
+        if entry is None:
+            db.session.add(UserDirectory(id=user.id, username=username))
+        else:
+            entry.username = username
+    elif User.query.filter_by(username=username).first():
+        return False
+    user.username = username
+    return True
+
+
+# ----- schema and rebalancing -----
+def init_shard(engine):
+    """Create (or upgrade) the sharded tables and search indexes on ``engine``."""
+    from backend.extensions import db
+    from backend.migrations import upgrade_schema
+    from backend.search import install as install_search
+
+    upgrade_schema(engine)
+    db.metadata.create_all(engine, tables=[t for t in db.metadata.sorted_tables if t.name in SHARDED_TABLES])
+    with engine.begin() as conn:
+        install_search(conn)
+
+
+# table -> ((column, referenced table), ...) for ids renumbered by a move
+_ID_REFS = {
+    "task_occurrence": (("task_id", "task"),),
+}
+
+
+def _user_clause(table, user_id):
+    return table.c.id == user_id if table.name == "user" else table.c.user_id == user_id
+
+
+def _move_user(user_id, source, target):
+    """Copy one user's rows to ``target``, then delete them from ``source``.
+
+    Rows with their own integer id (tasks, quests, study logs) get new ids on
+    the target, since ids are only unique per shard; columns listed in
+    ``_ID_REFS`` are rewritten to match. A copy left behind by an
+    interrupted run is replaced, because the source stays authoritative until
+    the final delete.
+    """
+    from backend.extensions import db
+
+    # A main database from before sharding may lack the newer per-user tables.
+    present = set(sa.inspect(source).get_table_names())
+    tables = [t for t in db.metadata.sorted_tables if t.name in SHARDED_TABLES and t.name in present]
+    referenced = {parent for refs in _ID_REFS.values() for _, parent in refs}
+    new_ids = {}
+    with source.connect() as src, target.begin() as dst:
+        for table in tables:
+            rows = [dict(r) for r in src.execute(sa.select(table).where(_user_clause(table, user_id))).mappings()]
+            dst.execute(table.delete().where(_user_clause(table, user_id)))
+            if not rows:
+                continue
+            for column, parent in _ID_REFS.get(table.name, ()):
+                ids = new_ids.get(parent, {})
+                for row in rows:
+                    row[column] = ids.get(row[column], row[column])
+            if table.name != "user" and list(table.primary_key.columns.keys()) == ["id"]:
+                if table.name in referenced:
+                    # One insert per row to learn each new id.
+                    ids = new_ids[table.name] = {}
+                    for row in rows:
+                        old = row.pop("id")
+                        ids[old] = dst.execute(table.insert(), row).inserted_primary_key[0]
+                    continue
+                for row in rows:
+                    row.pop("id")
+            dst.execute(table.insert(), rows)
+    with source.begin() as src:
+        for table in reversed(tables):
+            src.execute(table.delete().where(_user_clause(table, user_id)))
+
+
+def rebalance(dry_run=False):
+    """Move every user whose rows are not on ``shard_for(user_id)``.
+
+    The main database is also scanned, so this is how an unsharded install
+    is split up. Returns ``{(source, target): users}``.
+    """
+    from backend.extensions import db
+    from backend.models import UserDirectory
+
+    sources = [(name, shard_engine(name)) for name in shard_names()]
+    if sa.inspect(db.engine).has_table("user"):
+        sources.append(("main", db.engine))
+    user = db.metadata.tables["user"]
+    moves = {}
+    for name, engine in sources:
+        with engine.connect() as conn:
+            users = conn.execute(sa.select(user.c.id, user.c.username)).all()
+        for user_id, username in users:
+            target = shard_for(user_id)
+            if target == name:
+                continue
+            moves[(name, target)] = moves.get((name, target), 0) + 1
+            if dry_run:
+                continue
+            # Users created before sharding have no directory entry yet.
+            if db.session.get(UserDirectory, user_id) is None:
+                db.session.add(UserDirectory(id=user_id, username=username))
+                db.session.commit()
+            _move_user(user_id, engine, shard_engine(target))
+    return moves
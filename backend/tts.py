@@ -0,0 +1,187 @@
+# backend/tts.py
+"""Text-to-speech with a content-addressed disk cache.
+
+Audio is stored under ``TTS_CACHE_DIR`` as ``<sha256>.<ext>``. The hash
+covers the backend's voice key (provider, model, voice id, format) and the
+text. A reply is synthesized at most once per voice, and its URL never
+changes meaning, so browsers may cache it forever.
+
+``TTS_BACKEND`` picks the provider: ``minimax``, ``stub`` (a short silent WAV,
+for tests and offline development) or ``none``.
+"""
+import hashlib
+import io
+import os
+import re
+import tempfile
+import threading
+import wave
+
+from flask import current_app
+
+from backend import PROJECT_ROOT
+from backend.jobs import job
+
+
+class TTSError(Exception):
+    """Synthesis is disabled or the provider failed."""
+
+
+class StubBackend:
+    """Silent audio whose length follows the text; no network."""
+
+    name = "stub"
+    ext = "wav"
+    mimetype = "audio/wav"
+
+    def __init__(self, config):
+        self.voice_key = "stub"
+
+    def synthesize(self, text):
+        buf = io.BytesIO()
+        with wave.open(buf, "wb") as w:
+            w.setnchannels(1)
+            w.setsampwidth(2)
+            w.setframerate(8000)
+            w.writeframes(b"\0\0" * 400 * max(1, len(text) // 4))
+        return buf.getvalue()
+
+
+class MiniMaxBackend:
+    """MiniMax T2A v2 (``/v1/t2a_v2``); audio comes back hex-encoded."""
+
+    name = "minimax"
+    ext = "mp3"
+    mimetype = "audio/mpeg"
+
+    def __init__(self, config):
+        self.api_key = config.get("MINIMAX_API_KEY")
+        self.voice_id = config.get("MINIMAX_VOICE_ID")
+        self.model = config.get("MINIMAX_TTS_MODEL", "speech-02-hd")
+        self.url = config.get("MINIMAX_API_URL", "https://api.minimax.io/v1/t2a_v2")
+        self.group_id = config.get("MINIMAX_GROUP_ID")
+        self.voice_key = f"minimax:{self.model}:{self.voice_id}:mp3"
+
+    def synthesize(self, text):
+        # Imported here like /ask does; only synthesizing workers need it.
+        import requests
+
+        payload = {
+            "model": self.model,
+            "text": text,
+            "stream": False,
+            "voice_setting": {"voice_id": self.voice_id, "speed": 1, "vol": 1, "pitch": 0},
+            "audio_setting": {"sample_rate": 32000, "bitrate": 128000, "format": "mp3", "channel": 1},
+        }
+        params = {"GroupId": self.group_id} if self.group_id else None
+        try:
+            response = requests.post(self.url, params=params, json=payload, timeout=30,
+                                     headers={"Authorization": f"Bearer {self.api_key}"})
+            body = response.json()
+        except (requests.RequestException, ValueError) as e:
+            raise TTSError(f"MiniMax request failed: {e}")
+        status = (body.get("base_resp") or {}).get("status_code", -1)
+        audio = (body.get("data") or {}).get("audio")
+        if status != 0 or not audio:
+            raise TTSError((body.get("base_resp") or {}).get("status_msg") or "MiniMax returned no audio")
+        return bytes.fromhex(audio)
+
+
+BACKENDS = {
+    "minimax": MiniMaxBackend,
+    "stub": StubBackend,
+}
+
+_KEY = re.compile(r"^[0-9a-f]{64}$")
+_locks = {}
+_locks_guard = threading.Lock()
+
+
+def enabled():
+    return (current_app.config.get("TTS_BACKEND") or "none") in BACKENDS
+
+
+def get_backend():
+    name = current_app.config.get("TTS_BACKEND") or "none"
+    if name not in BACKENDS:
+        raise TTSError("Speech synthesis is disabled")
+    return BACKENDS[name](current_app.config)
+
+
+def cache_dir():
+    path = current_app.config.get("TTS_CACHE_DIR") or os.path.join(PROJECT_ROOT, "instance", "tts_cache")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def cache_key(text, voice_key):
+    return hashlib.sha256(f"{voice_key}\0{text}".encode("utf-8")).hexdigest()
+
+
+def cached_path(key, ext):
+    """Path of a cached clip, or None if ``key`` is malformed or missing."""
+    if not _KEY.match(key or ""):
+        return None
+    path = os.path.join(cache_dir(), f"{key}.{ext}")
+    return path if os.path.exists(path) else None
+
+
+def synthesize_cached(text, backend=None):
+    """``(key, backend)`` for ``text``, synthesizing only on a cache miss."""
+    text = " ".join((text or "").split())
+    if not text:
+        raise TTSError("Nothing to say")
+    backend = backend or get_backend()
+    key = cache_key(text, backend.voice_key)
+    if cached_path(key, backend.ext):
+        return key, backend
+
+    # One synthesis per clip per process; other processes may race us, but
+    # the rename below is atomic and both write identical bytes.
+    with _locks_guard:
+        lock = _locks.setdefault(key, threading.Lock())
+    with lock:
+        if not cached_path(key, backend.ext):
+            audio = backend.synthesize(text)
+            directory = cache_dir()
+            fd, tmp = tempfile.mkstemp(dir=directory, suffix=".part")
+            with os.fdopen(fd, "wb") as f:
+                f.write(audio)
+            os.replace(tmp, os.path.join(directory, f"{key}.{backend.ext}"))
+    with _locks_guard:
+        _locks.pop(key, None)
+    return key, backend
+
+
+def warm(texts):
+    """Pre-synthesize ``texts``; returns ``(synthesized, already_cached)``."""
+    backend = get_backend()
+    made = hit = 0
+    for text in texts:
+        text = " ".join(text.split())
+        if cached_path(cache_key(text, backend.voice_key), backend.ext):
+            hit += 1
+        else:
+            synthesize_cached(text, backend)
+            made += 1
+    return made, hit
+
+
+@job("tts.synthesize", priority=10, max_attempts=3)
+def synthesize_job(text):
+    """Fill the cache for ``text`` outside the request that needed it."""
+    synthesize_cached(text)
+
+
+def audio_key(text):
+    """``(key, backend)`` for ``text`` if its clip is already cached, else None.
+
+    A miss enqueues ``tts.synthesize`` (deduped by key) for the job workers.
+    """
+    backend = get_backend()
+    text = " ".join((text or "").split())
+    key = cache_key(text, backend.voice_key)
+    if cached_path(key, backend.ext):
+        return key, backend
+    synthesize_job.apply((text,), key=f"tts:{key}")
+    return None
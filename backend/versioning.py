@@ -0,0 +1,79 @@
+# backend/versioning.py
+"""Per-user collection versions and conditional GET for list endpoints.
+
+Every route that changes a user's tasks, quests or study logs calls
+``bump(user_id, collection)`` before committing. Read endpoints wrapped in
+``@conditional(collection)`` turn that counter into a weak ETag and answer
+``304 Not Modified`` when the client already has it, before the view (and
+any ORM work) runs.
+"""
+from functools import wraps
+
+from flask import make_response, request
+from flask_login import current_user
+from sqlalchemy import select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from backend.extensions import db
+from backend.models import CollectionVersion
+
+TASKS = "tasks"
+QUESTS = "quests"
+STUDY_LOGS = "study_logs"
+QUIZ = "quiz"
+PROGRESS = "progress"
+
+# table name -> collection, for code that works on raw tables
+TABLE_COLLECTIONS = {"task": TASKS, "task_occurrence": TASKS, "quest": QUESTS, "study_log": STUDY_LOGS}
+
+
+def bump(user_id, *collections):
+    """Increment the given collections for ``user_id`` in the current transaction."""
+    bump_many([user_id], *collections)
+
+
+def bump_many(user_ids, *collections):
+    """bump() for several users in a single statement."""
+    table = CollectionVersion.__table__
+    stmt = sqlite_insert(table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["user_id", "collection"],
+        set_={"version": table.c.version + 1},
+    )
+    rows = [{"user_id": u, "collection": c, "version": 1} for u in set(user_ids) for c in collections]
+    if rows:
+        db.session.execute(stmt, rows)
+
+
+def current_version(user_id, collection):
+    version = db.session.execute(
+        select(CollectionVersion.version).where(
+            CollectionVersion.user_id == user_id, CollectionVersion.collection == collection
+        )
+    ).scalar()
+    return version or 0
+
+
+def conditional(collection, extra=None):
+    """Serve ``304`` when the client's If-None-Match matches the collection.
+
+    ``extra`` is an optional callable returning anything else the response
+    depends on (query args, catalog version, ...); it is folded into the tag.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            parts = [collection, str(current_user.id), str(current_version(current_user.id, collection))]
+            if extra is not None:
+                parts.append(str(extra()))
+            etag = "-".join(parts)
+            if request.if_none_match.contains_weak(etag):
+                response = make_response("", 304)
+            else:
+                response = make_response(view(*args, **kwargs))
+            response.set_etag(etag, weak=True)
+            # Let the browser keep the body but revalidate on every fetch.
+            response.headers["Cache-Control"] = "private, no-cache"
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,43 @@
+# benchmarks/_setup.py
+# Shared helpers for the benchmark scripts: a throwaway app on a temp SQLite
+# file so nothing ever touches instance/Sam.db.
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend import create_app  # noqa: E402
+from backend.cli import init_db  # noqa: E402
+
+
+def make_app(blueprints=None, **config):
+    tmp = tempfile.mkdtemp(prefix="sam-bench-")
+    settings = {"SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp}/bench.db", "TESTING": True}
+    settings.update(config)
+    app = create_app(settings, blueprints=blueprints)
+    with app.app_context():
+        init_db()
+    return app
+
+
+def make_users(n, prefix="bench"):
+    from backend.extensions import db
+    from backend.models import User
+
+    users = [User(username=f"{prefix}{i}", password="x", weight_kg=70.0, height_cm=175.0) for i in range(n)]
+    db.session.add_all(users)
+    db.session.commit()
+    return [u.id for u in users]
+
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def report(label, seconds, ops, unit="ops"):
+    rate = ops / seconds if seconds else float("inf")
+    print(f"{label:<40} {ops:>8} {unit} in {seconds:8.3f}s  {rate:10.1f} {unit}/s")
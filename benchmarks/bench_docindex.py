@@ -0,0 +1,53 @@
+# benchmarks/bench_docindex.py
+"""/ask grounding: index build, per-worker load and query cost.
+
+    python benchmarks/bench_docindex.py [queries]
+
+Builds the ms-documents index into a temp file, then times opening it
+(what each worker pays once) and running ``context_for`` over a few
+app questions. Prints, per question, the context tokens added and whether
+it was answered locally, i.e. with no upstream call at all.
+"""
+import os
+import sys
+import tempfile
+
+from _setup import make_app, report, timed
+
+from backend import docindex
+
+QUESTIONS = [
+    "how do quests work",
+    "what is topper mode",
+    "how do I earn XP for tasks",
+    "pomodoro study timer",
+    "what are the daily weekly and monthly quests",
+    "write me a poem about cats",
+]
+
+
+def _queries(n):
+    for i in range(n):
+        docindex.context_for(QUESTIONS[i % len(QUESTIONS)])
+
+
+def main(queries=5000):
+    path = os.path.join(tempfile.mkdtemp(prefix="sam-bench-"), "doc_index.bin")
+    app = make_app(blueprints=[], DOC_INDEX_FILE=path)
+    with app.app_context():
+        seconds, stats = timed(docindex.build, app.config["DOCS_DIR"], path)
+        report(f"build ({stats['chunks']} chunks)", seconds, stats["terms"], "terms")
+        seconds, _ = timed(lambda n: [docindex.DocIndex(path) for _ in range(n)], 1000)
+        report("open index", seconds, 1000, "opens")
+        seconds, _ = timed(_queries, queries)
+        report("context_for", seconds, queries, "queries")
+
+        for question in QUESTIONS:
+            hits = docindex.context_for(question)
+            local = docindex.local_answer(question, hits) is not None
+            added = sum(docindex.estimate_tokens(hit.text) for hit in hits)
+            print(f"  {question:<46} {len(hits)} chunks  +{added:>4} tokens  {'local' if local else 'upstream'}")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:2]))
@@ -0,0 +1,53 @@
+# benchmarks/bench_jobs.py
+"""Background job queue throughput.
+
+    python benchmarks/bench_jobs.py [jobs] [processes]
+
+Enqueues ``jobs`` no-op jobs in one transaction (per-call and batched), then drains them with
+``run_workers(burst=True)`` at a few batch sizes, in one process and in
+``processes`` processes. The numbers are queue overhead only (claim, lease,
+mark done); real jobs add their own runtime on top.
+"""
+import sys
+
+from _setup import make_app, report, timed
+
+from backend.extensions import db
+from backend.jobs import job, run_workers, stats
+
+
+@job("bench.noop")
+def noop(i):
+    pass
+
+
+def _enqueue(n):
+    for i in range(n):
+        noop.delay(i)
+    db.session.commit()
+
+
+def _enqueue_many(n):
+    noop.map((i,) for i in range(n))
+    db.session.commit()
+
+
+def main(jobs=20000, processes=4):
+    for batch_size in (10, 100, 500):
+        for procs in sorted({1, processes}):
+            app = make_app(blueprints=[])
+            with app.app_context():
+                first = batch_size == 10 and procs == 1
+                seconds, _ = timed(_enqueue if first else _enqueue_many, jobs)
+                if first:
+                    report("enqueue .delay() x N, one commit", seconds, jobs, "jobs")
+                elif procs == 1:
+                    report("enqueue .map(), one executemany", seconds, jobs, "jobs")
+            seconds, _ = timed(run_workers, app, procs, batch_size, True)
+            with app.app_context():
+                assert stats() == {"done": jobs}, stats()
+            report(f"drain batch={batch_size} processes={procs}", seconds, jobs, "jobs")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:3]))
@@ -0,0 +1,62 @@
+# benchmarks/bench_password_hashing.py
+"""Logins per second per core for a few password hash settings.
+
+    python benchmarks/bench_password_hashing.py [logins] [threads]
+
+Each "login" is one passwords.verify() call against a stored hash. The
+inline rows call Werkzeug directly on one thread (how /login used to do it);
+the pool rows push ``threads`` concurrent callers through the bounded pool,
+which shows how far hashing scales before back-pressure kicks in.
+"""
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from _setup import make_app, report, timed
+
+from werkzeug.security import check_password_hash, generate_password_hash
+
+from backend import passwords
+
+METHODS = ("scrypt", "scrypt:16384:8:1", "pbkdf2:sha256:600000")
+
+
+def _inline(stored, n):
+    for _ in range(n):
+        check_password_hash(stored, "correct horse")
+
+
+def _pooled(app, stored, n, threads):
+    def login(_):
+        with app.app_context():
+            try:
+                return passwords.verify(stored, "correct horse")[0]
+            except passwords.PasswordBusy:
+                return None
+
+    with ThreadPoolExecutor(max_workers=threads) as callers:
+        results = list(callers.map(login, range(n)))
+    return results.count(None)
+
+
+def main(logins=40, threads=8):
+    cores = os.cpu_count() or 1
+    print(f"{cores} cores, {threads} concurrent callers")
+    for method in METHODS:
+        stored = generate_password_hash("correct horse", method)
+        seconds, _ = timed(_inline, stored, logins)
+        report(f"{method} inline", seconds, logins, "logins")
+        for workers in sorted({1, min(cores, 4)}):
+            app = make_app(blueprints=["auth"], PASSWORD_METHOD=method, PASSWORD_POOL_WORKERS=workers,
+                           PASSWORD_POOL_TIMEOUT=30.0)
+            passwords._pid = None  # fresh pool for the new size
+            start = time.perf_counter()
+            rejected = _pooled(app, stored, logins, threads)
+            seconds = time.perf_counter() - start
+            report(f"{method} pool x{workers}", seconds, logins - rejected, "logins")
+            print(f"{'':<40} {(logins - rejected) / seconds / workers:10.1f} logins/s per hashing thread")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:3]))
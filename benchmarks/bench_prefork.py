@@ -0,0 +1,133 @@
+# benchmarks/bench_prefork.py
+"""gunicorn startup and per-worker memory, with and without preload.
+
+    python benchmarks/bench_prefork.py [workers] [passes]
+
+Starts gunicorn with gunicorn.conf.py on a throwaway database, once with
+GUNICORN_PRELOAD=0 and once with preload on. For each it reports the time
+until every worker is ready, then logs in and fetches each page ``passes``
+times. The first pass includes whatever warming the workers still had to do.
+Last, it reports RSS, PSS and USS per worker, read from /proc. PSS and USS
+show how much of a worker is shared with the master (Linux only).
+"""
+import os
+import re
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+import requests
+from _setup import make_app, report, timed
+
+from backend import passwords
+from backend.extensions import db
+from backend.models import User
+from backend.prefork import memory_usage
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PAGES = [
+    "/", "/profile", "/tasks", "/quests", "/dashboard/spinwheel", "/dashboard/quiz",
+    "/dashboard/memory", "/dashboard/academics", "/developers", "/budget", "/market",
+]
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _children(pid):
+    try:
+        with open(f"/proc/{pid}/task/{pid}/children") as fh:
+            return [int(p) for p in fh.read().split()]
+    except OSError:
+        return []
+
+
+def _start(uri, workers, preload, log):
+    port = _free_port()
+    tmp = os.path.dirname(uri.replace("sqlite:///", ""))
+    factory = ("backend:create_app({'SQLALCHEMY_DATABASE_URI': %r, 'RATE_LIMIT_FILE': %r, "
+               "'DOC_INDEX_FILE': %r})" % (uri, os.path.join(tmp, "ratelimit.bin"), os.path.join(tmp, "doc_index.bin")))
+    env = dict(os.environ, GUNICORN_PRELOAD="1" if preload else "0")
+    started = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "-w", str(workers),
+         "-b", f"127.0.0.1:{port}", factory],
+        cwd=ROOT, env=env, stderr=log, stdout=subprocess.DEVNULL,
+    )
+    return proc, port, started
+
+
+def _wait_ready(proc, log_path, workers, timeout=60):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        with open(log_path) as fh:
+            text = fh.read()
+        ready = re.findall(r"Worker \d+ ready in (\d+) ms", text)
+        if len(ready) >= workers:
+            return [int(ms) for ms in ready], text
+        if proc.poll() is not None:
+            raise RuntimeError(f"gunicorn exited:\n{text}")
+        time.sleep(0.01)
+    raise RuntimeError("gunicorn workers did not start in time")
+
+
+def _run(uri, workers, passes, preload):
+    label = "preload" if preload else "no preload"
+    log_path = tempfile.mktemp(prefix="sam-gunicorn-", suffix=".log")
+    with open(log_path, "w") as log:
+        proc, port, started = _start(uri, workers, preload, log)
+    try:
+        worker_ms, text = _wait_ready(proc, log_path, workers)
+        total = time.perf_counter() - started
+        print(f"{label}: all {workers} workers ready in {total * 1000:.0f} ms "
+              f"(per worker {min(worker_ms)}-{max(worker_ms)} ms after fork)")
+        for line in text.splitlines():
+            if "Preloaded in" in line:
+                print("  " + line.split("] ", 2)[-1])
+
+        base = f"http://127.0.0.1:{port}"
+        session = requests.Session()
+        session.post(f"{base}/login", data={"username": "bench0", "password": "secret"})
+
+        def fetch():
+            for page in PAGES:
+                session.get(base + page)
+
+        for n in range(passes):
+            seconds, _ = timed(fetch)
+            report(f"  {label} pass {n + 1}", seconds, len(PAGES), "pages")
+
+        usage = [memory_usage(pid) for pid in _children(proc.pid)]
+        usage = [u for u in usage if u]
+        if usage:
+            for key in ("rss", "pss", "uss"):
+                print(f"  per worker {key.upper()}: {sum(u[key] for u in usage) / len(usage) / 1024:6.1f} MiB")
+            master = memory_usage(proc.pid)
+            print(f"  master RSS {master.get('rss', 0) / 1024:.1f} MiB; total PSS "
+                  f"{(sum(u['pss'] for u in usage) + master.get('pss', 0)) / 1024:.1f} MiB")
+    finally:
+        proc.send_signal(signal.SIGTERM)
+        proc.wait(timeout=30)
+        os.unlink(log_path)
+
+
+def main(workers=4, passes=2):
+    app = make_app(blueprints=[])
+    with app.app_context():
+        db.session.add(User(username="bench0", password=passwords.hash_password("secret"),
+                            weight_kg=70.0, height_cm=175.0))
+        db.session.commit()
+        uri = app.config["SQLALCHEMY_DATABASE_URI"]
+        db.engine.dispose()
+    for preload in (False, True):
+        _run(uri, workers, passes, preload)
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:3]))
@@ -0,0 +1,45 @@
+# benchmarks/bench_progress.py
+"""Progress engine: cost per event as history grows, and replay speed.
+
+    python benchmarks/bench_progress.py [events] [batches]
+
+One user emits ``events`` study events spread over consecutive days, in
+``batches`` commits. It reports the per-event cost of each batch (it
+should stay flat however long the history gets), then the time for a full
+``replay`` of the log.
+"""
+import sys
+from datetime import datetime, timedelta
+
+from _setup import make_app, make_users, report, timed
+
+from backend.extensions import db
+from backend.models import User
+from backend.progress_engine import STUDY, emit, load_state, replay
+
+
+def main(events=20000, batches=5):
+    app = make_app(blueprints=[])
+    with app.app_context():
+        user = db.session.get(User, make_users(1)[0])
+        start = datetime(2020, 1, 1)
+        per_batch = events // batches
+
+        def batch(first):
+            for i in range(first, first + per_batch):
+                emit(user, STUDY, xp=5, value=25, now=start + timedelta(hours=8 * i))
+            db.session.commit()
+
+        for b in range(batches):
+            seconds, _ = timed(batch, b * per_batch)
+            report(f"emit, history {b * per_batch:>6}", seconds, per_batch, "events")
+
+        seconds, _ = timed(replay, user.id)
+        db.session.commit()
+        report("replay", seconds, events, "events")
+        state = load_state(user.id)
+        print(f"  study_streak={state['study_streak'][:2]} unlocked={sorted(state['unlocked'])}")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:3]))
@@ -0,0 +1,48 @@
+# benchmarks/bench_quest_generation.py
+"""Quest generation throughput: quest_engine vs. the two legacy generators.
+
+    python benchmarks/bench_quest_generation.py [users] [rounds]
+
+Every round clears the users' last_*_quest stamps so all three periods
+regenerate, which is the worst case (DELETE + INSERT for every period).
+"""
+import sys
+
+from _setup import make_app, make_users, report, timed
+
+from backend.extensions import db
+from backend.models import Quest, User
+from backend.quest_engine import generate_quests_for_user
+from legacy_quests import app_generate_quests_for_user, utils_generate_quests_for_user
+
+
+def _reset_stamps():
+    User.query.update({"last_daily_quest": None, "last_weekly_quest": None, "last_monthly_quest": None})
+    db.session.commit()
+
+
+def _run(gen, user_ids, rounds):
+    total = 0.0
+    for _ in range(rounds):
+        _reset_stamps()
+        seconds, _ = timed(lambda: [gen(uid) for uid in user_ids])
+        total += seconds
+    return total
+
+
+def main(users=200, rounds=5):
+    app = make_app(blueprints=["quests"])
+    with app.app_context():
+        user_ids = make_users(users)
+        candidates = {
+            "quest_engine": generate_quests_for_user,
+            "legacy app.py": lambda uid: app_generate_quests_for_user(uid, db, User, Quest),
+            "legacy backend/quest_utils.py": lambda uid: utils_generate_quests_for_user(uid, db, User, Quest),
+        }
+        for label, gen in candidates.items():
+            seconds = _run(gen, user_ids, rounds)
+            report(label, seconds, users * rounds, "users")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:3]))
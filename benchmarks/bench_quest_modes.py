@@ -0,0 +1,53 @@
+# benchmarks/bench_quest_modes.py
+"""Stored vs. derived quest mode over a simulated stretch of days.
+
+    python benchmarks/bench_quest_modes.py [users] [days]
+
+Each simulated day every user opens /quests once: stored mode regenerates
+the daily set (DELETE + INSERT + commit) and lists it, derived mode only
+lists. Weekly/monthly regeneration is included on their boundaries.
+"""
+import sys
+from datetime import datetime, timedelta
+
+from _setup import make_app, make_users, report, timed
+
+from backend.extensions import db
+from backend.models import User
+from backend.quest_engine import generate_quests_for_user, get_derived_quests, get_user_quests
+
+START = datetime(2025, 1, 1, 9, 0)
+
+
+def _stored(user_ids, days):
+    for _ in range(days):
+        # Age every stamp by one day instead of moving the clock.
+        for user in User.query.all():
+            for field in ("last_daily_quest", "last_weekly_quest", "last_monthly_quest"):
+                stamp = getattr(user, field)
+                if stamp:
+                    setattr(user, field, stamp - timedelta(days=1))
+        db.session.commit()
+        for uid in user_ids:
+            generate_quests_for_user(uid)
+            get_user_quests(uid)
+
+
+def _derived(user_ids, days):
+    for day in range(days):
+        now = START + timedelta(days=day)
+        for uid in user_ids:
+            get_derived_quests(uid, now=now)
+
+
+def main(users=100, days=30):
+    for label, mode, run in (("stored (regenerate + list)", "stored", _stored), ("derived (list only)", "derived", _derived)):
+        app = make_app(blueprints=["quests"], QUEST_MODE=mode)
+        with app.app_context():
+            user_ids = make_users(users)
+            seconds, _ = timed(run, user_ids, days)
+            report(label, seconds, users * days, "reads")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:3]))
@@ -0,0 +1,79 @@
+# benchmarks/bench_quiz.py
+"""Quiz bank: building question sets and recording answers.
+
+    python benchmarks/bench_quiz.py [questions] [reviewed] [sets]
+
+Loads ``questions`` generated questions and gives one user ``reviewed``
+review rows. It then times:
+- ``next_set`` with the review heap cached (the normal case) and cold
+  (rebuilt every call, as after an answer batch);
+- recording a 14-answer set, as one batch and one commit per answer.
+"""
+import random
+import sys
+import time
+
+from _setup import make_app, make_users, report, timed
+
+from backend.extensions import db
+from backend.quiz import forget, get_bank, next_set, record_answers, sync_questions
+
+
+def _questions(n):
+    return [
+        {"topic": f"topic {i % 12}", "question": f"Generated question number {i}?",
+         "options": [f"answer {i}", f"wrong {i}a", f"wrong {i}b", f"wrong {i}c"], "answer": f"answer {i}"}
+        for i in range(n)
+    ]
+
+
+def _cold(user_id, sets):
+    for _ in range(sets):
+        forget(user_id)
+        next_set(user_id, 14)
+
+
+def _warm(user_id, sets):
+    for _ in range(sets):
+        next_set(user_id, 14)
+
+
+def main(questions=2000, reviewed=1500, sets=500):
+    app = make_app(blueprints=[])
+    with app.test_request_context():
+        seconds, _ = timed(sync_questions, _questions(questions))
+        report("sync_questions", seconds, questions, "questions")
+        user_id = make_users(1)[0]
+        bank = get_bank()
+        rng = random.Random(1)
+        ids = rng.sample(bank.order, min(reviewed, len(bank.order)))
+        # Answered two days ago, so every review is due now.
+        record_answers(user_id, [(qid, bank.questions[qid].answer) for qid in ids], now=time.time() - 86400 * 2)
+        db.session.commit()
+
+        seconds, _ = timed(_warm, user_id, sets)
+        report("next_set, cached heap", seconds, sets, "sets")
+        seconds, _ = timed(_cold, user_id, sets)
+        report("next_set, heap rebuilt", seconds, sets, "sets")
+
+        def batched(n):
+            for _ in range(n):
+                chosen = rng.sample(bank.order, 14)
+                record_answers(user_id, [(qid, rng.randrange(4)) for qid in chosen])
+                db.session.commit()
+
+        def one_by_one(n):
+            for _ in range(n):
+                for qid in rng.sample(bank.order, 14):
+                    record_answers(user_id, [(qid, rng.randrange(4))])
+                    db.session.commit()
+
+        rounds = max(1, sets // 10)
+        seconds, _ = timed(batched, rounds)
+        report("record 14 answers, one batch", seconds, rounds * 14, "answers")
+        seconds, _ = timed(one_by_one, rounds)
+        report("record 14 answers, one at a time", seconds, rounds * 14, "answers")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:4]))
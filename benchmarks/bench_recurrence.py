@@ -0,0 +1,66 @@
+# benchmarks/bench_recurrence.py
+"""Recurring tasks: week views and alarm lookups as history grows.
+
+    python benchmarks/bench_recurrence.py [tasks] [years] [calls]
+
+Gives one user ``tasks`` daily/weekday tasks that started ``years`` ago, and
+completes every other occurrence up to today. Then it times a one-week
+``occurrences`` window today and at the series start, plus ``due_alarms``.
+Neither cost should depend on how far back the series starts.
+"""
+import sys
+from datetime import datetime, timedelta
+
+from _setup import make_app, make_users, report, timed
+
+from backend import recurrence
+from backend.extensions import db
+from backend.models import Task, TaskOccurrence
+
+
+def _seed(user_id, tasks, years, now):
+    start = (now - timedelta(days=365 * years)).replace(hour=7, minute=0, second=0, microsecond=0)
+    rows = []
+    for i in range(tasks):
+        rule = ("daily", "weekdays")[i % 2]
+        task = Task(user_id=user_id, title=f"habit {i}", alarm_time=start, rrule=str(recurrence.parse(rule)))
+        db.session.add(task)
+        db.session.flush()
+        for n, occurs_at in enumerate(recurrence.parse(rule).occurrences(start, start, now)):
+            if n % 2 == 0:
+                rows.append({"user_id": user_id, "task_id": task.id, "occurs_at": occurs_at, "completed_at": now})
+        recurrence.advance(task, after=now - timedelta(days=1))
+    db.session.execute(TaskOccurrence.__table__.insert(), rows)
+    db.session.commit()
+    return start, len(rows)
+
+
+def main(tasks=20, years=3, calls=200):
+    app = make_app(blueprints=[])
+    now = datetime(2025, 9, 9, 6, 30)
+    with app.app_context():
+        user_id = make_users(1)[0]
+        seconds, (start, completions) = timed(_seed, user_id, tasks, years, now)
+        report(f"seed ({completions} completions)", seconds, tasks, "tasks")
+
+        def window(at, n):
+            for _ in range(n):
+                items = recurrence.occurrences(user_id, at, at + timedelta(days=7))
+            return len(items)
+
+        seconds, count = timed(window, now, calls)
+        report(f"week view today ({count} occurrences)", seconds, calls, "calls")
+        seconds, count = timed(window, start, calls)
+        report(f"week view at start ({count} occurrences)", seconds, calls, "calls")
+
+        def alarms(n):
+            for _ in range(n):
+                rows, _ = recurrence.due_alarms(user_id, now, timedelta(hours=1), timedelta(minutes=5))
+            return len(rows)
+
+        seconds, count = timed(alarms, calls)
+        report(f"due_alarms ({count} due)", seconds, calls, "calls")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:4]))
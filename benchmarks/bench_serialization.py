@@ -0,0 +1,103 @@
+# benchmarks/bench_serialization.py
+"""JSON list endpoints: ORM objects + jsonify vs column rows + backend.fastjson.
+
+    python benchmarks/bench_serialization.py [rows] [repeat]
+
+Builds the /get_study_logs and /tasks_list bodies for one user with ``rows``
+rows each. The old path loads full ORM objects, formats each datetime with
+strftime and calls jsonify. The new path selects the needed columns as rows
+and encodes them with the stdlib and (if installed) the orjson encoder. For
+each, it prints the best-of-``repeat`` CPU time per row and the peak Python
+memory (tracemalloc) of one call.
+"""
+import gc
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+from _setup import make_app, make_users
+
+from flask import jsonify
+from sqlalchemy import select
+
+from backend import fastjson
+from backend.extensions import db
+from backend.models import StudyLog, Task
+
+
+def _seed(user_id, rows):
+    start = datetime(2025, 1, 1)
+    db.session.execute(StudyLog.__table__.insert(), [
+        {"user_id": user_id, "subject": f"subject {i % 7}", "duration": 30 + i % 90,
+         "notes": f"chapter {i} exercises and a short summary", "created_at": start + timedelta(minutes=i)}
+        for i in range(rows)
+    ])
+    db.session.execute(Task.__table__.insert(), [
+        {"user_id": user_id, "title": f"task {i}", "completed": i % 3 == 0, "created_at": start + timedelta(minutes=i)}
+        for i in range(rows)
+    ])
+    db.session.commit()
+
+
+def orm_study_logs(user_id):
+    logs = StudyLog.query.filter_by(user_id=user_id).order_by(StudyLog.created_at.desc()).all()
+    data = [{"id": l.id, "subject": l.subject, "duration": l.duration, "notes": l.notes, "created_at": l.created_at.strftime("%Y-%m-%d %H:%M")} for l in logs]
+    return jsonify(data).get_data()
+
+
+def orm_tasks(user_id):
+    tasks = Task.query.filter_by(user_id=user_id).order_by(Task.created_at.desc()).all()
+    return jsonify([{"id": t.id, "title": t.title, "completed": t.completed} for t in tasks]).get_data()
+
+
+def fast_study_logs(user_id):
+    return fastjson.rows_response(db.session.execute(
+        select(StudyLog.id, StudyLog.subject, StudyLog.duration, StudyLog.notes, StudyLog.created_at)
+        .where(StudyLog.user_id == user_id).order_by(StudyLog.created_at.desc())
+    )).get_data()
+
+
+def fast_tasks(user_id):
+    return fastjson.rows_response(db.session.execute(
+        select(Task.id, Task.title, Task.completed)
+        .where(Task.user_id == user_id).order_by(Task.created_at.desc())
+    )).get_data()
+
+
+def _measure(fn, user_id, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        db.session.expunge_all()
+        gc.collect()
+        start = time.process_time()
+        fn(user_id)
+        best = min(best, time.process_time() - start)
+        db.session.rollback()
+    db.session.expunge_all()
+    gc.collect()
+    tracemalloc.start()
+    body = fn(user_id)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    db.session.rollback()
+    return best, peak, len(body)
+
+
+def main(rows=10000, repeat=5):
+    app = make_app(blueprints=[])
+    encoders = sorted(fastjson.ENCODERS)
+    with app.test_request_context():
+        user_id = make_users(1)[0]
+        _seed(user_id, rows)
+        for endpoint, legacy, fast in (("study_logs", orm_study_logs, fast_study_logs), ("tasks", orm_tasks, fast_tasks)):
+            runs = [("ORM + jsonify", None, legacy)] + [(f"rows + {name}", name, fast) for name in encoders]
+            for label, encoder, fn in runs:
+                app.config["JSON_ENCODER"] = encoder
+                seconds, peak, size = _measure(fn, user_id, repeat)
+                print(f"{endpoint:<11} {label:<16} {seconds / rows * 1e6:7.2f} us/row"
+                      f"  peak {peak / 2**20:7.2f} MiB  body {size / 1024:7.1f} KiB")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:3]))
@@ -0,0 +1,91 @@
+# benchmarks/bench_sharding.py
+"""Concurrent XP-award throughput against 1..N SQLite shards.
+
+    python benchmarks/bench_sharding.py [writers] [seconds] [users] [hold_ms]
+
+``writers`` processes each award XP to random users for ``seconds``: select the
+user's shard, load the user, add points, commit. That is one short write
+transaction per award, like /game/finish. With a single database every
+commit queues on the same write lock. With shards, only writers that hit the
+same shard wait for each other.
+
+``hold_ms`` keeps each write transaction open that much longer (the write is
+flushed first, so the lock is held), standing in for slow disks or request
+work done inside the transaction. On a single fast core the commit itself is
+CPU-bound and sharding cannot help; the lock contention it removes shows up
+once transactions hold the lock for a while.
+"""
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+
+from _setup import make_app
+
+from backend import sharding
+from backend.extensions import db
+from backend.models import User
+
+
+def _writer(app, user_ids, seconds, hold, results):
+    with app.app_context():
+        for engine in db.engines.values():
+            engine.dispose(close=False)
+        done = 0
+        deadline = time.perf_counter() + seconds
+        while time.perf_counter() < deadline:
+            user_id = random.choice(user_ids)
+            sharding.use_shard_for(user_id)
+            user = db.session.get(User, user_id)
+            user.points = (user.points or 0) + 1
+            if hold:
+                db.session.flush()
+                time.sleep(hold)
+            db.session.commit()
+            done += 1
+        results.put(done)
+
+
+def _make_users(n):
+    ids = []
+    for i in range(n):
+        user = sharding.new_user(username=f"bench{i}", password="x")
+        db.session.commit()
+        ids.append(user.id)
+    return ids
+
+
+def run(shards, writers, seconds, users, hold):
+    tmp = tempfile.mkdtemp(prefix="sam-bench-shards-")
+    config = {"SHARDS": {f"s{i}": f"sqlite:///{os.path.join(tmp, f's{i}.db')}" for i in range(shards)}}
+    app = make_app(blueprints=[], **config)
+    with app.app_context():
+        user_ids = _make_users(users)
+        db.session.remove()
+        for engine in db.engines.values():
+            engine.dispose()
+    ctx = multiprocessing.get_context("fork")
+    results = ctx.Queue()
+    procs = [ctx.Process(target=_writer, args=(app, user_ids, seconds, hold, results)) for _ in range(writers)]
+    for p in procs:
+        p.start()
+    total = sum(results.get() for _ in procs)
+    for p in procs:
+        p.join()
+    return total / seconds
+
+
+def main(writers=8, seconds=5, users=200, hold_ms=0):
+    print(f"{writers} writer processes, {seconds}s each, {users} users, lock held +{hold_ms}ms")
+    baseline = None
+    for shards in (0, 1, 2, 4, 8):
+        rate = run(shards, writers, seconds, users, hold_ms / 1000)
+        baseline = baseline or rate
+        label = "main database only" if not shards else f"{shards} shard(s)"
+        print(f"{label:<40} {rate:10.1f} awards/s  x{rate / baseline:.2f}")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:5]))
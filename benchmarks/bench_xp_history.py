@@ -0,0 +1,65 @@
+# benchmarks/bench_xp_history.py
+"""XP history: chart reads from the monthly buckets vs. scanning the event log.
+
+    python benchmarks/bench_xp_history.py [events] [calls]
+
+One user emits ``events`` awards, a few a day going back in time. For each
+``?range=`` the script times ``xp_series`` (one read of the month rows)
+against the same series computed by grouping ``progress_event`` by day. The
+bucket read should not depend on how many events the user has.
+"""
+import sys
+from datetime import datetime, timedelta
+
+from _setup import make_app, make_users, report, timed
+from sqlalchemy import func, select
+
+from backend.extensions import db
+from backend.models import ProgressEvent, User
+from backend.progress_engine import GAME, RANGES, emit, xp_series
+
+
+def _scan(user_id, start):
+    day = func.date(ProgressEvent.created_at)
+    return db.session.execute(select(day, func.sum(ProgressEvent.xp)).where(
+        ProgressEvent.user_id == user_id, ProgressEvent.created_at >= start).group_by(day)).all()
+
+
+def main(events=20000, calls=200):
+    app = make_app(blueprints=[])
+    now = datetime.utcnow()
+    with app.app_context():
+        user = db.session.get(User, make_users(1)[0])
+
+        def seed():
+            for i in range(events):
+                emit(user, GAME, xp=7, now=now - timedelta(hours=6 * (events - i)))
+                if i % 5000 == 4999:
+                    db.session.commit()
+            db.session.commit()
+
+        seconds, _ = timed(seed)
+        report("emit (event log + bucket)", seconds, events, "events")
+
+        for name, (days_back, _) in RANGES.items():
+            start = now - timedelta(days=days_back or 100000)
+
+            def buckets(n):
+                for _ in range(n):
+                    result = xp_series(user.id, name)
+                return result
+
+            seconds, result = timed(buckets, calls)
+            report(f"xp_series {name} ({len(result['xp'])} points)", seconds, calls, "calls")
+
+            def scan(n):
+                for _ in range(n):
+                    rows = _scan(user.id, start)
+                return rows
+
+            seconds, rows = timed(scan, calls)
+            report(f"event scan {name} ({len(rows)} days)", seconds, calls, "calls")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:3]))
@@ -0,0 +1,198 @@
+# benchmarks/legacy_quests.py
+# Frozen copies of the two quest generators that existed before
+# backend.quest_engine, kept only so bench_quest_generation.py can compare
+# against them. Do not use from application code.
+from datetime import datetime
+from random import sample as rand_sample
+
+from backend.quest_engine.default_pools import DEFAULT_POOLS
+
+# ---------- backend/quest_utils.py ----------
+UTILS_REGEN = {
+    "daily": 24 * 60 * 60,
+    "weekly": 7 * 24 * 60 * 60,
+    "monthly": 28 * 24 * 60 * 60
+}
+UTILS_COUNTS = {"daily": 3, "weekly": 2, "monthly": 1}
+UTILS_POOLS = {
+    "daily": [
+        {"title": "Do 30 pushups", "category": "physical", "type": "daily", "difficulty": "Normal", "xp": 10},
+        {"title": "Meditate 10 minutes", "category": "mental", "type": "daily", "difficulty": "Normal", "xp": 10},
+        {"title": "Track today’s expenses", "category": "financial", "type": "daily", "difficulty": "Normal", "xp": 10}
+    ],
+    "weekly": [
+        {"title": "Run total 5 km this week", "category": "physical", "type": "weekly", "difficulty": "Normal", "xp": 30},
+        {"title": "Write a weekly journal", "category": "mental", "type": "weekly", "difficulty": "Normal", "xp": 30},
+    ],
+    "monthly": [
+        {"title": "Complete 1000 pushups total", "category": "physical", "type": "monthly", "difficulty": "Hard", "xp": 100},
+        {"title": "Save 10% of income this month", "category": "financial", "type": "monthly", "difficulty": "Normal", "xp": 100}
+    ]
+}
+
+
+def utils_generate_quests_for_user(user_id, db, User, Quest):
+    user = db.session.get(User, user_id)
+    if not user:
+        return
+
+    now = datetime.utcnow()
+
+    periods = {
+        "daily": (user.last_daily_quest, UTILS_REGEN["daily"]),
+        "weekly": (user.last_weekly_quest, UTILS_REGEN["weekly"]),
+        "monthly": (user.last_monthly_quest, UTILS_REGEN["monthly"])
+    }
+
+    for period, (last_time, regen_seconds) in periods.items():
+        if not last_time or (now - last_time).total_seconds() >= regen_seconds:
+            old_quests = Quest.query.filter_by(user_id=user.id, type=period).all()
+            for q in old_quests:
+                db.session.delete(q)
+
+            pool = UTILS_POOLS.get(period, [])
+            chosen = rand_sample(pool, min(UTILS_COUNTS.get(period, 1), len(pool)))
+            for q in chosen:
+                quest = Quest(
+                    user_id=user.id,
+                    title=q["title"],
+                    category=q["category"],
+                    type=q["type"],
+                    difficulty=q["difficulty"],
+                    xp=q["xp"],
+                    completed=False
+                )
+                db.session.add(quest)
+
+            if period == "daily":
+                user.last_daily_quest = now
+            elif period == "weekly":
+                user.last_weekly_quest = now
+            elif period == "monthly":
+                user.last_monthly_quest = now
+
+    if user.weight_kg and user.height_cm:
+        bmi = user.weight_kg / ((user.height_cm / 100) ** 2)
+        title, xp = "Standard Exercise", 10
+        if bmi < 18.5:
+            title, xp = "Light Workout", 15
+        elif bmi > 25:
+            title, xp = "Moderate Cardio", 20
+
+        exists = Quest.query.filter_by(user_id=user.id, title=title, type="daily").first()
+        if not exists:
+            quest = Quest(
+                user_id=user.id,
+                title=title,
+                category="Physical",
+                type="daily",
+                difficulty="Medium",
+                xp=xp,
+                completed=False
+            )
+            db.session.add(quest)
+
+    db.session.commit()
+
+
+# ---------- app.py ----------
+APP_COUNTS = {"daily": 3, "weekly": 2, "monthly": 1}
+APP_REGEN = {
+    "daily": 24 * 3600,
+    "weekly": 7 * 24 * 3600,
+    "monthly": 30 * 24 * 3600,
+}
+
+
+def _choose_sample(pool, count):
+    if not pool:
+        return []
+    if len(pool) <= count:
+        return pool.copy()
+    try:
+        return rand_sample(pool, count)
+    except ValueError:
+        # fallback
+        return pool[:count]
+
+
+
+def app_generate_quests_for_user(user_id, db, UserModel, QuestModel):
+    """Generate quests for a user only when the regen period has passed."""
+    user = db.session.get(UserModel, user_id) if hasattr(db, "session") else UserModel.query.get(user_id)
+    if not user:
+        return
+
+    now = datetime.utcnow()
+    periods = {
+        "daily": (user.last_daily_quest, APP_REGEN["daily"]),
+        "weekly": (user.last_weekly_quest, APP_REGEN["weekly"]),
+        "monthly": (user.last_monthly_quest, APP_REGEN["monthly"]),
+    }
+
+    for period, (last_time, regen_seconds) in periods.items():
+        needs = False
+        if not last_time:
+            needs = True
+        else:
+            elapsed = (now - last_time).total_seconds()
+            if elapsed >= regen_seconds:
+                needs = True
+
+        if not needs:
+            continue
+
+        # Delete old quests of this period
+        old_quests = QuestModel.query.filter_by(user_id=user.id, type=period).all()
+        for q in old_quests:
+            db.session.delete(q)
+
+        # Choose and add new quests from pool
+        pool = DEFAULT_POOLS.get(period, [])
+        chosen = _choose_sample(pool, APP_COUNTS.get(period, 1))
+        for q in chosen:
+            quest = QuestModel(
+                user_id=user.id,
+                title=q["title"],
+                category=q.get("category", "General"),
+                type=q.get("type", period),
+                difficulty=q.get("difficulty", "Medium"),
+                xp=q.get("xp", 10),
+                completed=False,
+            )
+            db.session.add(quest)
+
+        # Personalized physical quest based on BMI (only daily)
+        if period == "daily" and user.weight_kg and user.height_cm:
+            try:
+                bmi = user.weight_kg / ((user.height_cm / 100) ** 2)
+                title, xp = "Standard Exercise", 10
+                if bmi < 18.5:
+                    title, xp = "Light Workout", 15
+                elif bmi > 25:
+                    title, xp = "Moderate Cardio", 20
+                # don't duplicate same title for same day
+                exists = QuestModel.query.filter_by(user_id=user.id, title=title, type="daily").first()
+                if not exists:
+                    q = QuestModel(
+                        user_id=user.id,
+                        title=title,
+                        category="Physical",
+                        type="daily",
+                        difficulty="Medium",
+                        xp=xp,
+                        completed=False,
+                    )
+                    db.session.add(q)
+            except Exception:
+                pass
+
+        # Update last time
+        if period == "daily":
+            user.last_daily_quest = now
+        elif period == "weekly":
+            user.last_weekly_quest = now
+        elif period == "monthly":
+            user.last_monthly_quest = now
+
+    db.session.commit()
@@ -0,0 +1,52 @@
+# gunicorn.conf.py
+# Picked up by `gunicorn -c gunicorn.conf.py app:app` (see Procfile). Bind
+# address and worker count keep gunicorn's defaults, so $PORT and
+# $WEB_CONCURRENCY still apply.
+#
+# With preload on, the master imports the app and warms it once
+# (backend.prefork.preload) before forking, so workers share the imported
+# modules, compiled templates and catalogs copy-on-write. GUNICORN_PRELOAD=0
+# turns that off: each worker then imports and warms the app on its own.
+import os
+import time
+
+preload_app = os.environ.get("GUNICORN_PRELOAD", "1") != "0"
+
+_started = time.perf_counter()
+_forked = None
+
+
+def on_starting(server):
+    if not preload_app:
+        return
+    from backend.prefork import preload, summary_lines
+
+    for line in summary_lines(preload(server.app.wsgi())):
+        server.log.info(line)
+
+
+def when_ready(server):
+    # Without preload the master never imports the app; keep it that way.
+    if not preload_app:
+        server.log.info("Master ready in %.0f ms", (time.perf_counter() - _started) * 1000)
+        return
+    from backend.prefork import describe, memory_usage
+
+    server.log.info("Master ready in %.0f ms (%s)", (time.perf_counter() - _started) * 1000, describe(memory_usage()))
+
+
+def post_fork(server, worker):
+    # Runs in the child.
+    global _forked
+    _forked = time.perf_counter()
+    if preload_app:
+        from backend.prefork import after_fork
+
+        after_fork(server.app.wsgi())
+
+
+def post_worker_init(worker):
+    from backend.prefork import describe, memory_usage
+
+    seconds = time.perf_counter() - (_forked or _started)
+    worker.log.info("Worker %s ready in %.0f ms (%s)", worker.pid, seconds * 1000, describe(memory_usage()))
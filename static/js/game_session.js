@@ -0,0 +1,67 @@
+// ============================
+// Game sessions – SAM AI-1408
+// ============================
+// Server-scored mini-games: start a session, record events as they happen,
+// finish once. XP is awarded by the server in a single write at the end.
+// Usage:
+//   const game = SamGame.start("coin");
+//   game.event("coin");                       // e.g. on every pickup
+//   game.finish().then(data => data.xp);      // or game.finish({ status: "completed", challenge })
+
+const SamGame = (() => {
+  const BATCH_SIZE = 20;
+
+  async function post(url, body) {
+    const res = await fetch(url, {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify(body)
+    });
+    return res.json();
+  }
+
+  function start(name) {
+    let token = null;
+    let startedAt = null;
+    let pending = [];
+    // Requests run one after another, each with the token from the last.
+    let chain = post("/game/start", { game: name }).then(data => {
+      if (!data.success) throw new Error(data.error || "Could not start game");
+      token = data.token;
+      startedAt = Date.now();
+      return data;
+    });
+
+    function flush() {
+      if (!pending.length) return chain;
+      chain = chain.then(() => {
+        const events = pending;
+        pending = [];
+        return post("/game/events", { token, events }).then(data => {
+          if (data.success) token = data.token;
+          return data;
+        });
+      });
+      return chain;
+    }
+
+    function event(kind) {
+      if (startedAt === null) return;  // before the session exists
+      pending.push([Date.now() - startedAt, kind]);
+      if (pending.length >= BATCH_SIZE) flush();
+    }
+
+    function finish(result) {
+      return chain.then(() => {
+        const body = { token, events: pending };
+        pending = [];
+        if (result) body.result = result;
+        return post("/game/finish", body);
+      });
+    }
+
+    return { ready: chain, event, flush, finish };
+  }
+
+  return { start };
+})();
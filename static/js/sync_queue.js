@@ -0,0 +1,82 @@
+// ============================
+// Offline action queue – SAM AI-1408
+// ============================
+// Queues XP actions in localStorage and sends them to /sync in one request.
+// Loaded by the tasks, study and quests pages for their completions.
+// Usage: SamSync.enqueue("complete_task", { task_id: 3 }).then(data => ...)
+
+const SamSync = (() => {
+  const STORAGE_KEY = "samSyncQueue";
+  const FLUSH_DELAY_MS = 1500;
+  let timer = null;
+  let flushing = null;
+  const waiters = {};
+
+  function load() {
+    try { return JSON.parse(localStorage.getItem(STORAGE_KEY)) || []; }
+    catch (e) { return []; }
+  }
+
+  function save(queue) {
+    localStorage.setItem(STORAGE_KEY, JSON.stringify(queue));
+  }
+
+  function newKey() {
+    if (window.crypto && crypto.randomUUID) return crypto.randomUUID();
+    return Date.now().toString(36) + Math.random().toString(36).slice(2);
+  }
+
+  // Add an operation; resolves with the /sync response once it is sent.
+  function enqueue(type, args) {
+    const op = { key: newKey(), type, args: args || {} };
+    const queue = load();
+    queue.push(op);
+    save(queue);
+    schedule();
+    return new Promise(resolve => { waiters[op.key] = resolve; });
+  }
+
+  function schedule() {
+    clearTimeout(timer);
+    timer = setTimeout(flush, FLUSH_DELAY_MS);
+  }
+
+  async function flush() {
+    if (flushing) return flushing;
+    const queue = load();
+    if (!queue.length || !navigator.onLine) return null;
+    flushing = (async () => {
+      try {
+        const resp = await fetch("/sync", {
+          method: "POST",
+          headers: { "Content-Type": "application/json" },
+          credentials: "include",
+          body: JSON.stringify({ operations: queue })
+        });
+        if (!resp.ok) throw new Error("sync failed: " + resp.status);
+        const data = await resp.json();
+        // Keys are idempotent server-side, so anything queued meanwhile is kept.
+        const sent = new Set(queue.map(op => op.key));
+        save(load().filter(op => !sent.has(op.key)));
+        data.results.forEach(r => {
+          if (waiters[r.key]) { waiters[r.key](Object.assign({}, data, { result: r })); delete waiters[r.key]; }
+        });
+        return data;
+      } catch (err) {
+        console.error(err);
+        return null;
+      } finally {
+        flushing = null;
+      }
+    })();
+    return flushing;
+  }
+
+  window.addEventListener("online", flush);
+  document.addEventListener("visibilitychange", () => {
+    if (document.visibilityState === "hidden") flush();
+  });
+  document.addEventListener("DOMContentLoaded", flush);
+
+  return { enqueue, flush };
+})();
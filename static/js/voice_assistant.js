@@ -77,7 +77,13 @@ function showFeedback(text,type="info"){
   setTimeout(()=>feedback.style.display="none",5000);
 }
 
+// Server voice first (cached per reply); browser voice if TTS is off or fails
 function speakAI(text){
+  const audio = new Audio("/tts?text="+encodeURIComponent(text));
+  audio.play().catch(()=>speakBrowser(text));
+}
+
+function speakBrowser(text){
   const synth = window.speechSynthesis;
   const utter = new SpeechSynthesisUtterance(text);
   utter.rate=1; utter.pitch=1;
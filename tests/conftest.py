@@ -0,0 +1,84 @@
+# tests/conftest.py
+# Each test gets a throwaway app on a temp SQLite file, like the benchmarks,
+# so nothing ever touches instance/Sam.db.
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend import create_app  # noqa: E402
+from backend.cli import init_db  # noqa: E402
+from backend.extensions import db  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _forget_binds():
+    yield
+    # init_app() adds a MetaData per bind (e.g. shards) to the shared db
+    # object; left there, the next app's create_all() looks for those binds.
+    for key in [k for k in db.metadatas if k is not None]:
+        del db.metadatas[key]
+
+
+
+@pytest.fixture(autouse=True)
+def _forget_catalog():
+    yield
+    # The snapshots are per process and keyed by version only, which every
+    # fresh test database starts at.
+    from backend.quest_engine import catalog
+    from backend.quiz import bank
+
+    catalog._snapshot = None
+    bank._bank = None
+
+
+@pytest.fixture(autouse=True)
+def _forget_rate_limits():
+    yield
+    # Buckets are per process too, and user ids restart at 1 in every test.
+    from backend import ratelimit
+
+    ratelimit._store_pid = None
+    ratelimit._denied_until.clear()
+
+
+@pytest.fixture
+def make_app(tmp_path):
+    def make(blueprints=None, **config):
+        settings = {
+            "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path}/test.db",
+            "TESTING": True,
+            "UPLOAD_FOLDER": str(tmp_path / "uploads"),
+            "RATE_LIMIT_STORAGE": "memory",
+            "DOC_INDEX_FILE": str(tmp_path / "doc_index.bin"),
+        }
+        settings.update(config)
+        app = create_app(settings, blueprints)
+        with app.app_context():
+            init_db()
+        return app
+    return make
+
+
+@pytest.fixture
+def app(make_app):
+    return make_app()
+
+
+@pytest.fixture
+def login():
+    def login(app, username="user"):
+        """A test client logged in as a new user ``username``."""
+        client = app.test_client()
+        assert client.post("/register", data={"username": username, "password": "pw"}).status_code == 302
+        assert client.post("/login", data={"username": username, "password": "pw"}).status_code == 302
+        return client
+    return login
+
+
+@pytest.fixture
+def client(app, login):
+    return login(app)
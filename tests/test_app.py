@@ -0,0 +1,28 @@
+# tests/test_app.py
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_blueprint_subset(make_app):
+    app = make_app(blueprints=["auth"])
+    assert set(app.blueprints) == {"auth"}
+    assert app.test_client().get("/tasks").status_code == 404
+    assert app.test_client().get("/login").status_code == 200
+
+
+def test_create_app_leaves_requests_unimported():
+    code = ("import sys; from backend import create_app; "
+            "create_app({'SQLALCHEMY_DATABASE_URI': 'sqlite://'}); print('requests' in sys.modules)")
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
+
+
+def test_init_db_command(make_app, tmp_path):
+    app = make_app(SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path}/fresh.db")
+    with app.app_context():
+        result = app.test_cli_runner().invoke(args=["init-db"])
+    assert result.exit_code == 0, result.output
+    assert "up to date" in result.output
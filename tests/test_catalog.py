@@ -0,0 +1,48 @@
+# tests/test_catalog.py
+from backend.extensions import db
+from backend.models import QuestTemplate
+from backend.quest_engine import get_catalog, get_pools, invalidate_catalog, sync_templates
+from backend.quest_engine.catalog import bump_version
+
+EXTRA = {"title": "Cold shower", "category": "Physical", "type": "daily", "difficulty": "Hard", "xp": 30}
+
+
+def test_snapshot_reloads_when_the_version_moves(make_app):
+    app = make_app(QUEST_CATALOG_TTL=3600)
+    with app.app_context():
+        invalidate_catalog()
+        before = get_catalog()
+        db.session.add(QuestTemplate(pool="daily", title=EXTRA["title"], category="Physical", type="daily",
+                                     difficulty="Hard", xp=30, active=True))
+        bump_version()
+        db.session.commit()
+        # Within the TTL the worker keeps its snapshot without asking.
+        assert get_catalog() is before
+        invalidate_catalog()
+        after = get_catalog()
+        assert after.version == before.version + 1
+        assert after.find("daily", EXTRA["title"]) is not None
+        # Same version: the snapshot is reused, not rebuilt.
+        invalidate_catalog()
+        assert get_catalog() is after
+
+
+def test_sync_templates_bumps_only_on_change(app):
+    with app.app_context():
+        pools = get_pools()
+        version = get_catalog().version
+        assert sync_templates(pools) == (0, 0, 0)
+        assert get_catalog().version == version
+        assert sync_templates(dict(pools, daily=list(pools["daily"]) + [EXTRA])) == (1, 0, 0)
+        assert get_catalog().version == version + 1
+
+
+def test_pruned_templates_stay_resolvable(app):
+    with app.app_context():
+        pools = get_pools()
+        sync_templates(dict(pools, daily=list(pools["daily"]) + [EXTRA]))
+        entry = get_catalog().find("daily", EXTRA["title"])
+        assert sync_templates(pools, prune=True)[2] == 1
+        catalog = get_catalog()
+        assert catalog.find("daily", EXTRA["title"]) is None
+        assert catalog.templates[entry.id].title == EXTRA["title"]
@@ -0,0 +1,93 @@
+# tests/test_datatransfer.py
+import json
+
+import pytest
+
+
+@pytest.fixture
+def sharded_app(make_app, tmp_path):
+    return make_app(SHARDS={f"s{i}": f"sqlite:///{tmp_path}/shard{i}.db" for i in range(2)})
+
+
+def _quest_records(lines):
+    return [r for r in map(json.loads, lines) if r["_table"] == "quest"]
+
+
+def test_export_with_sharding_carries_template_keys(sharded_app, login):
+    client = login(sharded_app)
+    assert client.get("/quests").status_code == 200
+    response = client.get("/export")
+    assert response.status_code == 200
+    quests = _quest_records(response.get_data(as_text=True).splitlines())
+    assert quests and all(q["template_title"] and q["template_pool"] for q in quests)
+
+
+def test_export_command_with_sharding(sharded_app, login):
+    login(sharded_app, "a").get("/quests")
+    login(sharded_app, "b").get("/quests")
+    with sharded_app.app_context():
+        result = sharded_app.test_cli_runner().invoke(args=["export-data", "--table", "quest"])
+    assert result.exit_code == 0, result.output
+    quests = _quest_records(result.output.splitlines())
+    assert {q["user_id"] for q in quests} == {1, 2}
+    assert all(q["template_title"] for q in quests)
+
+
+def _import(app, path, *args):
+    with app.app_context():
+        return app.test_cli_runner().invoke(args=["import-data", str(path), *args])
+
+
+def _recurring_export(app, login):
+    source = login(app, "a")
+    source.post("/add_task", data={"title": "Water plants", "time": "2026-01-05T08:00", "repeat": "daily"})
+    task_id = source.get("/latest_task").get_json()["id"]
+    for day in ("2026-01-05", "2026-01-06"):
+        response = source.post(f"/complete_task/{task_id}", json={"occurs_at": f"{day}T08:00:00"})
+        assert response.get_json()["success"]
+    source.post(f"/modify_task/{task_id}", json={"title": "Water ferns", "occurs_at": "2026-01-07T08:00:00"})
+    return source.get("/export").get_data(as_text=True)
+
+
+def test_round_trip_keeps_task_occurrences(app, login, tmp_path):
+    path = tmp_path / "export.ndjson"
+    path.write_text(_recurring_export(app, login))
+    target = login(app, "b")
+    # Shift b's ids so a's task ids would point at the wrong task.
+    target.post("/add_task", data={"title": "Unrelated"})
+    result = _import(app, path, "--user-id", "2")
+    assert result.exit_code == 0, result.output
+    assert "task_occurrence: 3 rows" in result.output
+
+    records = [json.loads(line) for line in target.get("/export").get_data(as_text=True).splitlines()]
+    task = next(r for r in records if r["_table"] == "task" and r["title"] == "Water plants")
+    occurrences = [r for r in records if r["_table"] == "task_occurrence"]
+    assert len(occurrences) == 3
+    assert {r["task_id"] for r in occurrences} == {task["id"]}
+    assert sum(1 for r in occurrences if r["completed_at"]) == 2
+    assert any(r["title"] == "Water ferns" for r in occurrences)
+
+
+def test_import_recomputes_next_occurrence(app, login, tmp_path):
+    records = [json.loads(line) for line in _recurring_export(app, login).splitlines()]
+    for record in records:
+        record.pop("next_occurrence", None)
+    path = tmp_path / "export.ndjson"
+    path.write_text("".join(json.dumps(r) + "\n" for r in records))
+    target = login(app, "b")
+    assert _import(app, path, "--user-id", "2").exit_code == 0
+    task = target.get("/tasks_list").get_json()[0]
+    assert task["next_occurrence"].startswith("2026-01-07T08:00")
+
+
+def test_import_rejects_occurrence_without_its_task(app, client, tmp_path):
+    path = tmp_path / "orphan.ndjson"
+    path.write_text(json.dumps({"_table": "task_occurrence", "task_id": 1, "occurs_at": "2026-01-05T08:00:00"}))
+    result = _import(app, path, "--user-id", "1")
+    assert result.exit_code != 0
+    assert "not in the import" in result.output
+
+
+def test_users_cannot_import_into_their_account(client):
+    body = json.dumps({"_table": "task", "title": "Done", "completed": True})
+    assert client.post("/import", data=body, content_type="application/x-ndjson").status_code in (404, 405)
@@ -0,0 +1,56 @@
+# tests/test_derived_quests.py
+from datetime import datetime, timedelta
+
+import pytest
+
+from backend.extensions import db
+from backend.models import Quest, QuestCompletion
+from backend.quest_engine import PERIODS, complete_derived_quest, get_derived_quests, migrate_stored_quests
+
+NOW = datetime(2026, 3, 11, 9)
+
+
+@pytest.fixture
+def derived_app(make_app):
+    return make_app(QUEST_MODE="derived")
+
+
+def test_quests_are_computed_without_writes(derived_app, login):
+    client = login(derived_app)
+    assert client.get("/quests").status_code == 200
+    quests = client.get("/get_user_quests").get_json()
+    assert len(quests) == sum(period["count"] for period in PERIODS.values())
+    assert client.get("/get_user_quests").get_json() == quests
+    with derived_app.app_context():
+        assert Quest.query.count() == 0
+
+
+def test_set_is_stable_within_a_period_and_rolls_over(derived_app, login):
+    login(derived_app)
+    with derived_app.app_context():
+        today = get_derived_quests(1, "daily", now=NOW)
+        assert get_derived_quests(1, "daily", now=NOW + timedelta(hours=10)) == today
+        later = [get_derived_quests(1, "daily", now=NOW + timedelta(days=d)) for d in range(1, 4)]
+        assert any(quests != today for quests in later)
+
+
+def test_completion_counts_once_per_period(derived_app, login):
+    login(derived_app)
+    with derived_app.app_context():
+        quest = get_derived_quests(1, "daily", now=NOW)[0]
+        ok, result = complete_derived_quest(1, quest["id"], now=NOW)
+        assert ok and result["points"] == quest["xp"]
+        assert complete_derived_quest(1, quest["id"], now=NOW + timedelta(hours=1)) == (False, "Quest already completed")
+        assert get_derived_quests(1, "daily", now=NOW)[0]["completed"]
+        assert complete_derived_quest(1, "daily-999999", now=NOW)[0] is False
+
+
+def test_migrate_stored_quests(app, client):
+    client.get("/quests")
+    quest = client.get("/get_user_quests").get_json()[0]
+    client.post("/complete_quest", json={"quest_id": quest["id"]})
+    with app.app_context():
+        assert migrate_stored_quests(delete=True) == 1
+        assert migrate_stored_quests() == 0
+        assert QuestCompletion.query.count() == 1
+        assert db.session.query(Quest).count() == 0
@@ -0,0 +1,40 @@
+# tests/test_docindex.py
+import logging
+import sys
+
+from backend import docindex
+
+
+def _docs(tmp_path):
+    source = tmp_path / "docs"
+    source.mkdir()
+    (source / "quests.md").write_text("Daily quests reset every day.\n\nWeekly quests reset every Monday.")
+    (source / "tasks.txt").write_text("Recurring tasks repeat on a schedule.")
+    (source / "manual.pdf").write_bytes(b"%PDF-1.4\n")
+    return source
+
+
+def test_build_skips_pdfs_without_pypdf(app, tmp_path, monkeypatch, caplog):
+    monkeypatch.setitem(sys.modules, "pypdf", None)  # import pypdf -> ImportError
+    with app.app_context(), caplog.at_level(logging.WARNING):
+        stats = docindex.build(_docs(tmp_path), app.config["DOC_INDEX_FILE"])
+    assert stats["sources"] == ["quests.md", "tasks.txt"]
+    assert stats["skipped"] == ["manual.pdf"]
+    assert "Not indexing manual.pdf: pypdf is not installed" in caplog.text
+
+
+def test_cli_reports_skipped_pdfs(app, tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "pypdf", None)
+    with app.app_context():
+        result = app.test_cli_runner().invoke(args=["build-doc-index", "--source", str(_docs(tmp_path))])
+    assert result.exit_code == 0
+    assert "Skipped (install pypdf to index PDFs): manual.pdf" in result.output
+
+
+def test_built_index_answers_queries(app, tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "pypdf", None)
+    with app.app_context():
+        docindex.build(_docs(tmp_path), app.config["DOC_INDEX_FILE"])
+        hits = docindex.DocIndex(app.config["DOC_INDEX_FILE"]).search("weekly quests")
+    assert hits[0].source == "quests.md"
+    assert "Weekly quests reset every Monday." in hits[0].text
@@ -0,0 +1,47 @@
+# tests/test_fastjson.py
+from datetime import date, datetime
+
+import pytest
+
+from backend import fastjson
+
+needs_orjson = pytest.mark.skipif("orjson" not in fastjson.ENCODERS, reason="orjson is not installed")
+
+SAMPLE = {
+    "id": 7,
+    "title": "Café — “quoted” \\ <b>",
+    "completed": False,
+    "alarm_time": None,
+    "xp": 12.5,
+    "created_at": datetime(2025, 9, 9, 20, 0, 0, 123456),
+    "day": date(2025, 9, 9),
+    "history": {3: [1, 2, 3]},
+    "tags": ["a", {"nested": True}],
+}
+
+
+@needs_orjson
+def test_encoders_agree():
+    assert fastjson.ENCODERS["json"](SAMPLE) == fastjson.ENCODERS["orjson"](SAMPLE)
+
+
+@needs_orjson
+def test_responses_agree_across_encoders(make_app, login, tmp_path):
+    bodies = []
+    for name in ("json", "orjson"):
+        app = make_app(JSON_ENCODER=name, SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path}/{name}.db")
+        client = login(app)
+        assert client.post("/add_task", data={"title": "Stretch", "alarm_time": "2025-09-09T20:00"}).status_code == 302
+        bodies.append(client.get("/tasks_list").data)
+    assert bodies[0] == bodies[1]
+
+
+def test_dates_without_microseconds(app):
+    with app.app_context():
+        assert fastjson.dumps({"at": datetime(2025, 9, 9, 20, 0, 0, 5)}) == b'{"at":"2025-09-09T20:00:00"}'
+
+
+def test_unknown_encoder(make_app):
+    app = make_app(JSON_ENCODER="simdjson")
+    with app.app_context(), pytest.raises(RuntimeError):
+        fastjson.dumps([])
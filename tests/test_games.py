@@ -0,0 +1,75 @@
+# tests/test_games.py
+import pytest
+
+from backend import game_sessions
+
+
+@pytest.mark.parametrize("path", ["/update_score", "/spinwheel/complete"])
+def test_client_scored_routes_are_gone(client, path):
+    assert client.post(path, json={"score": 1000}).status_code == 404
+
+
+def test_sync_cannot_award_arbitrary_scores(client):
+    response = client.post("/sync", json={"operations": [
+        {"key": "k", "type": "update_score", "args": {"score": 1000}},
+    ]}).json
+    assert response["results"][0]["success"] is False
+    assert response["points"] == 0
+
+
+def _later(monkeypatch, seconds):
+    """Move the game clock ``seconds`` ahead, as if the player took that long."""
+    now = game_sessions._now_ms
+    monkeypatch.setattr(game_sessions, "_now_ms", lambda: now() + seconds * 1000)
+
+
+def test_spinwheel_awards_xp_through_its_session(client, monkeypatch):
+    token = client.post("/game/start", json={"game": "spinwheel"}).json["token"]
+    _later(monkeypatch, 20)
+    response = client.post("/game/finish", json={
+        "token": token, "result": {"status": "completed", "challenge": "10 push-ups"},
+    }).json
+    assert (response["xp"], response["points"]) == (10, 10)
+    again = client.post("/game/finish", json={"token": token, "result": {"status": "completed", "challenge": "x"}})
+    assert again.status_code == 409
+
+
+def test_quiz_session_cannot_be_scored_with_a_reported_result(client):
+    token = client.get("/quiz/set").json["token"]
+    response = client.post("/game/finish", json={"token": token, "result": {"correct": 0}})
+    assert response.status_code == 400
+    sync = client.post("/sync", json={"operations": [
+        {"key": "q", "type": "finish_game", "args": {"token": token, "result": {"correct": 0}}},
+    ]}).json
+    assert sync["results"][0]["success"] is False
+
+    graded = client.post("/quiz/answers", json={"token": token, "answers": []}).json
+    assert (graded["success"], graded["correct"], graded["xp"]) == (True, 0, 0)
+
+
+def test_spinwheel_completed_too_fast(client, monkeypatch):
+    token = client.post("/game/start", json={"game": "spinwheel"}).json["token"]
+    result = {"status": "completed", "challenge": "10 push-ups"}
+    response = client.post("/game/finish", json={"token": token, "result": result})
+    assert response.status_code == 400 and response.json["error"] == "Challenge completed too fast"
+    # Giving up early is fine, and scores nothing.
+    failed = client.post("/game/finish", json={"token": token, "result": dict(result, status="failed")}).json
+    assert (failed["success"], failed["xp"]) == (True, 0)
+
+
+def test_game_start_is_rate_limited(make_app, login):
+    app = make_app(RATE_LIMITS={"game": {"user": (2, 60)}})
+    client = login(app)
+    codes = [client.post("/game/start", json={"game": "coin"}).status_code for _ in range(3)]
+    assert codes == [200, 200, 429]
+
+
+def test_starting_past_the_cap_closes_the_oldest_session(make_app, login):
+    app = make_app(GAME_MAX_OPEN_SESSIONS=2)
+    client = login(app)
+    tokens = [client.post("/game/start", json={"game": "memory"}).json["token"] for _ in range(3)]
+    oldest = client.post("/game/finish", json={"token": tokens[0]})
+    assert oldest.status_code == 409 and "closed" in oldest.json["error"]
+    for token in tokens[1:]:
+        assert client.post("/game/finish", json={"token": token}).json["success"]
+    assert client.post("/game/finish", json={"token": tokens[1]}).status_code == 409
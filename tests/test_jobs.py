@@ -0,0 +1,67 @@
+# tests/test_jobs.py
+import pytest
+
+from backend import jobs
+from backend.extensions import db
+from backend.models import Job
+
+ran = []
+
+
+@jobs.job("tests.record")
+def record(value):
+    ran.append(value)
+
+
+@jobs.job("tests.flaky", max_attempts=2)
+def flaky():
+    raise RuntimeError("boom")
+
+
+@pytest.fixture
+def job_app(make_app):
+    ran.clear()
+    return make_app(JOB_BACKOFF_BASE=0)
+
+
+def test_jobs_run_by_priority_after_commit(job_app):
+    with job_app.app_context():
+        record.apply(("low",), priority=5)
+        record.delay("high")
+        db.session.rollback()
+        assert jobs.work(burst=True) == 0
+
+        record.apply(("low",), priority=5)
+        record.delay("high")
+        record.map([("a",), ("b",)])
+        db.session.commit()
+        assert jobs.work(burst=True) == 4
+        assert ran == ["high", "a", "b", "low"]
+        assert jobs.stats() == {"done": 4}
+
+
+def test_keys_dedupe_until_the_job_fails(job_app):
+    with job_app.app_context():
+        assert record.apply(("once",), key="k")
+        assert not record.apply(("twice",), key="k")
+        assert flaky.apply(key="f")
+        db.session.commit()
+        jobs.work(burst=True)
+        assert ran == ["once"]
+        failed = Job.query.filter_by(key="f").one()
+        assert (failed.status, failed.attempts) == ("failed", 2)
+        assert "RuntimeError: boom" in failed.last_error
+        # A failed key can be queued again; a done one cannot.
+        assert flaky.apply(key="f") and not record.apply(("again",), key="k")
+
+
+def test_expired_lease_is_claimed_again(job_app):
+    with job_app.app_context():
+        record.delay("late")
+        db.session.commit()
+        assert [row.name for row in jobs._claim("dead-worker", 10)] == ["tests.record"]
+        assert jobs.work(burst=True) == 0
+        db.session.execute(Job.__table__.update().values(available_at=0))
+        db.session.commit()
+        assert jobs.work("live-worker", burst=True) == 1
+        assert ran == ["late"]
@@ -0,0 +1,18 @@
+# tests/test_passwords.py
+import pytest
+from werkzeug.security import generate_password_hash
+
+from backend import passwords
+
+
+@pytest.mark.parametrize("method", ["scrypt", "scrypt:16384:8:1", "pbkdf2", "pbkdf2:sha512", "pbkdf2:sha256:1000"])
+def test_prefix_matches_what_werkzeug_writes(method):
+    assert passwords._prefix(method) == generate_password_hash("pw", method).split("$", 1)[0]
+
+
+def test_verify_flags_hashes_made_with_other_parameters(app):
+    with app.app_context():
+        old = generate_password_hash("pw", "pbkdf2:sha256:1000")
+        ok, new_hash = passwords.verify(old, "pw")
+        assert ok and new_hash.startswith("scrypt:")
+        assert passwords.verify(new_hash, "pw") == (True, None)
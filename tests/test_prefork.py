@@ -0,0 +1,58 @@
+# tests/test_prefork.py
+import gc
+import os
+import random
+
+import pytest
+
+from backend import create_app, prefork
+
+
+@pytest.fixture
+def unfreeze():
+    yield
+    gc.unfreeze()
+
+
+def test_preload_warms_the_app(make_app, unfreeze):
+    app = make_app(PRELOAD_MODULES=("backend.docindex", "no_such_module"))
+    summary = prefork.preload(app)
+    assert summary["modules"] == ["backend.docindex"]
+    assert summary["missing_modules"] == ["no_such_module"]
+    assert summary["templates"] == len(app.jinja_env.list_templates(extensions=("html",)))
+    assert summary["failed_templates"] == []
+    assert summary["catalogs"] == ["quest pools", "quest catalog", "quiz bank"]
+    assert summary["frozen_objects"] > 0
+    assert "Preload modules not installed: no_such_module" in prefork.summary_lines(summary)
+
+
+def test_preload_before_init_db(tmp_path, unfreeze):
+    app = create_app({"SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path}/empty.db", "TESTING": True,
+                      "RATE_LIMIT_STORAGE": "memory", "PRELOAD_MODULES": ()})
+    assert prefork.preload(app)["catalogs"] == ["quest pools"]
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+def test_worker_after_fork_serves_requests(make_app, login, unfreeze):
+    app = make_app(PRELOAD_MODULES=())
+    prefork.preload(app)
+    pid = os.fork()
+    if pid == 0:
+        code = 1
+        try:
+            prefork.after_fork(app)
+            client = login(app, "worker")
+            code = 0 if client.post("/add_task", data={"title": "Stretch"}).status_code == 302 else 1
+        finally:
+            os._exit(code)
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+    # The master's own connections still work after the child used its own.
+    assert login(app, "master").get("/tasks_list").get_json() == []
+
+
+def test_after_fork_reseeds_random(app):
+    random.seed(1)
+    state = random.getstate()
+    prefork.after_fork(app)
+    assert random.getstate() != state
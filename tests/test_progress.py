@@ -0,0 +1,67 @@
+# tests/test_progress.py
+import struct
+import threading
+from datetime import datetime
+
+from sqlalchemy import select
+
+from backend.extensions import db
+from backend.models import ProgressEvent, User, XpHistory
+from backend.progress_engine import emit, load_state
+from backend.progress_engine import history as xp_history
+
+DAY = datetime(2026, 3, 14, 12)
+
+
+def test_concurrent_emits_get_distinct_seqs(app, client):
+    errors = []
+
+    def award(times):
+        with app.app_context():
+            try:
+                for _ in range(times):
+                    emit(db.session.get(User, 1), "study", xp=1, value=5)
+                    db.session.commit()
+            except Exception as e:
+                errors.append(e)
+
+    threads = [threading.Thread(target=award, args=(25,)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    with app.app_context():
+        seqs = db.session.execute(select(ProgressEvent.seq).where(ProgressEvent.user_id == 1)).scalars().all()
+        assert sorted(seqs) == list(range(1, 101))
+        assert load_state(1)["study_minutes"] == 500
+
+
+def test_xp_history_past_int32(app, client):
+    with app.app_context():
+        xp_history.record(1, DAY, 2**31 - 1)
+        xp_history.record(1, DAY, 2**31 - 1)
+        db.session.commit()
+        chart = xp_history.series(1, "7d", today=DAY.date())
+        assert chart["xp"][-1] == chart["total"] == 2**32 - 2
+
+
+def test_xp_history_ignores_negative_xp(app, client):
+    with app.app_context():
+        xp_history.record(1, DAY, 5)
+        xp_history.record(1, DAY, -50)
+        db.session.commit()
+        assert xp_history.series(1, "7d", today=DAY.date())["xp"][-1] == 5
+        assert db.session.get(XpHistory, (1, 202603)).total == 5
+
+
+def test_xp_history_widens_int32_rows(app, client):
+    with app.app_context():
+        slots = [0] * 31
+        slots[DAY.day - 1] = 7
+        db.session.add(XpHistory(user_id=1, month=202603, days=struct.pack("<31i", *slots), total=7))
+        db.session.commit()
+        assert xp_history.series(1, "7d", today=DAY.date())["xp"][-1] == 7
+        xp_history.record(1, DAY, 2**31)
+        db.session.commit()
+        assert xp_history.series(1, "7d", today=DAY.date())["xp"][-1] == 2**31 + 7
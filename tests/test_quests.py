@@ -0,0 +1,48 @@
+# tests/test_quests.py
+import json
+
+from backend.quest_engine import PERIODS, FilePoolSource, load_pool_source
+
+
+def _quests(client):
+    client.get("/quests")
+    return client.get("/get_user_quests").get_json()
+
+
+def test_generation_fills_each_period_once(client):
+    quests = _quests(client)
+    # Counted per pool: the built-in daily pool also holds some weekly quests.
+    assert len(quests) == sum(period["count"] for period in PERIODS.values())
+    assert client.get("/regenerate_quests").get_json()["success"]
+    assert {q["id"] for q in _quests(client)} == {q["id"] for q in quests}
+
+
+def test_completing_a_quest_awards_once(client):
+    quest = _quests(client)[0]
+    first = client.post("/complete_quest", json={"quest_id": quest["id"]}).get_json()
+    assert first["success"] and first["points"] == quest["xp"]
+    again = client.post("/complete_quest", json={"quest_id": quest["id"]})
+    assert again.status_code == 400 and again.get_json()["error"] == "Quest already completed"
+    assert next(q for q in _quests(client) if q["id"] == quest["id"])["completed"]
+
+
+def test_dashboard_snapshot_does_not_regenerate(client):
+    assert client.get("/dashboard_snapshot?fields=quests").get_json() == {"quests": []}
+    quests = _quests(client)
+    assert client.get("/dashboard_snapshot?fields=quests").get_json()["quests"] == quests
+
+
+def test_quest_of_another_user(app, client, login):
+    quest = _quests(client)[0]
+    other = login(app, "other")
+    response = other.post("/complete_quest", json={"quest_id": quest["id"]})
+    assert response.status_code == 400
+
+
+def test_file_pool_source(tmp_path):
+    pools = {"daily": [{"title": "Stretch", "category": "Physical", "type": "daily", "difficulty": "Easy", "xp": 5}]}
+    path = tmp_path / "pools.json"
+    path.write_text(json.dumps(pools))
+    source = load_pool_source(f"file:{path}")
+    assert isinstance(source, FilePoolSource)
+    assert source.load() == pools
@@ -0,0 +1,18 @@
+# tests/test_ratelimit.py
+def _ask(client, addr):
+    return client.post("/ask", json={}, headers={"X-Forwarded-For": addr}).status_code
+
+
+def test_ip_buckets_follow_the_forwarded_address(make_app):
+    app = make_app(TRUSTED_PROXIES=1, RATE_LIMITS={"ask": {"ip": (1, 60)}})
+    client = app.test_client()
+    assert _ask(client, "203.0.113.1") != 429
+    assert _ask(client, "203.0.113.1") == 429
+    assert _ask(client, "203.0.113.2") != 429
+
+
+def test_forwarded_address_is_ignored_without_trusted_proxies(make_app):
+    app = make_app(RATE_LIMITS={"ask": {"ip": (1, 60)}})
+    client = app.test_client()
+    assert _ask(client, "203.0.113.1") != 429
+    assert _ask(client, "203.0.113.2") == 429
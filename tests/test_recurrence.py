@@ -0,0 +1,73 @@
+# tests/test_recurrence.py
+from backend.progress import activity_counts
+from backend.retention import run_retention
+
+
+def _add_daily(client, title="Stretch", time="2030-01-01T08:00"):
+    assert client.post("/add_task", data={"title": title, "time": time, "repeat": "daily"}).status_code == 302
+    return client.get("/latest_task").get_json()["id"]
+
+
+def _alarms(client, now, minutes=60):
+    return client.get(f"/task_alarms?now={now}&minutes={minutes}").get_json()
+
+
+def test_alarm_rings_for_the_next_occurrence(client):
+    task_id = _add_daily(client)
+    alarms = _alarms(client, "2030-01-01T07:30:00")
+    assert alarms == [{"id": task_id, "title": "Stretch", "occurs_at": "2030-01-01T08:00:00",
+                       "alarm_time": "2030-01-01T08:00:00", "recurring": True}]
+
+
+def test_moved_occurrence_rings_at_its_new_time(client):
+    task_id = _add_daily(client)
+    assert client.post(f"/modify_task/{task_id}", json={
+        "title": "Long stretch", "occurs_at": "2030-01-01T08:00", "alarm_time": "2030-01-01T18:00",
+    }).get_json()["success"]
+    assert _alarms(client, "2030-01-01T07:30:00") == []
+    alarms = _alarms(client, "2030-01-01T17:30:00")
+    assert [(a["title"], a["occurs_at"], a["alarm_time"]) for a in alarms] == [
+        ("Long stretch", "2030-01-01T08:00:00", "2030-01-01T18:00:00"),
+    ]
+
+
+def test_renamed_occurrence_keeps_its_time(client):
+    task_id = _add_daily(client)
+    client.post(f"/modify_task/{task_id}", json={"title": "Yoga", "occurs_at": "2030-01-02T08:00"})
+    assert [a["title"] for a in _alarms(client, "2030-01-01T07:30:00")] == ["Stretch"]
+    client.post(f"/complete_task/{task_id}")
+    assert [a["title"] for a in _alarms(client, "2030-01-02T07:30:00")] == ["Yoga"]
+
+
+def test_completed_occurrence_does_not_ring(client):
+    task_id = _add_daily(client)
+    client.post(f"/modify_task/{task_id}", json={
+        "title": "Stretch", "occurs_at": "2030-01-02T08:00", "alarm_time": "2030-01-01T09:00",
+    })
+    assert len(_alarms(client, "2030-01-01T07:30:00", minutes=120)) == 2
+    assert client.post(f"/complete_task/{task_id}", json={"occurs_at": "2030-01-02T08:00"}).get_json()["success"]
+    assert [a["occurs_at"] for a in _alarms(client, "2030-01-01T07:30:00", minutes=120)] == ["2030-01-01T08:00:00"]
+
+
+def test_occurrence_completions_count_as_tasks(app, client):
+    task_id = _add_daily(client)
+    client.post("/add_task", data={"title": "One-off"})
+    client.post(f"/complete_task/{client.get('/latest_task').get_json()['id']}")
+    for day in ("01", "02", "03"):
+        assert client.post(f"/complete_task/{task_id}", json={"occurs_at": f"2030-01-{day}T08:00"}).get_json()["success"]
+    with app.app_context():
+        assert activity_counts(1)["tasks"] == 4
+    assert client.get("/dashboard_snapshot?fields=stats").get_json()["stats"]["completed"]["tasks"] == 4
+
+
+def test_finished_series_compacts_to_its_completions(app, client):
+    assert client.post("/add_task", data={
+        "title": "Course", "time": "2030-01-01T08:00", "repeat": "custom", "rrule": "FREQ=DAILY;COUNT=3",
+    }).status_code == 302
+    task_id = client.get("/tasks_list").get_json()[0]["id"]
+    for _ in range(3):
+        client.post(f"/complete_task/{task_id}")
+    with app.app_context():
+        assert activity_counts(1)["tasks"] == 3
+        assert run_retention({"task": {"days": -1}}, pause=0) == {"task": 1}
+        assert activity_counts(1)["tasks"] == 3
@@ -0,0 +1,45 @@
+# tests/test_retention.py
+from datetime import datetime, timedelta
+
+from backend.extensions import db
+from backend.models import StudyLog, SyncOperation, Task
+from backend.progress import activity_counts
+from backend.retention import optimize_database, rollup_totals, run_retention
+
+NOW = datetime(2026, 6, 1)
+OLD = NOW - timedelta(days=400)
+
+
+def _seed(user_id=1):
+    db.session.add_all([Task(user_id=user_id, title=f"Old {i}", completed=True, created_at=OLD) for i in range(5)])
+    db.session.add(Task(user_id=user_id, title="Old but open", completed=False, created_at=OLD))
+    db.session.add(Task(user_id=user_id, title="Recent", completed=True, created_at=NOW))
+    db.session.add_all([StudyLog(user_id=user_id, subject="math", duration=30, created_at=OLD) for _ in range(3)])
+    db.session.add(SyncOperation(user_id=user_id, key="k", type="add_study_log", result="{}", created_at=OLD))
+    db.session.commit()
+
+
+def test_compaction_keeps_activity_counts(app, client):
+    with app.app_context():
+        _seed()
+        before = activity_counts(1)
+        done = run_retention(batch_size=2, pause=0, now=NOW)
+        assert done["task"] == 5 and done["study_log"] == 3 and done["sync_operation"] == 1
+        assert activity_counts(1) == before
+        assert rollup_totals(1) == {"task": 5, "study_log": 3}
+        assert {t.title for t in Task.query.filter_by(user_id=1)} == {"Old but open", "Recent"}
+        assert StudyLog.query.count() == 0
+
+
+def test_max_batches_bounds_a_run(app, client):
+    with app.app_context():
+        _seed()
+        policies = {"task": {"days": 90}}
+        assert run_retention(policies, batch_size=2, max_batches=1, pause=0, now=NOW) == {"task": 2}
+        assert run_retention(policies, batch_size=2, pause=0, now=NOW) == {"task": 3}
+        assert run_retention(policies, batch_size=2, pause=0, now=NOW) == {"task": 0}
+
+
+def test_optimize_database(app):
+    with app.app_context():
+        assert optimize_database(vacuum_ratio=0)[:2] == ["ANALYZE", "VACUUM"]
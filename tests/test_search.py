@@ -0,0 +1,22 @@
+# tests/test_search.py
+def _search(client, q, **args):
+    return client.get("/search", query_string=dict(args, q=q)).get_json()
+
+
+def test_snippets_escape_the_indexed_text(client):
+    client.post("/add_task", data={"title": "<script>alert(1)</script> water plants"})
+    results = _search(client, "water")["results"]
+    assert len(results) == 1
+    snippet = results[0]["snippet"]
+    assert "<script>" not in snippet
+    assert "&lt;script&gt;alert(1)&lt;/script&gt;" in snippet
+    assert "<mark>water</mark>" in snippet
+    assert results[0]["label"] == "<script>alert(1)</script> water plants"
+
+
+def test_search_is_per_user_and_prefix(app, client, login):
+    client.post("/add_task", data={"title": "Algebra homework"})
+    client.post("/add_study_log", data={"subject": "Biology", "duration": "20", "notes": "algebraic cells"})
+    assert {r["type"] for r in _search(client, "alg")["results"]} == {"tasks", "study_logs"}
+    assert [r["type"] for r in _search(client, "alg", type="tasks")["results"]] == ["tasks"]
+    assert _search(login(app, "other"), "alg")["results"] == []
@@ -0,0 +1,61 @@
+# tests/test_sharding.py
+import pytest
+
+from backend import sharding
+from backend.extensions import db
+from backend.models import Task, User
+
+
+@pytest.fixture
+def sharded_app(make_app, tmp_path):
+    return make_app(SHARDS={name: f"sqlite:///{tmp_path}/{name}.db" for name in ("s0", "s1", "s2")})
+
+
+def _users_on_two_shards():
+    users = []
+    for i in range(20):
+        user = sharding.new_user(username=f"user{i}", password="pw")
+        db.session.commit()
+        users.append(user.id)
+    by_shard = {}
+    for user_id in users:
+        by_shard.setdefault(sharding.shard_for(user_id), user_id)
+    assert len(by_shard) >= 2
+    return list(by_shard.items())[:2]
+
+
+def test_switching_shards_with_pending_writes_raises(sharded_app):
+    with sharded_app.app_context():
+        (first, first_user), (second, _) = _users_on_two_shards()
+        sharding.use_shard(first)
+        db.session.add(Task(user_id=first_user, title="Unsaved"))
+        with pytest.raises(RuntimeError):
+            sharding.use_shard(second)
+        db.session.flush()
+        with pytest.raises(RuntimeError):
+            sharding.use_shard(second)
+        db.session.rollback()
+        sharding.use_shard(second)
+        sharding.use_shard(first)
+        assert Task.query.filter_by(user_id=first_user).count() == 0
+
+
+def test_switching_after_commit_keeps_the_writes(sharded_app):
+    with sharded_app.app_context():
+        (first, first_user), (second, _) = _users_on_two_shards()
+        sharding.use_shard(first)
+        db.session.add(Task(user_id=first_user, title="Saved"))
+        db.session.commit()
+        sharding.use_shard(second)
+        sharding.use_shard(first)
+        assert [t.title for t in Task.query.filter_by(user_id=first_user)] == ["Saved"]
+
+
+def test_new_user_lands_on_its_shard(sharded_app, login):
+    client = login(sharded_app, "alice")
+    assert client.post("/add_task", data={"title": "Stretch"}).status_code == 302
+    with sharded_app.app_context():
+        user_id = sharding.find_user("alice").id
+        with sharding.using_shard(sharding.shard_for(user_id)):
+            assert db.session.get(User, user_id).username == "alice"
+            assert Task.query.filter_by(user_id=user_id).count() == 1
@@ -0,0 +1,36 @@
+# tests/test_sync.py
+from backend.blueprints.sync import KEY_MAX_LENGTH
+
+
+def _sync(client, *operations):
+    return client.post("/sync", json={"operations": list(operations)})
+
+
+def test_retried_key_returns_stored_result(client):
+    op = {"key": "k" * KEY_MAX_LENGTH, "type": "add_study_log", "args": {"duration": 30}}
+    first = _sync(client, op).json
+    again = _sync(client, op).json
+    assert first["results"][0]["success"] and "duplicate" not in first["results"][0]
+    assert again["results"][0]["duplicate"] is True
+    assert again["points"] == first["points"]
+
+
+def test_key_over_the_limit_is_rejected_on_every_retry(client):
+    op = {"key": "k" * (KEY_MAX_LENGTH + 1), "type": "add_study_log", "args": {"duration": 30}}
+    for _ in range(2):
+        response = _sync(client, op)
+        assert response.status_code == 400
+        assert response.json["success"] is False
+    assert _sync(client).json["points"] == 0
+
+
+def test_game_results_are_not_sync_operations(client):
+    token = client.post("/game/start", json={"game": "spinwheel"}).json["token"]
+    op = {"key": "g", "type": "finish_game", "args": {"token": token, "result": {"status": "completed"}}}
+    result = _sync(client, op).json["results"][0]
+    assert result["success"] is False and "Unknown operation type" in result["error"]
+
+
+def test_pages_load_the_sync_queue(client):
+    for page in ("/tasks", "/academics", "/quests"):
+        assert b"js/sync_queue.js" in client.get(page).data, page
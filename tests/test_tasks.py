@@ -0,0 +1,24 @@
+# tests/test_tasks.py
+def _add_task(client, title="Stretch", **form):
+    assert client.post("/add_task", data=dict(form, title=title)).status_code == 302
+    return client.get("/latest_task").get_json()["id"]
+
+
+def test_modify_task_needs_login(app, client):
+    task_id = _add_task(client)
+    response = app.test_client().post(f"/modify_task/{task_id}", json={"title": "Renamed"})
+    assert response.status_code in (302, 401)
+
+
+def test_modify_task_of_another_user(app, client, login):
+    task_id = _add_task(client)
+    other = login(app, "other")
+    response = other.post(f"/modify_task/{task_id}", json={"title": "Mine now"})
+    assert response.status_code == 404
+    assert client.get("/latest_task").get_json()["title"] == "Stretch"
+
+
+def test_modify_own_task(client):
+    task_id = _add_task(client)
+    assert client.post(f"/modify_task/{task_id}", json={"title": "Renamed"}).get_json()["success"]
+    assert client.get("/latest_task").get_json()["title"] == "Renamed"
@@ -0,0 +1,30 @@
+# tests/test_tts.py
+from backend import tts
+from backend.extensions import db
+from backend.models import Job
+
+
+def test_failed_synthesis_job_is_queued_again(make_app, tmp_path):
+    app = make_app(TTS_BACKEND="stub", TTS_CACHE_DIR=str(tmp_path / "tts"))
+    with app.app_context():
+        assert tts.audio_key("hello there") is None
+        db.session.commit()
+        job = db.session.execute(db.select(Job)).scalar_one()
+        job.status, job.attempts, job.last_error = "failed", 3, "provider down"
+        db.session.commit()
+
+        assert tts.audio_key("hello there") is None
+        db.session.commit()
+        db.session.refresh(job)
+        assert (job.status, job.attempts, job.last_error) == ("queued", 0, None)
+
+        # A queued or finished job is not duplicated.
+        assert tts.audio_key("hello there") is None
+        assert db.session.execute(db.select(db.func.count()).select_from(Job)).scalar() == 1
+
+
+def test_tts_is_rate_limited(make_app, login, tmp_path):
+    app = make_app(TTS_BACKEND="stub", TTS_CACHE_DIR=str(tmp_path / "tts"),
+                   RATE_LIMITS={"tts": {"user": (2, 60), "ip": (10, 60)}})
+    client = login(app)
+    assert [client.get("/tts?text=hi").status_code for _ in range(3)] == [302, 302, 429]
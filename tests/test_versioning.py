@@ -0,0 +1,37 @@
+# tests/test_versioning.py
+def _get(client, url, etag=None):
+    return client.get(url, headers={"If-None-Match": etag} if etag else {})
+
+
+def test_unchanged_list_returns_304(client):
+    first = _get(client, "/tasks_list")
+    assert first.status_code == 200 and first.headers["ETag"].startswith("W/")
+    assert first.headers["Cache-Control"] == "private, no-cache"
+    again = _get(client, "/tasks_list", first.headers["ETag"])
+    assert again.status_code == 304 and again.data == b""
+    assert again.headers["ETag"] == first.headers["ETag"]
+
+
+def test_write_changes_the_etag(client):
+    etag = _get(client, "/tasks_list").headers["ETag"]
+    client.post("/add_task", data={"title": "Stretch"})
+    response = _get(client, "/tasks_list", etag)
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert [t["title"] for t in response.get_json()] == ["Stretch"]
+
+
+def test_etags_are_per_user_and_collection(app, client, login):
+    etag = _get(client, "/tasks_list").headers["ETag"]
+    other = login(app, "other")
+    assert _get(other, "/tasks_list", etag).status_code == 200
+    # Another collection's write leaves the task list alone.
+    client.post("/add_study_log", data={"subject": "math", "duration": "30"})
+    assert _get(client, "/tasks_list", etag).status_code == 304
+
+
+def test_body_metrics_change_the_quest_etag(client):
+    client.get("/quests")
+    etag = _get(client, "/get_user_quests").headers["ETag"]
+    client.post("/edit-profile", data={"height_cm": "180", "weight_kg": "70"})
+    assert _get(client, "/get_user_quests", etag).status_code == 200